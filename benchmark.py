@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Datum: 17.10.2026
+# Mac OS
+"""
+Zweck: die Messung der Laufzeit und des Speicherbedarfs.
+
+Autorin: Daryna Ivanova
+"""
+
+import sys
+import json
+import argparse
+
+from src.Benchmark import Benchmark, write_report
+
+
+def main():
+    """Benchmark execution."""
+    parser = argparse.ArgumentParser(
+        description="Measure every pipeline stage on synthetic corpora.")
+    parser.add_argument("--sizes", type=str, default="1000, 10000, 100000",
+                        help="numbers of synthetic documents")
+    parser.add_argument("--doc-length", type=int, default=300,
+                        help="number of tokens per document")
+    parser.add_argument("--vocabulary", type=int, default=50000,
+                        help="number of distinct words")
+    parser.add_argument("--repeats", type=int, default=3,
+                        help="timed runs per stage, the best one counts")
+    parser.add_argument("--output", type=str, default="benchmark.json",
+                        help="json file for the results")
+    parser.add_argument("--baseline", type=str, default=None,
+                        help="json file of an earlier run to compare with")
+    parser.add_argument("--tolerance", type=float, default=1.25,
+                        help="allowed slowdown against the baseline")
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(',')]
+    benchmark = Benchmark(args.doc_length, args.vocabulary, args.repeats)
+    report = benchmark.run(sizes)
+    write_report(report, args.output)
+
+    for record in report['results']:
+        if record['status'] == 'ok':
+            print("%-22s %8d docs %10.4f s %12d bytes" % (
+                record['stage'], record['size'], record['seconds'],
+                record['peak_bytes']))
+        else:
+            print("%-22s %8d docs skipped: %s" % (
+                record['stage'], record['size'], record['reason']))
+    print("\n", "Results are written to " + args.output)
+
+    if args.baseline is not None:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+
+        rows = benchmark.compare(report, baseline, args.tolerance)
+        print("\n", "Comparison with " + args.baseline)
+        for stage, size, time_ratio, memory_ratio, regressed in rows:
+            print("%-22s %8d docs time x%.2f memory x%.2f%s" % (
+                stage, size, time_ratio, memory_ratio,
+                "  REGRESSION" if regressed else ""))
+
+        if any(row[4] for row in rows):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
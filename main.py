@@ -9,12 +9,10 @@ Autorin: Daryna Ivanova
 """
 
 from datetime import datetime
-from src.CandidateSelection import CandidateSelection
-from src.DomainRelevance import DomainRelevance
-from src.DomainConsensus import DomainConsensus
-from src.TermDecision import TermDecision
 from src.ConsoleParser import ConsoleParser
-from src.TermsEvaluation import TermsEvaluation
+
+# Stage modules (numpy, NLTK) are imported after the arguments are parsed,
+# so that --help and argument errors return at once.
 
 
 def main():
@@ -26,62 +24,411 @@ def main():
     parser = ConsoleParser()
     texts, alphas, thetas, goldstandard_file = parser.parse()
 
-    # Domain corpus candidates, frequency distribution
-    candidates_total, candidates_per_doc, candidates = CandidateSelection().\
-        text_files_getter(texts, 3)
-    print("Number of candidates: ", len(candidates))
-    print("\n")
+    args = parser.args
 
-    # Reference corpus candidates, frequency distribution
-    reuters_freq, reuters_bigrams = CandidateSelection().reuters_corpus()
+    from src.CandidateSelection import CandidateSelection
+    from src.TermDecision import TermDecision
+    from src.TermsEvaluation import TermsEvaluation
+    from src.Instrumentation import Instrumentation
+    from src.ResultStore import ResultStore
+    from src.Checkpoints import Checkpoints, input_fingerprint
 
-    # Domain Relevance
-    cond_prob_domain = DomainRelevance().\
-        cond_probability(candidates, candidates_total)
+    # Time and memory of every stage
+    instrumentation = Instrumentation(args.trace_memory, args.profile_stage)
 
-    cond_prob_reference = DomainRelevance().\
-        cond_probability(reuters_bigrams, reuters_freq)
+    # Results of every stage, --resume skips stages with a valid checkpoint
+    checkpoints = Checkpoints(resume=args.resume)
 
-    domain_relevance = DomainRelevance().relevance(cond_prob_domain,
-                                                   cond_prob_reference,
-                                                   candidates)
+    # Candidates of texts, which did not change since an earlier run
+    cache = None
+    if not args.no_document_cache:
+        cache = CandidateSelection().document_cache(3)
 
-    # Compute Domain Consensus
-    domain_term_distr = DomainConsensus().term_distr(
-              candidates_total, candidates_per_doc, candidates)
+    if args.serve is not None:
+        # Answer requests until the server is interrupted
+        serve(texts, goldstandard_file, args, cache)
+        return
+
+    if args.state is not None:
+        # Persistent corpus state, only new and deleted texts are handled
+        with instrumentation.stage('state'):
+            table = updated_state_table(texts, args, cache, instrumentation)
+        # the state is its own checkpoint, the grid is computed again
+        scores_key = None
+    else:
+        table, scores_key = scored_table(texts, args, cache, instrumentation,
+                                         checkpoints)
+        if table is None:
+            # Statistics of a shard were written with --partial-out
+            return
+
+    for name, value in CandidateSelection().counters().items():
+        instrumentation.count(name, value)
+    instrumentation.count('texts', table.n_docs)
+    instrumentation.count('distinct_candidates', int(table.active.sum()))
+
+    if cache is not None:
+        print("Texts read from the document cache: ", cache.hits)
+        print("\n")
+        instrumentation.count('document_cache_hits', cache.hits)
+        cache.close()
+
+    gold_terminology = TermsEvaluation().gold_index(goldstandard_file)
+
+    # Precision/recall for every alpha-theta combination at once
+    with instrumentation.stage('grid'):
+        grid = None
+        if scores_key is not None:
+            grid_key = checkpoints.key(scores_key, alphas, thetas,
+                                       input_fingerprint(goldstandard_file))
+            grid = checkpoints.load('grid', grid_key)
+        if grid is None:
+            grid = TermDecision().table_grid(table, alphas, thetas,
+                                             gold_terminology)
+            if scores_key is not None:
+                checkpoints.store('grid', grid_key, grid)
+        precision, recall, n_terms = grid
+
+    # Final terms for each alpha-theta combination in one file
+    with instrumentation.stage('decision'):
+        ResultStore().write(table, alphas, thetas)
+        if args.text_output:
+            write_text_results(table, alphas, thetas)
+    print_scores(alphas, thetas, precision, recall, n_terms)
 
-    domain_consensus = DomainConsensus().domain_consensus(domain_term_distr,
-                                                          candidates)
+    # The k best terms of each alpha
+    if args.top_k is not None:
+        with instrumentation.stage('top_k'):
+            write_top_terms(table, alphas, args.top_k, gold_terminology)
 
-    gold_terminology = TermsEvaluation().gold_terminology(goldstandard_file)
+    # Precision/recall curve of the whole ranking for each alpha
+    with instrumentation.stage('curves'):
+        print_curves(table, alphas, gold_terminology)
+
+    now = datetime.now()
+    print("\n")
+    print("Finishing at " + str(now))
+
+    if args.report is not None:
+        instrumentation.write(args.report, arguments=vars(args))
+        print("Run report is written to " + args.report)
+
+
+def write_text_results(table: 'CandidateTable', alphas: list,
+                       thetas: list):
+    """Write final terms of every combination to its own txt file."""
+    from src.TermDecision import TermDecision
 
-    # Final terms and precision/recall for each alpha-theta combination
     for alpha in alphas:
         for theta in thetas:
-            final_terms = TermDecision().decision_function(candidates,
-                                                           domain_relevance,
-                                                           domain_consensus,
-                                                           alpha, theta)
-            # Create files with alpha/theta results
+            final_terms = TermDecision().table_decision(table, alpha, theta)
             TermDecision().outputter(alpha, theta, final_terms)
 
-            precision_recall = \
-                TermsEvaluation().precision_and_recall(final_terms,
-                                                       gold_terminology)
-            # Number of final terminology
-            l_final = len(final_terms)
+
+def write_top_terms(table: 'CandidateTable', alphas: list, k: int,
+                    gold_terminology):
+    """Write and evaluate the k best terms of every alpha."""
+    from src.TermDecision import TermDecision
+    from src.TermsEvaluation import TermsEvaluation
+
+    for alpha in alphas:
+        ranked_terms = TermDecision().table_top_terms(table, alpha, k)
+        TermDecision().top_outputter(alpha, k, ranked_terms)
+        precision, recall = TermsEvaluation().precision_and_recall(
+            dict(ranked_terms), gold_terminology)
+
+        print("For alpha = " + str(alpha) + ", the " + str(k) +
+              " best terms: precision = " + str(precision) + " recall = " +
+              str(recall))
+        print("\n")
+
+
+def print_scores(alphas: list, thetas: list, precision, recall, n_terms):
+    """Print precision, recall and number of terms of every combination."""
+    for row, alpha in enumerate(alphas):
+        for column, theta in enumerate(thetas):
             print("\n")
             print("For alpha = " + str(alpha) + ", theta = " + str(theta) +
-                  ": precision = " + str(precision_recall[0]) + " recall = " +
-                  str(precision_recall[1]))
+                  ": precision = " + str(precision[row, column]) +
+                  " recall = " + str(recall[row, column]))
 
             print("For alpha = " + str(alpha) + ", theta = " + str(theta) +
-                  " number of candidates: " + str(l_final))
+                  " number of candidates: " + str(n_terms[row, column]))
             print("\n")
 
-    now = datetime.now()
+
+def print_curves(table: 'CandidateTable', alphas: list, gold_terminology):
+    """Print average precision and the best cutoff of every alpha."""
+    from src.TermDecision import TermDecision
+    from src.TermsEvaluation import TermsEvaluation
+
+    for alpha in alphas:
+        ranked_terms = TermDecision().table_ranking(table, alpha)
+        average_precision, best_cutoff = TermsEvaluation().\
+            precision_recall_curve(ranked_terms, gold_terminology)[2:]
+
+        print("For alpha = " + str(alpha) + ": average precision = " +
+              str(average_precision) + ", best F1 = " + str(best_cutoff[1]) +
+              " with " + str(best_cutoff[0]) + " terms")
+        if best_cutoff[0] > 0:
+            print("(theta just below " +
+                  str(ranked_terms[best_cutoff[0] - 1][1]) + ")")
+        print("\n")
+
+
+def scored_table(texts: str, args, cache, instrumentation,
+                 checkpoints) -> tuple:
+    """
+    Read the corpus and compute Domain Relevance and Domain Consensus.
+
+    With --resume every stage is checkpointed, and a stage, whose
+    checkpoint matches the corpus, the NLTK data and the options, is loaded
+    instead. The reference statistics are not needed at all, if Domain
+    Relevance can be loaded, otherwise they come from their own caches.
+
+    Returns the table and a key of its scores, (None, None) if the
+    statistics of a shard were written with --partial-out.
+    """
+    from src.CandidateSelection import CandidateSelection, PIPELINE_VERSION
+    from src.DomainRelevance import DomainRelevance
+    from src.DomainConsensus import DomainConsensus
+    from src.PartialStatistics import PartialStatistics
+    from src.Checkpoints import input_fingerprint
+
+    if args.merge is not None:
+        inputs = [input_fingerprint(partial_file) for partial_file in
+                  args.merge]
+    else:
+        inputs = input_fingerprint(texts)
+
+    candidates_key = checkpoints.key(
+        PIPELINE_VERSION, CandidateSelection().data_fingerprint(), inputs, 3,
+        args.stream, args.shard, args.merge is not None, args.dedup)
+
+    # names of all texts and of skipped near-duplicates for a partial file
+    listing, skipped = [], set()
+
+    # Domain corpus candidates, frequency distribution
+    with instrumentation.stage('candidates'):
+        table = checkpoints.load('candidates', candidates_key)
+        if table is None:
+            if args.merge is not None:
+                table = PartialStatistics.merge(args.merge)
+            else:
+                table = candidate_table(texts, args, cache, listing,
+                                        skipped)
+            if args.partial_out is None:
+                # the partial file of a shard is its own checkpoint
+                checkpoints.store('candidates', candidates_key, table)
+
+    if args.partial_out is not None:
+        # Statistics of a shard, merged later with --merge
+        PartialStatistics(args.partial_out).write(table,
+                                                  args.shard or (0, 1), 3,
+                                                  listing, skipped)
+        print("Statistics of " + str(table.n_docs) +
+              " texts are written to " + args.partial_out)
+        if cache is not None:
+            cache.close()
+        return None, None
+
+    print("Number of texts: ", table.n_docs)
+    print("Number of candidates: ", len(table))
     print("\n")
-    print("Finishing at " + str(now))
+
+    reference_key = checkpoints.key(candidates_key, args.sketch_epsilon,
+                                    args.sketch_delta,
+                                    args.export_model is None)
+    relevance_key = checkpoints.key(reference_key, 'relevance')
+    relevance = checkpoints.load('relevance', relevance_key)
+
+    reference = None
+    if relevance is None or args.export_model is not None:
+        # Reference corpus candidates, frequency distribution (cached in
+        # Cache/ by ReferenceCache or as a sketch, not checkpointed)
+        with instrumentation.stage('reference'):
+            # only frequencies of domain candidates are needed, unless the
+            # model has to score candidates of new texts
+            candidates = table if args.export_model is None else None
+            reference = reference_frequencies(args, instrumentation,
+                                              candidates)
+
+        if args.export_model is not None:
+            export_model(table, reference[0], reference[1],
+                         args.export_model)
+
+    # Domain Relevance
+    with instrumentation.stage('relevance'):
+        if relevance is None:
+            reuters_freq, reuters_total = reference
+            DomainRelevance().table_relevance(table, reuters_freq,
+                                              reuters_total)
+            sketch_bounds = None
+            if not isinstance(reuters_freq, dict):
+                sketch_bounds = reuters_freq.error_bounds()
+            relevance = (table.columns['probability'],
+                         table.columns['relevance'], sketch_bounds)
+            checkpoints.store('relevance', relevance_key, relevance)
+            del reuters_freq
+        table.columns['probability'], table.columns['relevance'], \
+            sketch_bounds = relevance
+    del reference
+
+    if sketch_bounds is not None:
+        instrumentation.detail('reference_sketch', sketch_bounds)
+
+    # Compute Domain Consensus
+    consensus_key = checkpoints.key(candidates_key, 'consensus')
+    with instrumentation.stage('consensus'):
+        consensus = checkpoints.load('consensus', consensus_key)
+        if consensus is None:
+            consensus = DomainConsensus().table_consensus(table)
+            checkpoints.store('consensus', consensus_key, consensus)
+        table.columns['consensus'] = consensus
+
+    return table, checkpoints.key(relevance_key, consensus_key)
+
+
+def candidate_table(texts: str, args, cache=None, listing: list = None,
+                    skipped: set = None) -> 'CandidateTable':
+    """
+    Read the domain corpus into a CandidateTable.
+
+    In the streaming mode no per-document frequencies are kept and the
+    number of texts read at the same time follows the memory target. The
+    names of all texts are appended to listing and the names of skipped
+    near-duplicates added to skipped, if they are given.
+    """
+    from src.CandidateSelection import CandidateSelection
+    from src.CandidateTable import CandidateTable
+    from src.NearDuplicates import NearDuplicates
+
+    selection = CandidateSelection()
+
+    near_duplicates = None
+    if args.dedup is not None:
+        near_duplicates = NearDuplicates(args.dedup)
+
+    window = None
+    if args.stream and args.memory_target is not None:
+        window = selection.in_flight_window(texts,
+                                            args.memory_target * 1024 * 1024)
+
+    table = CandidateTable(keep_documents=not args.stream)
+    documents = selection.iter_document_candidates(
+        texts, 3, workers=args.workers, window=window, cache=cache,
+        shard=args.shard, near_duplicates=near_duplicates, listing=listing)
+    for doc in documents:
+        table.add_document(doc)
+
+    if near_duplicates is not None:
+        if skipped is not None:
+            skipped.update(near_duplicates.duplicates)
+        print("Near-duplicate texts skipped: ",
+              len(near_duplicates.duplicates))
+        print("\n")
+
+    return table
+
+
+def reference_frequencies(args, instrumentation=None,
+                          candidates=None) -> tuple:
+    """
+    Exact reference frequencies or, with --sketch-epsilon, a CountMinSketch.
+
+    Exact frequencies are kept only for candidates, if they are given. The
+    error bounds of a sketch are printed and added to the run report.
+    """
+    from src.CandidateSelection import CandidateSelection
+
+    if args.sketch_epsilon is None:
+        return CandidateSelection().reference_statistics(
+            candidates=candidates)
+
+    sketch, total = CandidateSelection().reference_sketch(args.sketch_epsilon,
+                                                          args.sketch_delta)
+    bounds = sketch.error_bounds()
+    memory_mb = round(bounds['memory_bytes'] / 1024 / 1024, 1)
+    print("Reference frequencies are approximated in " + str(memory_mb) +
+          " MB: at most " + str(bounds['max_overcount']) +
+          " too large with a probability of " + str(bounds['confidence']))
+    print("\n")
+
+    if instrumentation is not None:
+        instrumentation.detail('reference_sketch', bounds)
+
+    return sketch, total
+
+
+def export_model(table: 'CandidateTable', reuters_freq: dict,
+                 reuters_total: int, model_file: str):
+    """Write the statistics of the corpus for scoring single texts."""
+    from src.FrozenModel import FrozenModel
+
+    FrozenModel(model_file).export(table, reuters_freq, reuters_total, 3)
+    print("Model is written to " + model_file)
+    print("\n")
+
+
+def serve(texts: str, goldstandard_file: str, args, cache=None):
+    """
+    Load the statistics once and answer requests, see src/TermServer.py.
+
+    With --state the saved state is brought up to date first, otherwise the
+    whole corpus is read.
+    """
+    from src.CandidateSelection import CandidateSelection
+    from src.CorpusState import CorpusState
+    from src.TermsEvaluation import TermsEvaluation
+    from src.TermServer import TermServer
+
+    reuters_freq, reuters_total = reference_frequencies(args)
+
+    state = CorpusState(reuters_freq, reuters_total, args.state)
+    n_added, n_removed = state.sync(texts, workers=args.workers, cache=cache)
+    if args.state is not None:
+        state.save()
+
+    print("Texts added: ", n_added, " removed: ", n_removed)
+    print("Number of candidates: ", int(state.table.active.sum()))
+
+    server = TermServer(state, TermsEvaluation().gold_index(goldstandard_file),
+                        args.workers, cache)
+    server.warm_up()
+    try:
+        server.serve(args.serve)
+    finally:
+        if cache is not None:
+            cache.close()
+
+
+def updated_state_table(texts: str, args, cache=None,
+                        instrumentation=None) -> 'CandidateTable':
+    """
+    Bring a saved CorpusState up to date with the corpus directory.
+
+    Returns the table of the state with Domain Relevance and Domain
+    Consensus of all candidates.
+    """
+    from src.CandidateSelection import CandidateSelection
+    from src.CorpusState import CorpusState
+
+    reuters_freq, reuters_total = reference_frequencies(args, instrumentation)
+
+    state = CorpusState(reuters_freq, reuters_total, args.state)
+    n_added, n_removed = state.sync(texts, workers=args.workers, cache=cache)
+    state.save()
+
+    if args.export_model is not None:
+        export_model(state.table, reuters_freq, reuters_total,
+                     args.export_model)
+
+    print("Texts added: ", n_added, " removed: ", n_removed)
+    print("Number of texts: ", state.table.n_docs)
+    print("Number of candidates: ", int(state.table.active.sum()))
+    print("\n")
+
+    return state.table
 
 
 if __name__ == "__main__":
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Datum: 17.10.2026
+# Mac OS
+"""
+Zweck: die Kandidaten einzelner Dokumente auf der Festplatte zu speichern.
+
+Autorin: Daryna Ivanova
+"""
+
+import os
+import zlib
+import sqlite3
+import hashlib
+import tempfile
+
+
+class ArtifactCache():
+    """
+    On-disk store of candidates extracted from single documents.
+
+    An entry is keyed by a hash of the document content and of the pipeline
+    configuration (stopwords, POS-Tag patterns, frequency filter), so a
+    changed file or a changed configuration never hits an old entry. All
+    entries live in one sqlite database; candidates are stored as a
+    compressed 'word word frequency' list.
+
+    Methods
+    -------
+    key(content: bytes)
+        Creates the key of a document.
+
+    get(key: str)
+        Loads candidates of a document.
+
+    put(key: str, doc_bigrams_frequency: dict)
+        Stores candidates of a document.
+
+    close()
+        Writes pending entries and closes the database.
+    """
+
+    def __init__(self, cache_file: str = 'Cache/documents.sqlite',
+                 configuration: tuple = (), commit_every: int = 1000):
+        """
+        Parameters
+        ----------
+        cache_file : str
+            Path of the sqlite database, relative to the current directory.
+        configuration : tuple
+            Everything the extracted candidates depend on besides the
+            document content.
+        commit_every : int
+            Number of new entries, which are written in one transaction.
+        """
+        path = os.path.join(os.getcwd(), cache_file)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        self.connection = sqlite3.connect(path)
+        self.connection.execute("CREATE TABLE IF NOT EXISTS documents "
+                                "(key TEXT PRIMARY KEY, candidates BLOB)")
+        self.commit_every = commit_every
+        self.hits = 0
+        self.misses = 0
+        self._pending = 0
+
+        digest = hashlib.sha1()
+        for part in configuration:
+            digest.update(b'\x00')
+            digest.update(repr(part).encode('utf-8'))
+        self._configuration = digest.digest()
+
+    def key(self, content: bytes) -> str:
+        """
+        Create the key of a document.
+
+        Parameters
+        ----------
+        content : bytes
+            Content of a document.
+
+        Returns
+        -------
+        key : str
+            A hex digest of the configuration and the content.
+        """
+        return hashlib.sha1(self._configuration + content).hexdigest()
+
+    def get(self, key: str):
+        """
+        Load candidates of a document.
+
+        Parameters
+        ----------
+        key : str
+            Key of a document.
+
+        Returns
+        -------
+        doc_bigrams_frequency : dict or None
+            Bigrams and their absolute frequencies in the text, None if the
+            document is not in the cache.
+        """
+        row = self.connection.execute("SELECT candidates FROM documents "
+                                      "WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        doc_bigrams_frequency = {}
+
+        for line in zlib.decompress(row[0]).decode('utf-8').splitlines():
+            first_word, second_word, value = line.split(' ')
+            doc_bigrams_frequency[first_word, second_word] = int(value)
+
+        return doc_bigrams_frequency
+
+    def put(self, key: str, doc_bigrams_frequency: dict):
+        """
+        Store candidates of a document.
+
+        Parameters
+        ----------
+        key : str
+            Key of a document.
+        doc_bigrams_frequency : dict
+            Bigrams and their absolute frequencies in the text.
+
+        Returns
+        -------
+        None.
+        """
+        data = '\n'.join(bigram[0] + ' ' + bigram[1] + ' ' + str(value)
+                         for bigram, value in doc_bigrams_frequency.items())
+        self.connection.execute("INSERT OR REPLACE INTO documents "
+                                "VALUES (?, ?)",
+                                (key, zlib.compress(data.encode('utf-8'))))
+
+        self._pending += 1
+        if self._pending >= self.commit_every:
+            self.connection.commit()
+            self._pending = 0
+
+    def close(self):
+        """
+        Write pending entries and close the database.
+
+        Returns
+        -------
+        None.
+        """
+        self.connection.commit()
+        self.connection.close()
+
+
+##############################################################################
+#                          A CLASS DEMONSTRATION                             #
+##############################################################################
+
+
+                 ##########################
+                 ###   DEMONSTRATION   ####
+                 ##########################
+
+
+def artifact_cache_demo():
+    """Demonstrate how ArtifactCache class can be used."""
+    print("\n")
+    print("-------------------------------------")
+    print("ArtifactCache Class Demonstration")
+    print("-------------------------------------")
+    print("\n")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = ArtifactCache(os.path.join(tmp, 'documents.sqlite'),
+                              ('stopwords.txt', 3))
+        key = cache.key(b'Language processing provides language processing')
+        cache.put(key, {('language', 'processing'): 2})
+
+        print('\t', "Key of a document: ", key)
+        print("\n")
+        print('\t', "Cached candidates: ", cache.get(key))
+        cache.close()
+
+    print("\n")
+    print("==================================================================")
+    print("\n")
+    print("\n")
+    print("TESTING BEGINS...")
+    print("\n")
+
+
+if __name__ == "__main__":
+    artifact_cache_demo()
+    # the tests are kept in test_ArtifactCache.py, so importing the
+    # class does not load unittest
+    import unittest
+    from test_ArtifactCache import ArtifactCacheTest
+    unittest.main()
+    print("\n")
+    print("ArtifactCache Class testing is done!")
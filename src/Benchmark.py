@@ -0,0 +1,481 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Datum: 17.10.2026
+# Mac OS
+"""
+Zweck: die Laufzeit und den Speicherbedarf aller Programmschritte zu messen.
+
+Autorin: Daryna Ivanova
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import platform
+import tempfile
+import tracemalloc
+import numpy as np
+
+from datetime import datetime
+
+try:
+    from src.CandidateSelection import CandidateSelection, _bigram_tags
+    from src.CandidateTable import CandidateTable
+    from src.DomainConsensus import DomainConsensus
+    from src.DomainRelevance import DomainRelevance
+    from src.TermDecision import TermDecision
+    from src.TermsEvaluation import TermsEvaluation
+except ModuleNotFoundError:
+    from CandidateSelection import CandidateSelection, _bigram_tags
+    from CandidateTable import CandidateTable
+    from DomainConsensus import DomainConsensus
+    from DomainRelevance import DomainRelevance
+    from TermDecision import TermDecision
+    from TermsEvaluation import TermsEvaluation
+
+
+# Syllables of the synthetic words, so that every word is alphabetic
+_SYLLABLES = ['ka', 'lo', 'mi', 'nu', 're', 'sa', 'ti', 'vo', 'ze', 'bu',
+              'da', 'fe', 'go', 'hi', 'ju', 'pe']
+
+
+class ZipfCorpus():
+    """
+    Synthetic domain corpus with a Zipfian vocabulary.
+
+    Word ranks are drawn with the probability 1 / rank ** exponent, as in
+    natural language texts. The same seed always gives the same corpus.
+
+    Methods
+    -------
+    word(rank: int)
+        Gets the synthetic word of a rank.
+
+    documents()
+        Yields the tokens of every document.
+
+    write(directory: str)
+        Writes the documents as txt files.
+
+    candidates_per_doc()
+        Counts bigrams of every document without tagging.
+
+    reference_frequencies(n_tokens: int)
+        Draws a reference corpus from a shifted vocabulary.
+    """
+
+    def __init__(self, n_docs: int, doc_length: int = 300,
+                 vocabulary: int = 50000, exponent: float = 1.07,
+                 seed: int = 0):
+        """
+        Parameters
+        ----------
+        n_docs : int
+            Number of documents.
+        doc_length : int
+            Number of tokens per document.
+        vocabulary : int
+            Number of distinct words.
+        exponent : float
+            Exponent of the Zipf distribution.
+        seed : int
+            Seed of the random generator.
+        """
+        self.n_docs = n_docs
+        self.doc_length = doc_length
+        self.vocabulary = vocabulary
+        self.seed = seed
+
+        ranks = np.arange(1, vocabulary + 1, dtype=np.float64)
+        weights = 1 / ranks ** exponent
+        self.probabilities = weights / weights.sum()
+
+    def word(self, rank: int) -> str:
+        """Get the synthetic word of a rank, e.g. 'kalo' for 16."""
+        syllables = []
+        rank += len(_SYLLABLES)
+
+        while rank > 0:
+            rank, rest = divmod(rank, len(_SYLLABLES))
+            syllables.append(_SYLLABLES[rest])
+
+        return ''.join(reversed(syllables))
+
+    def documents(self):
+        """
+        Yield the tokens of every document.
+
+        Yields
+        ------
+        tokens : list
+            Words of a document.
+        """
+        rng = np.random.default_rng(self.seed)
+        words = [self.word(rank) for rank in range(self.vocabulary)]
+
+        for _ in range(self.n_docs):
+            ranks = rng.choice(self.vocabulary, size=self.doc_length,
+                               p=self.probabilities)
+            yield [words[rank] for rank in ranks.tolist()]
+
+    def write(self, directory: str):
+        """
+        Write the documents as txt files.
+
+        Parameters
+        ----------
+        directory : str
+            An existing directory.
+
+        Returns
+        -------
+        None.
+        """
+        for number, tokens in enumerate(self.documents()):
+            with open(os.path.join(directory, 'doc%07d.txt' % number), 'w',
+                      encoding='utf-8') as f:
+                f.write(' '.join(tokens))
+
+    def candidates_per_doc(self) -> list:
+        """
+        Count bigrams of every document without filtering and tagging.
+
+        Scoring stages can be measured with it when NLTK data is missing.
+
+        Returns
+        -------
+        candidates_per_doc : list
+            Dictionaries with bigrams and their frequencies per document.
+        """
+        candidates_per_doc = []
+
+        for tokens in self.documents():
+            doc = {}
+            for bigram in zip(tokens, tokens[1:]):
+                doc[bigram] = doc.get(bigram, 0) + 1
+            candidates_per_doc.append(doc)
+
+        return candidates_per_doc
+
+    def reference_frequencies(self, n_tokens: int) -> dict:
+        """
+        Draw a reference corpus, which shares only a part of the vocabulary.
+
+        Parameters
+        ----------
+        n_tokens : int
+            Number of tokens in the reference corpus.
+
+        Returns
+        -------
+        reference_freq : dict
+            Bigrams and their absolute frequencies.
+        """
+        rng = np.random.default_rng(self.seed + 1)
+        shift = self.vocabulary // 10
+        ranks = rng.choice(self.vocabulary, size=n_tokens,
+                           p=self.probabilities) + shift
+        words = [self.word(rank) for rank in ranks.tolist()]
+
+        reference_freq = {}
+        for bigram in zip(words, words[1:]):
+            reference_freq[bigram] = reference_freq.get(bigram, 0) + 1
+
+        return reference_freq
+
+
+class Benchmark():
+    """
+    Measure time and memory of every stage of the pipeline separately.
+
+    Methods
+    -------
+    measure(stage: str, size: int, function, *args, setup=None)
+        Measures peak memory and the best time of a function.
+
+    run(sizes: list)
+        Measures all the stages for corpora of the given sizes.
+
+    compare(results: dict, baseline: dict, tolerance: float)
+        Compares results with a stored baseline.
+    """
+
+    def __init__(self, doc_length: int = 300, vocabulary: int = 50000,
+                 repeats: int = 3, alphas: list = None, thetas: list = None):
+        """
+        Parameters
+        ----------
+        doc_length : int
+            Number of tokens per synthetic document.
+        vocabulary : int
+            Number of distinct synthetic words.
+        repeats : int
+            Every stage is timed this many times, the best time is reported.
+        alphas, thetas : list
+            Grid for the decision stages.
+        """
+        self.doc_length = doc_length
+        self.vocabulary = vocabulary
+        self.repeats = repeats
+        self.alphas = alphas or [0.2, 0.5, 0.7]
+        self.thetas = thetas or [0.3, 0.6, 0.9]
+        self.results = []
+
+    def measure(self, stage: str, size: int, function, *args, setup=None):
+        """
+        Measure peak memory and the best time of a function.
+
+        Memory is traced in a separate first run, so tracing does not slow
+        down the timed runs. Stages, which need missing NLTK data or a missing
+        stopwords.txt, are reported as skipped.
+
+        Parameters
+        ----------
+        stage : str
+            Name of the stage.
+        size : int
+            Number of documents.
+        function
+            The stage.
+        *args
+            Arguments of the stage.
+        setup
+            Called before every run and not timed, e.g. to empty a memo, so
+            that every run starts cold.
+
+        Returns
+        -------
+        output
+            Result of the function, None if the stage was skipped.
+        """
+        record = {'stage': stage, 'size': size}
+
+        try:
+            if setup is not None:
+                setup()
+            tracemalloc.start()
+            output = function(*args)
+            record['peak_bytes'] = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+            timings = []
+            for _ in range(self.repeats):
+                if setup is not None:
+                    setup()
+                start = time.perf_counter()
+                function(*args)
+                timings.append(time.perf_counter() - start)
+        except (LookupError, FileNotFoundError) as error:
+            if tracemalloc.is_tracing():
+                tracemalloc.stop()
+            record['status'] = 'skipped'
+            record['reason'] = next(line.strip() for line in
+                                    str(error).splitlines() + ['missing data']
+                                    if line.strip(' *'))
+            self.results.append(record)
+            return None
+
+        record['status'] = 'ok'
+        record['seconds'] = min(timings)
+        self.results.append(record)
+
+        return output
+
+    def run(self, sizes: list) -> dict:
+        """
+        Measure all the stages for corpora of the given sizes.
+
+        Parameters
+        ----------
+        sizes : list
+            Numbers of documents.
+
+        Returns
+        -------
+        report : dict
+            Environment and measured stages, ready for json.
+        """
+        self.measure('reuters_corpus', 0, CandidateSelection().reuters_corpus)
+
+        for size in sizes:
+            self.run_size(size)
+
+        return {'created': datetime.now().isoformat(),
+                'python': sys.version.split()[0],
+                'numpy': np.__version__, 'platform': platform.platform(),
+                'doc_length': self.doc_length,
+                'vocabulary': self.vocabulary, 'results': self.results}
+
+    def run_size(self, size: int):
+        """Measure all the stages for a corpus of one size."""
+        corpus = ZipfCorpus(size, self.doc_length, self.vocabulary)
+
+        # text_files_getter reads a directory relative to the current one
+        directory = tempfile.mkdtemp(prefix='benchmark_', dir=os.getcwd())
+        try:
+            corpus.write(directory)
+            # every run tags all bigrams, as a run of main.py does
+            self.measure('text_files_getter', size,
+                         CandidateSelection().text_files_getter,
+                         os.path.basename(directory), 3,
+                         setup=_bigram_tags.cache_clear)
+        finally:
+            shutil.rmtree(directory)
+
+        # scoring stages get the same untagged candidates in any case
+        candidates_per_doc = corpus.candidates_per_doc()
+        candidates_total = {}
+        for doc in candidates_per_doc:
+            for key, value in doc.items():
+                candidates_total[key] = candidates_total.get(key, 0) + value
+        candidates = list(candidates_total)
+
+        reference_freq = corpus.reference_frequencies(size * self.doc_length)
+        reference_total = sum(reference_freq.values())
+
+        relevance = DomainRelevance()
+        cond_prob_domain = self.measure(
+            'cond_probability', size, relevance.cond_probability,
+            candidates, candidates_total)
+        cond_prob_reference = relevance.cond_probability(
+            reference_freq.keys(), reference_freq)
+        domain_relevance = self.measure(
+            'relevance', size, relevance.relevance, cond_prob_domain,
+            cond_prob_reference, candidates)
+
+        consensus = DomainConsensus()
+        term_distr = self.measure('term_distr', size, consensus.term_distr,
+                                  candidates_total, candidates_per_doc,
+                                  candidates)
+        domain_consensus = self.measure('domain_consensus', size,
+                                        consensus.domain_consensus,
+                                        term_distr, candidates)
+        del term_distr
+
+        gold = candidates[::50]
+        self.measure('decision_function', size, self._decisions, candidates,
+                     domain_relevance, domain_consensus)
+        final_terms = TermDecision().decision_function(
+            candidates, domain_relevance, domain_consensus, self.alphas[0],
+            self.thetas[0])
+        self.measure('precision_and_recall', size,
+                     TermsEvaluation().precision_and_recall, final_terms,
+                     gold)
+
+        # the same stages on a CandidateTable, as used by main.py
+        table = self.measure('candidate_table', size, self._table,
+                             candidates_per_doc)
+        self.measure('table_relevance', size, DomainRelevance().
+                     table_relevance, table, reference_freq, reference_total)
+        self.measure('table_consensus', size,
+                     DomainConsensus().table_consensus, table)
+        self.measure('table_grid', size, TermDecision().table_grid, table,
+                     self.alphas, self.thetas, frozenset(gold))
+
+    def compare(self, results: dict, baseline: dict,
+                tolerance: float = 1.25) -> list:
+        """
+        Compare results with a stored baseline.
+
+        Parameters
+        ----------
+        results : dict
+            A report of run.
+        baseline : dict
+            An earlier report.
+        tolerance : float
+            A stage regressed, if it takes more than tolerance times its
+            baseline time or memory.
+
+        Returns
+        -------
+        rows : list
+            (stage, size, time ratio, memory ratio, regressed) for every
+            stage, which was measured in both reports.
+        """
+        earlier = {(record['stage'], record['size']): record for record in
+                   baseline['results'] if record.get('status') == 'ok'}
+        rows = []
+
+        for record in results['results']:
+            before = earlier.get((record['stage'], record['size']))
+            if before is None or record.get('status') != 'ok':
+                continue
+
+            time_ratio = record['seconds'] / max(before['seconds'], 1e-9)
+            memory_ratio = record['peak_bytes'] / max(before['peak_bytes'], 1)
+            rows.append((record['stage'], record['size'], time_ratio,
+                         memory_ratio, time_ratio > tolerance or
+                         memory_ratio > tolerance))
+
+        return rows
+
+    def _decisions(self, candidates: list, relevance: dict,
+                   consensus: dict):
+        """Run decision_function for the whole alpha/theta grid."""
+        for alpha in self.alphas:
+            for theta in self.thetas:
+                TermDecision().decision_function(candidates, relevance,
+                                                 consensus, alpha, theta)
+
+    def _table(self, candidates_per_doc: list) -> CandidateTable:
+        """Build a CandidateTable from per-document candidates."""
+        table = CandidateTable()
+        for doc in candidates_per_doc:
+            table.add_document(doc)
+
+        return table
+
+
+def write_report(report: dict, output_file: str):
+    """Write a benchmark report as json."""
+    with open(output_file, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+
+
+##############################################################################
+#                          A CLASS DEMONSTRATION                             #
+##############################################################################
+
+
+                 ##########################
+                 ###   DEMONSTRATION   ####
+                 ##########################
+
+
+def benchmark_demo():
+    """Demonstrate how ZipfCorpus and Benchmark classes can be used."""
+    print("\n")
+    print("-------------------------------------")
+    print("Benchmark Class Demonstration")
+    print("-------------------------------------")
+    print("\n")
+
+    corpus = ZipfCorpus(2, doc_length=12, vocabulary=100)
+    print('\t', "Two synthetic documents: ")
+    print("\n")
+    for tokens in corpus.documents():
+        print(tokens)
+    print("\n")
+    print('\t', "Run the whole benchmark from the main directory: ")
+    print("\n")
+    print("python3 benchmark.py --sizes '1000, 10000' --output bench.json")
+    print("\n")
+    print("==================================================================")
+    print("\n")
+    print("\n")
+    print("TESTING BEGINS...")
+    print("\n")
+
+
+if __name__ == "__main__":
+    benchmark_demo()
+    # the tests are kept in test_Benchmark.py, so importing the
+    # class does not load unittest
+    import unittest
+    from test_Benchmark import BenchmarkTest
+    unittest.main()
+    print("\n")
+    print("Benchmark Class testing is done!")
@@ -9,12 +9,52 @@ Autorin: Daryna Ivanova
 """
 
 import os
-import unittest
-import nltk
-
-from nltk import FreqDist
-from nltk.corpus import reuters, stopwords
-from nltk.tokenize import RegexpTokenizer
+import re
+import json
+import hashlib
+import tempfile
+
+from collections import Counter, deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from functools import lru_cache
+from importlib import metadata
+from itertools import islice, tee
+
+# NLTK takes a considerable time to import. It is imported by the methods,
+# which tokenize, tag or read NLTK data, so runs, which get everything from
+# the caches, do not load it at all.
+
+try:
+    from src.ArtifactCache import ArtifactCache
+    from src.CorpusReader import CorpusReader, read_file
+    from src.CountMinSketch import CountMinSketch
+    from src.NearDuplicates import NearDuplicates
+    from src.ReferenceCache import ReferenceCache
+except ModuleNotFoundError:
+    from ArtifactCache import ArtifactCache
+    from CorpusReader import CorpusReader, read_file
+    from CountMinSketch import CountMinSketch
+    from NearDuplicates import NearDuplicates
+    from ReferenceCache import ReferenceCache
+
+# Bump whenever tokenization, filtering or the accepted POS-Tag combinations
+# change, so that cached per-document candidates are not reused.
+PIPELINE_VERSION = 1
+
+# One tagger is loaded per process; see CandidateSelection.pos_tags
+_TAGGER = None
+
+# Tags of the most recently used distinct bigrams, kept per process
+_BIGRAM_TAGS_SIZE = 2 ** 18
+
+# Stopword lexicons, loaded once per stopwords file
+_STOPWORDS = {}
+
+# Documents, tokens, candidates and tagger calls of this process; counts of
+# worker processes are added when their documents are consumed
+_COUNTERS = Counter()
+
+_WORD = re.compile(r'\w+')
 
 
 class CandidateSelection():
@@ -23,10 +63,35 @@ class CandidateSelection():
 
     Methods
     -------
-    text_files_getter(folder_name: str)
+    text_files_getter(folder_name: str, filter_freq_n: int, workers: int = 1)
         Creates a domain corpus of candidate terms, computes candidates
         frequency across all documents and within one document.
 
+    iter_document_candidates(folder_name: str, filter_freq_n: int)
+        Yields candidates of the txt files one document at a time.
+
+    iter_file_candidates(files: list, filter_freq_n: int)
+        Yields candidates of the given txt files one document at a time.
+
+    iter_text_candidates(documents, filter_freq_n: int)
+        Yields candidates of documents, which were already read, e.g. from
+        an archive.
+
+    document_cache(filter_freq_n: int)
+        Opens the cache of per-document candidates for this configuration.
+
+    data_fingerprint(cache_dir: str = 'Cache')
+        Identifies stopwords.txt, the NLTK version and the NLTK data.
+
+    in_flight_window(folder_name: str, memory_target: int)
+        Estimates how many documents fit into a memory target at once.
+
+    document_candidates(text: str, filter_freq_n: int)
+        Extracts candidates with acceptable POS-Tags from a single text.
+
+    pos_tags(bigram: tuple)
+        Tags a bigram with a shared tagger, memoizing recent results.
+
     isNoun (code: str)
         Lists POS-Tags for a Noun.
 
@@ -41,6 +106,14 @@ class CandidateSelection():
         Extracts bigrams from nltk.reuters corpus. Creates reference corpus
         and computes frequency of a candidate.
 
+    reference_statistics(cache_dir: str = 'Cache', candidates=None)
+        Loads reference corpus frequencies from the on-disk cache, creating
+        it with reuters_corpus on the first run. Optionally only frequencies
+        of domain candidates are kept.
+
+    reference_sketch(epsilon: float, delta: float, cache_dir: str = 'Cache')
+        Counts reference corpus bigrams approximately in a CountMinSketch.
+
     filter_text_files(corpus: list, n: int, freq_dist_filter: bool = False):
         Filter stopwords, numbers and make tokens in lower case. Then generate
         bigrams.
@@ -48,9 +121,21 @@ class CandidateSelection():
 
     frequency_filter(corpus: list, n: int):
         Filter out all the tokens with occurence < n.
+
+    stopword_lexicon()
+        Loads the stopwords once per process.
+
+    bigram_counts(tokens, filter_freq_n: int)
+        Filters tokens and counts their bigrams in a single pass.
+
+    counters()
+        Counts documents, tokens, candidates and tagger calls of the run.
     """
 
     def text_files_getter(self, folder_name: str, filter_freq_n: int,
+                          workers: int = 1, cache: ArtifactCache = None,
+                          shard: tuple = None,
+                          near_duplicates: NearDuplicates = None,
                           **options) -> tuple:
         """
         Convert txt files from a given directory into corpora.
@@ -63,11 +148,25 @@ class CandidateSelection():
         Parameters
         ----------
         folder_path : str
-            Name of a directory, where domain corpus texts are located.
+            Name of a directory, where domain corpus texts are located, or
+            of a tar, zip or JSONL archive (see CorpusReader).
         filter_freq_n: int
             Filter out the words, which occur less than n times in a corpus.
             An integer number n has to be given. Enter 0 to deactivate the
             filter.
+        workers : int
+            Number of processes, which handle the documents. With 1 (default)
+            all the documents are handled in the current process. The result
+            does not depend on the number of workers.
+        cache : ArtifactCache
+            Reuse candidates of documents, which were handled before with
+            the same configuration, see document_cache.
+        shard : tuple
+            (i, k): only handle the shard i of k of the corpus, see
+            iter_document_candidates and PartialStatistics.
+        near_duplicates : NearDuplicates
+            Skip near-duplicates of earlier texts, see
+            iter_document_candidates.
         **options
             Needed for method testing.
 
@@ -82,93 +181,421 @@ class CandidateSelection():
             candidates : list
                 Bigrams from all the txt files.
         """
-        path = os.getcwd() + '/' + folder_name
-
         # list of lists with bigrams per document
-        candidates_per_doc = []
+        candidates_per_doc = list(self.iter_document_candidates(
+            folder_name, filter_freq_n, workers=workers, cache=cache,
+            shard=shard, near_duplicates=near_duplicates, **options))
         candidates_total = {}
 
-        for file in os.listdir(path):
+        for doc_bigrams_frequency in candidates_per_doc:
+            for key, value in doc_bigrams_frequency.items():
+                if key in candidates_total.keys():
+                    candidates_total[key] = candidates_total[key] + value
+                else:
+                    candidates_total[key] = value
+
+        # All bigrams
+        candidates = candidates_total.keys()
+
+        return candidates_total, candidates_per_doc, candidates
+
+    def iter_document_candidates(self, folder_name: str, filter_freq_n: int,
+                                 workers: int = 1, window: int = None,
+                                 cache: ArtifactCache = None,
+                                 shard: tuple = None,
+                                 near_duplicates: NearDuplicates = None,
+                                 listing: list = None, **options):
+        """
+        Yield candidates of the txt files one document at a time.
+
+        Documents of a directory are yielded in the order of their names,
+        also with worker processes, so the order is the same on every
+        machine. At most window documents are handled or waiting to be
+        consumed at the same time. Instead of a directory an archive can be
+        given (see CorpusReader), its documents are read in the current
+        process and only their texts are passed to the worker processes.
+
+        With a shard (i, k) only the documents at the positions i, i + k,
+        i + 2k, ... are handled, so k processes or machines can share a
+        corpus (see PartialStatistics).
+
+        With near_duplicates all the documents (of the shard) are read once
+        before, and a near-duplicate of an earlier document is skipped, so
+        repeated texts do not inflate the frequencies and the Domain
+        Consensus. The skipped documents are kept in
+        near_duplicates.duplicates under their names relative to the
+        corpus.
+
+        Parameters
+        ----------
+        folder_name : str
+            Name of a directory, where domain corpus texts are located, or
+            of a tar, zip or JSONL archive.
+        filter_freq_n: int
+            Filter out the words, which occur less than n times in a text.
+        workers : int
+            Number of processes, which handle the documents.
+        window : int
+            Number of documents in flight. Defaults to four per worker.
+        cache : ArtifactCache
+            Reuse candidates of documents, which were handled before.
+        shard : tuple
+            (i, k): only handle the shard i of k. None handles all the
+            documents.
+        near_duplicates : NearDuplicates
+            Skip near-duplicates of earlier documents. None (default)
+            handles all the documents.
+        listing : list
+            If a list is given, the names of all the documents of the
+            corpus, also of other shards, are appended in the corpus order
+            (see PartialStatistics).
+        **options
+            Needed for method testing.
 
-            with open(path + '/' + file, 'r', encoding='utf-8',
-                      errors='ignore') as temp_file:
+        Yields
+        ------
+        doc_bigrams_frequency : dict
+            Bigrams and their absolute frequencies in a text.
+        """
+        index, count = shard if shard is not None else (0, 1)
+
+        if CorpusReader.is_archive(folder_name):
+            prefix = CorpusReader(folder_name).path + '/'
+            keep = None
+
+            def shard_documents(names: list = None):
+                # documents of other shards are read, but not tokenized
+                for position, (name, content) in enumerate(
+                        CorpusReader(folder_name).documents()):
+                    name = name[len(prefix):]
+                    if names is not None:
+                        names.append(name)
+                    if position % count == index:
+                        yield name, content
+
+            if near_duplicates is not None:
+                kept = near_duplicates.keep(shard_documents())
+                _COUNTERS['near_duplicates'] += kept.count(False)
+                keep = iter(kept)
+
+            contents = (content for _, content in shard_documents(listing)
+                        if keep is None or next(keep))
+            yield from self.iter_text_candidates(
+                contents, filter_freq_n, workers=workers, window=window,
+                cache=cache, **options)
+            return
 
-                text = temp_file.read()
+        path = os.getcwd() + '/' + folder_name
+        names = sorted(os.listdir(path))
+        if listing is not None:
+            listing.extend(names)
+        files = [path + '/' + name for name in names][index::count]
+
+        if near_duplicates is not None:
+            kept = near_duplicates.keep((os.path.basename(file),
+                                         read_file(file)) for file in files)
+            _COUNTERS['near_duplicates'] += kept.count(False)
+            files = [file for file, keep in zip(files, kept) if keep]
+
+        yield from self.iter_file_candidates(files, filter_freq_n,
+                                             workers=workers, window=window,
+                                             cache=cache, **options)
+
+    def iter_file_candidates(self, files: list, filter_freq_n: int,
+                             workers: int = 1, window: int = None,
+                             cache: ArtifactCache = None, **options):
+        """
+        Yield candidates of the given txt files one document at a time.
+
+        Parameters
+        ----------
+        files : list
+            Paths of the txt files. Documents are yielded in this order.
+        filter_freq_n: int
+            Filter out the words, which occur less than n times in a text.
+        workers : int
+            Number of processes, which handle the documents.
+        window : int
+            Number of documents in flight. Defaults to four per worker.
+        cache : ArtifactCache
+            Reuse candidates of documents, which were handled before. Only
+            documents missing in the cache are tokenized and tagged, and
+            their candidates are added to the cache. Not used together with
+            testing options.
+        **options
+            Needed for method testing.
+
+        Yields
+        ------
+        doc_bigrams_frequency : dict
+            Bigrams and their absolute frequencies in a text.
+        """
+        yield from self._iter_candidates(files, self._start, filter_freq_n,
+                                         workers, window, cache, options,
+                                         len(files) > 1)
+
+    def iter_text_candidates(self, documents, filter_freq_n: int,
+                             workers: int = 1, window: int = None,
+                             cache: ArtifactCache = None, **options):
+        """
+        Yield candidates of documents, which were already read.
+
+        Parameters
+        ----------
+        documents : iterable
+            Contents of the documents as bytes, e.g. from
+            CorpusReader.documents. Documents are yielded in this order.
+        filter_freq_n: int
+            Filter out the words, which occur less than n times in a text.
+        workers : int
+            Number of processes, which handle the documents.
+        window : int
+            Number of documents in flight. Defaults to four per worker.
+        cache : ArtifactCache
+            Reuse candidates of documents, which were handled before.
+        **options
+            Needed for method testing.
+
+        Yields
+        ------
+        doc_bigrams_frequency : dict
+            Bigrams and their absolute frequencies in a text.
+        """
+        yield from self._iter_candidates(documents, self._start_content,
+                                         filter_freq_n, workers, window,
+                                         cache, options, True)
+
+    def _iter_candidates(self, items, start, filter_freq_n: int,
+                         workers: int, window: int, cache: ArtifactCache,
+                         options: dict, parallel: bool):
+        """
+        Start extracting candidates of every item and yield them in order.
+
+        At most window items are in flight at the same time.
+        """
+        if len(options) > 0:
+            cache = None
+
+        try:
+            if workers > 1 and parallel:
+                window = max(window or workers * 4, 1)
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    pending = deque()
+                    for item in items:
+                        pending.append(start(item, filter_freq_n, options,
+                                             cache, executor))
+                        if len(pending) >= window:
+                            yield self._finish(pending.popleft(), cache)
+                    while pending:
+                        yield self._finish(pending.popleft(), cache)
+            else:
+                for item in items:
+                    yield self._finish(start(item, filter_freq_n, options,
+                                             cache), cache)
+        finally:
+            if cache is not None:
+                cache.connection.commit()
+
+    def document_cache(self, filter_freq_n: int,
+                       cache_file: str = 'Cache/documents.sqlite'
+                       ) -> ArtifactCache:
+        """
+        Open the cache of per-document candidates for this configuration.
+
+        Parameters
+        ----------
+        filter_freq_n: int
+            Filter out the words, which occur less than n times in a text.
+        cache_file : str
+            Path of the sqlite database, relative to the current directory.
+
+        Returns
+        -------
+        cache : ArtifactCache
+            Cache for iter_file_candidates and related methods.
+        """
+        configuration = (PIPELINE_VERSION,
+                         self.data_fingerprint(os.path.dirname(cache_file)),
+                         filter_freq_n)
+
+        return ArtifactCache(cache_file, configuration)
+
+    def _start(self, file: str, filter_freq_n: int, options: dict,
+               cache: ArtifactCache, executor=None) -> tuple:
+        """
+        Start extracting candidates of a file.
+
+        Returns the cache key of a document, which has to be added to the
+        cache (or None), and its candidates or a Future of them.
+        """
+        if cache is None:
+            if executor is None:
+                return None, _file_candidates(file, filter_freq_n, options,
+                                              self)
+            return None, executor.submit(_counted, _file_candidates, file,
+                                         filter_freq_n, options)
+
+        return self._start_content(read_file(file), filter_freq_n, options,
+                                   cache, executor)
+
+    def _start_content(self, content: bytes, filter_freq_n: int,
+                       options: dict, cache: ArtifactCache,
+                       executor=None) -> tuple:
+        """Start extracting candidates of a document, which was read."""
+        key = None
+        if cache is not None:
+            key = cache.key(content)
+            doc_bigrams_frequency = cache.get(key)
+            if doc_bigrams_frequency is not None:
+                return None, doc_bigrams_frequency
+
+        text = content.decode('utf-8', errors='ignore')
+        if executor is None:
+            return key, self.document_candidates(text, filter_freq_n,
+                                                 **options)
+
+        return key, executor.submit(_counted, _text_candidates, text,
+                                    filter_freq_n, options)
+
+    def _finish(self, started: tuple, cache: ArtifactCache) -> dict:
+        """Wait for candidates of a file and add new ones to the cache."""
+        key, doc_bigrams_frequency = started
+
+        if isinstance(doc_bigrams_frequency, Future):
+            doc_bigrams_frequency, counts = doc_bigrams_frequency.result()
+            _COUNTERS.update(counts)
+        if key is not None:
+            cache.put(key, doc_bigrams_frequency)
+
+        return doc_bigrams_frequency
+
+    def in_flight_window(self, folder_name: str, memory_target: int) -> int:
+        """
+        Get the number of documents, which fit into a memory target at once.
+
+        A document in flight is estimated to take 16 times its file size
+        (text, tokens and a bigram dictionary). Documents of tar and JSONL
+        archives are assumed to have 64 KB.
+        """
+        mean_size = CorpusReader(folder_name).mean_document_size()
+        if mean_size is None:
+            if not CorpusReader.is_archive(folder_name):
+                return 1
+            mean_size = 64 * 1024
+
+        mean_size = max(mean_size, 1)
+
+        return max(1, int(memory_target // (16 * mean_size)))
+
+    def document_candidates(self, text: str, filter_freq_n: int,
+                            **options) -> dict:
+        """
+        Extract candidates with acceptable POS-Tags from a single text.
+
+        Parameters
+        ----------
+        text : str
+            Content of a document.
+        filter_freq_n: int
+            Filter out the words, which occur less than n times in a text.
+        **options
+            Needed for method testing.
+
+        Returns
+        -------
+        doc_bigrams_frequency : dict
+            Bigrams and their absolute frequencies in the text.
+        """
+        # filter stopwords and numbers and count bigrams
+        if len(options) == 0:
+            tokens = _WORD.findall(text)
+            doc_bigrams_frequency = self.bigram_counts(tokens, filter_freq_n)
+        else:
+            from nltk import FreqDist
+            from nltk.tokenize import RegexpTokenizer
 
             tokenizer = RegexpTokenizer(r'\w+')
             tokens = tokenizer.tokenize(text)
+            fun = options.get("function")
+            bigrams_cleaned = fun(tokens, filter_freq_n)
+            doc_bigrams_frequency = dict(FreqDist(bigrams_cleaned))
+
+        # With the help of POS-tagging add only acceptable bigrams
+        # to the corpus
+        to_delete = []
+        for bigram in doc_bigrams_frequency.keys():
+            combination = self.pos_tags(bigram)
 
-            # filter stopwords and numbers and create bigrams
             if len(options) == 0:
-                bigrams_cleaned = self.filter_text_files(tokens, filter_freq_n)
-            else:
-                fun = options.get("function")
-                bigrams_cleaned = fun(tokens, filter_freq_n)
-
-            doc_bigrams_frequency = dict(nltk.FreqDist(bigrams_cleaned))
-
-            # With the help of POS-tagging add only acceptable bigrams
-            # to the corpus
-            to_delete = []
-            for bigram in doc_bigrams_frequency.keys():
-                part_of_speech = nltk.pos_tag(bigram)
-                combination = part_of_speech[0][1], part_of_speech[1][1]
-
-                if len(options) == 0:
-                    if (self.isNoun(combination[0]) and
-                        self.isAdjective(combination[1])) or \
-                        (self.isNoun(combination[1]) and
-                         self.isAdjective(combination[0])) or \
-                        (self.isAdjective(combination[1]) and
-                         self.isAdjective(combination[0])) or \
-                        (self.isNoun(combination[0]) and
-                         self.isNoun(combination[1])) or \
-                        (self.isVerb(combination[0]) and
-                         self.isNoun(combination[1])) or \
-                        (self.isVerb(combination[0]) and
-                         self.isAdjective(combination[1])):
-                        pass
-                    else:
-                        # Delete not acceptable POS-tags combinations
-                        to_delete.append(bigram)
-
-                # This block is created only for testing
+                if (self.isNoun(combination[0]) and
+                    self.isAdjective(combination[1])) or \
+                    (self.isNoun(combination[1]) and
+                     self.isAdjective(combination[0])) or \
+                    (self.isAdjective(combination[1]) and
+                     self.isAdjective(combination[0])) or \
+                    (self.isNoun(combination[0]) and
+                     self.isNoun(combination[1])) or \
+                    (self.isVerb(combination[0]) and
+                     self.isNoun(combination[1])) or \
+                    (self.isVerb(combination[0]) and
+                     self.isAdjective(combination[1])):
+                    pass
                 else:
-                    fun_noun = options.get("is_noun")
-                    fun_adj = options.get("is_adj")
-                    fun_verb = options.get("is_verb")
-                    if (fun_noun(combination[0]) and
-                        fun_adj(combination[1])) or \
-                        (fun_noun(combination[1]) and
-                         fun_adj(combination[0])) or \
-                        (fun_adj(combination[1]) and
-                         fun_adj(combination[0])) or \
-                        (fun_noun(combination[0]) and
-                         fun_noun(combination[1])) or \
-                        (fun_verb(combination[0]) and
-                         fun_noun(combination[1])) or \
-                        (fun_verb(combination[0]) and
-                         fun_adj(combination[1])):
-                        pass
-                    else:
-                        to_delete.append(bigram)
-
-            # Delete not acceptable bigrams from another corpus
-            for bigram in to_delete:
-                del doc_bigrams_frequency[bigram]
-
-            candidates_per_doc.append(doc_bigrams_frequency)
+                    # Delete not acceptable POS-tags combinations
+                    to_delete.append(bigram)
 
-            for key, value in doc_bigrams_frequency.items():
-                if key in candidates_total.keys():
-                    candidates_total[key] = candidates_total[key] + value
+            # This block is created only for testing
+            else:
+                fun_noun = options.get("is_noun")
+                fun_adj = options.get("is_adj")
+                fun_verb = options.get("is_verb")
+                if (fun_noun(combination[0]) and
+                    fun_adj(combination[1])) or \
+                    (fun_noun(combination[1]) and
+                     fun_adj(combination[0])) or \
+                    (fun_adj(combination[1]) and
+                     fun_adj(combination[0])) or \
+                    (fun_noun(combination[0]) and
+                     fun_noun(combination[1])) or \
+                    (fun_verb(combination[0]) and
+                     fun_noun(combination[1])) or \
+                    (fun_verb(combination[0]) and
+                     fun_adj(combination[1])):
+                    pass
                 else:
-                    candidates_total[key] = value
+                    to_delete.append(bigram)
 
-        # All bigrams
-        candidates = candidates_total.keys()
+        # Delete not acceptable bigrams from another corpus
+        for bigram in to_delete:
+            del doc_bigrams_frequency[bigram]
 
-        return candidates_total, candidates_per_doc, candidates
+        _COUNTERS['documents'] += 1
+        _COUNTERS['tokens'] += len(tokens)
+        _COUNTERS['candidates'] += len(doc_bigrams_frequency)
+
+        return doc_bigrams_frequency
+
+    def pos_tags(self, bigram: tuple) -> tuple:
+        """
+        Get POS-Tags of a bigram.
+
+        A bigram is tagged exactly as nltk.pos_tag(bigram) would do it, but
+        with a single tagger instance, and the tags of the last
+        _BIGRAM_TAGS_SIZE distinct bigrams are memoized, so frequent bigrams
+        are tagged only once per process and the memo does not grow with
+        the corpus.
+
+        Parameters
+        ----------
+        bigram : tuple
+            Two tokens.
+
+        Returns
+        -------
+        combination : tuple
+            POS-Tags of the first and the second token.
+        """
+        return _bigram_tags(bigram)
 
     def isNoun(self, code: str) -> bool:
         """
@@ -258,6 +685,9 @@ class CandidateSelection():
             clean_corpus : list
                 nltk.reuters term candidates.
         """
+        from nltk import FreqDist
+        from nltk.corpus import reuters
+
         # get list of file names
         doc_ids = reuters.fileids()
 
@@ -274,10 +704,168 @@ class CandidateSelection():
             fun = options.get("function")
             clean_corpus = fun(corpus, 0)
         # compute absolute frequency
-        reuters_freq = dict(nltk.FreqDist(clean_corpus))
+        reuters_freq = dict(FreqDist(clean_corpus))
 
         return reuters_freq, clean_corpus
 
+    def reference_statistics(self, cache_dir: str = 'Cache',
+                             candidates=None) -> tuple:
+        """
+        Get reference corpus frequencies, computing them only once.
+
+        The cache key covers stopwords.txt, the NLTK version and the
+        location, size and modification time of the NLTK stopwords and
+        reuters data (see data_fingerprint), so the cache is rebuilt
+        whenever one of them changes. A cache hit does not import NLTK.
+
+        Domain Relevance only needs reference frequencies of domain
+        candidates, so with candidates all other reference bigrams are
+        dropped while the cache is read. The cache itself always keeps all
+        of them.
+
+        Parameters
+        ----------
+        cache_dir : str
+            Name of a directory, where the cache files are located.
+        candidates : set, frozenset or CandidateTable
+            Domain candidates, anything which supports 'in'. None keeps all
+            reference candidates.
+
+        Returns
+        -------
+        reuters_freq, total : tuple
+            reuters_freq : dict
+                {key: nltk.reuters candidate, value: it's absolute frequency}
+            total : int
+                Number of occurences of all reference candidates, also of
+                the dropped ones.
+        """
+        cache = ReferenceCache(cache_dir)
+        key = cache.cache_key(self.data_fingerprint(cache_dir), 0)
+
+        cached = cache.load(key, candidates)
+        if cached is not None:
+            return cached
+
+        from nltk.corpus import reuters
+
+        tokens = (token for doc in reuters.fileids()
+                  for token in reuters.words(doc))
+        reuters_freq = self.bigram_counts(tokens, 0)
+        cache.store(key, reuters_freq)
+        total = sum(reuters_freq.values())
+
+        if candidates is not None:
+            reuters_freq = {bigram: value for bigram, value in
+                            reuters_freq.items() if bigram in candidates}
+
+        return reuters_freq, total
+
+    def reference_sketch(self, epsilon: float, delta: float = 0.01,
+                         cache_dir: str = 'Cache',
+                         chunk_size: int = 1000000) -> tuple:
+        """
+        Count reference corpus bigrams approximately, computing them once.
+
+        Bigrams are filtered like in bigram_counts and counted exactly in
+        chunks of chunk_size bigrams, which are then added to a
+        CountMinSketch, so memory does not grow with the size of the
+        reference corpus. The sketch is cached in
+        '<cache_dir>/sketch_<key>.npz' like reference_statistics.
+
+        Parameters
+        ----------
+        epsilon : float
+            Relative error of the frequencies, see CountMinSketch.
+        delta : float
+            Probability, that a frequency exceeds the error.
+        cache_dir : str
+            Name of a directory, where the cache files are located.
+        chunk_size : int
+            Number of bigrams counted exactly before they are added to the
+            sketch.
+
+        Returns
+        -------
+        sketch, total : tuple
+            sketch : CountMinSketch
+                Approximate frequencies of nltk.reuters candidates.
+            total : int
+                Number of occurences of all reference candidates.
+        """
+        cache = ReferenceCache(cache_dir)
+        key = cache.cache_key(self.data_fingerprint(cache_dir), 0, 'sketch',
+                              epsilon, delta)
+        sketch_file = os.path.join(cache.cache_dir, 'sketch_' + key + '.npz')
+
+        if os.path.isfile(sketch_file):
+            sketch = CountMinSketch.load(sketch_file)
+            return sketch, sketch.total
+
+        from nltk.corpus import reuters
+
+        tokens = (token for doc in reuters.fileids()
+                  for token in reuters.words(doc))
+        # the same filter as bigram_counts of reference_statistics
+        bigrams = _bigrams(_kept_words(tokens, self.stopword_lexicon()))
+        sketch = CountMinSketch(epsilon, delta)
+
+        for counts in iter(lambda: Counter(islice(bigrams, chunk_size)),
+                           Counter()):
+            sketch.update(counts)
+        sketch.save(sketch_file)
+
+        return sketch, sketch.total
+
+    def data_fingerprint(self, cache_dir: str = 'Cache') -> tuple:
+        """
+        Identify stopwords.txt, the NLTK version and the NLTK data.
+
+        Locating NLTK data needs NLTK itself, therefore the found locations
+        are remembered in '<cache_dir>/nltk_data.json' and later runs only
+        check their sizes and modification times.
+
+        Parameters
+        ----------
+        cache_dir : str
+            Name of a directory, where the cache files are located.
+
+        Returns
+        -------
+        fingerprint : tuple
+            Everything candidates and reference frequencies depend on
+            besides the texts and the filter parameters.
+        """
+        with open(os.getcwd() + '/stopwords.txt', 'rb') as f:
+            stopwords_digest = hashlib.sha1(f.read()).hexdigest()
+
+        manifest_file = os.path.join(os.getcwd(), cache_dir,
+                                     'nltk_data.json')
+        try:
+            with open(manifest_file, 'r', encoding='utf-8') as f:
+                data_paths = json.load(f)
+        except (OSError, ValueError):
+            data_paths = None
+
+        if not data_paths or not all(os.path.exists(path) for path in
+                                     data_paths.values()):
+            data_paths = _nltk_data_paths()
+
+            directory = os.path.dirname(manifest_file)
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=directory, suffix='.json')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(data_paths, f)
+            os.replace(tmp, manifest_file)
+
+        data_state = []
+        for name, path in sorted(data_paths.items()):
+            status = os.stat(path)
+            data_state.append((name, path, status.st_size,
+                               status.st_mtime_ns))
+
+        return stopwords_digest, _nltk_version(), tuple(data_state)
+
     def filter_text_files(self, corpus: list, filter_freq_n: int,
                           **options) -> list:
         """
@@ -299,16 +887,7 @@ class CandidateSelection():
         output : list
         """
         corpus_lower = [w.lower() for w in corpus]
-        stop_words = []
-
-        # Expand stopword list
-        with open(os.getcwd() + '/stopwords.txt', 'r', encoding='utf-8',
-                  errors='ignore') as f:
-
-            for i in f.readlines():
-                tmp = i.strip()
-                stop_words += tmp
-        stop_words += stopwords.words('english')
+        stop_words = self.stopword_lexicon()
 
         corpus_filtered = [w for w in corpus_lower if w.isalpha()
                            and w not in stop_words and len(w) >= 2]
@@ -322,6 +901,83 @@ class CandidateSelection():
 
         return output
 
+    def stopword_lexicon(self) -> frozenset:
+        """
+        Get stopwords from stopwords.txt and nltk.corpus.stopwords.
+
+        The lexicon is read from disk only once per process.
+
+        Returns
+        -------
+        lexicon : frozenset
+            All the stopwords.
+        """
+        path = os.getcwd() + '/stopwords.txt'
+        lexicon = _STOPWORDS.get(path)
+
+        if lexicon is None:
+            from nltk.corpus import stopwords
+
+            with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+                stop_words = [line.strip() for line in f]
+            stop_words += stopwords.words('english')
+
+            lexicon = frozenset(stop_words)
+            _STOPWORDS[path] = lexicon
+
+        return lexicon
+
+    def bigram_counts(self, tokens, filter_freq_n: int) -> dict:
+        """
+        Filter tokens and count their bigrams in a single pass.
+
+        Gives the same result as dict(nltk.FreqDist(filter_text_files(tokens,
+        filter_freq_n))), but without intermediate lists. Only a frequency
+        filter with n > 1 needs to keep the filtered tokens, since the
+        unigram frequencies have to be known before the first bigram.
+
+        Parameters
+        ----------
+        tokens : iterable
+            Tokens of a text, e.g. a list or a generator.
+        filter_freq_n : int
+            Only the words with a given from user n frequency will be used to
+            create bigrams.
+
+        Returns
+        -------
+        counts : dict
+            Bigrams and their absolute frequencies.
+        """
+        words = _kept_words(tokens, self.stopword_lexicon())
+
+        if filter_freq_n > 1:
+            kept = list(words)
+            unigrams_frequency = Counter(kept)
+            words = iter([word for word in kept
+                          if unigrams_frequency[word] >= filter_freq_n])
+
+        return dict(Counter(_bigrams(words)))
+
+    def counters(self) -> dict:
+        """
+        Count documents, tokens, candidates, tagger calls and skipped
+        near-duplicates of the run.
+
+        Documents, which were taken from the document cache, are not
+        tokenized and tagged and therefore not counted.
+
+        Returns
+        -------
+        counters : dict
+            'documents', 'tokens', 'candidates' (distinct candidates per
+            document, summed up) and 'tagger_calls' of this process and of
+            its worker processes, and 'near_duplicates', which were skipped.
+        """
+        return {name: _COUNTERS[name] for name in
+                ('documents', 'tokens', 'candidates', 'tagger_calls',
+                 'near_duplicates')}
+
     def frequency_filter(self, corpus: list, filter_freq_n: int) -> list:
         """
         Extract bigrams from the tokens, which occur more than n times.
@@ -339,8 +995,10 @@ class CandidateSelection():
         bigrams : list
             List of bigrams.
         """
+        import nltk
+
         # absolute frequency of unigrams
-        unigrams_frequency = dict(FreqDist(corpus))
+        unigrams_frequency = dict(nltk.FreqDist(corpus))
 
         # create a corpus with frequency filtration
         corpus_freq = [token for token in corpus if
@@ -351,80 +1009,98 @@ class CandidateSelection():
         return bigrams
 
 
-##############################################################################
-#                    A CLASS TESTING AND DEMONSTRATION                       #
-##############################################################################
+def _file_candidates(file_path: str, filter_freq_n: int, options: dict,
+                     selection: CandidateSelection = None) -> dict:
+    """
+    Read one txt file and extract its candidates.
+
+    Defined on the module level, so that worker processes of
+    CandidateSelection.text_files_getter can call it.
+    """
+    text = read_file(file_path).decode('utf-8', errors='ignore')
+
+    if selection is None:
+        selection = CandidateSelection()
+
+    return selection.document_candidates(text, filter_freq_n, **options)
 
 
-                 ###################
-                 ###   TESTING   ###
-                 ###################
-
-
-class TestCandidateSelection(unittest.TestCase):
-    """A class for CandidateSelection units testing."""
-
-    def test_text_files_getter(self):
-        """
-        Test that Method can get data from a given folder and convert it into
-        bigrams, checking the accepted POS-Tags combinations.
-        """
-        folder_name = 'test_folder'
-        opt = CandidateSelection().frequency_filter
-        noun = CandidateSelection().isNoun
-        adj = CandidateSelection().isAdjective
-        v = CandidateSelection().isVerb
-        res = CandidateSelection().text_files_getter(folder_name, 0,
-                                                     function=opt,
-                                                     is_noun=noun,
-                                                     is_adj=adj,
-                                                     is_verb=v)
-        self.assertEqual(list(res[0].keys()), [('language', 'processing')],
-                         "incorrect result may be caused by hidden files \
-                        (e.g. .DS_Store on Mac OS). Make sure they are \
-                        deleted.")
-        print("Text files getter testing is successfully executed!")
-
-    def test_reuters_corpus(self):
-        """Check if a dictionary with frequencies was created."""
-        opt = CandidateSelection().frequency_filter
-        res = CandidateSelection().reuters_corpus(function=opt)
-        tuple_res = type(res[0]) is dict
-        self.assertTrue(tuple_res, "reuters_freq result doesn't contain \
-                        dictionary.")
-        print("Reuters corpus testing is successfully executed!")
-
-    def test_filter_text_files(self):
-        """Test that tokens are in lowercase and filtered."""
-        corpus = ['Language', 'proceSsing', 'linguistics', 'PROVIDES',
-                  'automatic', 'language', 'processing', 'the', '12345']
-        opt = CandidateSelection().frequency_filter
-        res = CandidateSelection().filter_text_files(corpus, 2, function=opt)
-        expect = [('language', 'processing'), ('processing', 'language'),
-                  ('language', 'processing')]
-        self.assertEqual(expect, res, "either stop words/ numbers or \
-                          punctuation were not removed or tokens are not in \
-                              a lower case.")
-        print("Text files filter testing is successfully executed!")
-
-    def test_frequency_filter_tuple(self):
-        """Test that a result element is a tuple."""
-        tokens = ['language', 'processing', 'linguistics', 'provides',
-                  'automatic', 'language', 'processing']
-        res = CandidateSelection().frequency_filter(tokens, 0)
-        for element in res:
-            self.assertIsInstance(element, tuple,
-                                  "result elements should be tuples")
-        print("Frequency filter tests are successfully executed!")
-
-    def test_frequency_filter_result(self):
-        """Test that all the words with the frequency < 3 will be ignored."""
-        tokens = ['language', 'processing', 'linguistics', 'provides',
-                  'automatic', 'language', 'processing']
-        res = CandidateSelection().frequency_filter(tokens, 3)
-        self.assertCountEqual(res, [],
-                              "doesn't correspond the expected result.")
-        print("Frequency filter tests are successfully executed!")
+@lru_cache(maxsize=_BIGRAM_TAGS_SIZE)
+def _bigram_tags(bigram: tuple) -> tuple:
+    """Tag a bigram with the tagger of the process, see pos_tags."""
+    global _TAGGER
+    if _TAGGER is None:
+        from nltk.tag import PerceptronTagger
+        _TAGGER = PerceptronTagger()
+
+    part_of_speech = _TAGGER.tag(list(bigram))
+    _COUNTERS['tagger_calls'] += 1
+
+    return part_of_speech[0][1], part_of_speech[1][1]
+
+
+def _kept_words(tokens, stop_words) -> iter:
+    """Lower-cased tokens without stop words, numbers and single letters."""
+    return (word for word in map(str.lower, tokens) if len(word) >= 2 and
+            word.isalpha() and word not in stop_words)
+
+
+def _bigrams(words) -> iter:
+    """Bigrams of consecutive words."""
+    first, second = tee(words)
+    next(second, None)
+
+    return zip(first, second)
+
+
+def _nltk_version() -> str:
+    """Get the version of the installed NLTK without importing it."""
+    try:
+        return metadata.version('nltk')
+    except metadata.PackageNotFoundError:
+        import nltk
+        return nltk.__version__
+
+
+def _nltk_data_paths() -> dict:
+    """Locate the NLTK stopwords and reuters data, this imports NLTK."""
+    from nltk.corpus import reuters, stopwords
+
+    return {'reuters': _pointer_path(reuters.root),
+            'stopwords': _pointer_path(stopwords.abspath('english'))}
+
+
+def _pointer_path(pointer) -> str:
+    """Get the file or directory of an NLTK path pointer."""
+    path = getattr(pointer, 'path', None)
+
+    if path is None and hasattr(pointer, 'zipfile'):
+        path = pointer.zipfile.filename
+
+    return os.path.abspath(str(path if path is not None else pointer))
+
+
+def _text_candidates(text: str, filter_freq_n: int,
+                     options: dict = None) -> dict:
+    """Extract candidates of a text in a worker process."""
+    return CandidateSelection().document_candidates(text, filter_freq_n,
+                                                    **(options or {}))
+
+
+def _counted(function, *args) -> tuple:
+    """
+    Call a function in a worker process and return its result together with
+    the counters it added, so the parent process can sum them up.
+    """
+    before = Counter(_COUNTERS)
+    result = function(*args)
+
+    return result, _COUNTERS - before
+
+
+##############################################################################
+#                          A CLASS DEMONSTRATION                             #
+##############################################################################
 
 
                  ##########################
@@ -477,10 +1153,12 @@ def candidate_selection_demo():
                   ('learning', 'analyses'), ('analyses', 'data'),
                   ('data', 'predicts'), ('predicts', 'outcome')]
 
-    candidates_total_freq = dict(nltk.FreqDist(candidates))
+    from nltk import FreqDist
+
+    candidates_total_freq = dict(FreqDist(candidates))
     candidates_per_doc_freq = []
     for doc in cand_doc:
-        candidates_per_doc_freq.append(dict(nltk.FreqDist(doc)))
+        candidates_per_doc_freq.append(dict(FreqDist(doc)))
 
     print("\n")
     print("=======================================")
@@ -519,6 +1197,10 @@ def candidate_selection_demo():
 
 if __name__ == "__main__":
     candidate_selection_demo()
+    # the tests are kept in test_CandidateSelection.py, so importing the
+    # class does not load unittest
+    import unittest
+    from test_CandidateSelection import TestCandidateSelection
     unittest.main()
     print("\n")
     print("CandidateSelection Class testing is done!")
@@ -0,0 +1,493 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Datum: 17.10.2026
+# Mac OS
+"""
+Zweck: eine gemeinsame Tabelle der Kandidaten für alle Bewertungsschritte.
+
+Autorin: Daryna Ivanova
+"""
+
+import math
+import numpy as np
+
+from array import array
+
+
+class CandidateTable():
+    """
+    Interned candidates and their statistics in parallel typed arrays.
+
+    Every word and every bigram gets an integer id. A candidate with the id i
+    is described by the i-th element of the arrays first, second, counts and
+    log_sums, and every scoring stage stores its result as a column of the
+    same length, e.g. table.columns['relevance'][i].
+
+    Attributes
+    ----------
+    words : list
+        Words, the position in the list is the word id.
+    columns : dict
+        Column name and a float64 array with a value per candidate.
+    n_docs : int
+        Number of added documents.
+
+    Methods
+    -------
+    add_document(doc_bigrams_frequency: dict)
+        Interns candidates of a document and adds their frequencies.
+
+    remove_document(doc_bigrams_frequency: dict)
+        Subtracts frequencies of a document, which was added before.
+
+    add_statistics(bigrams: list, counts: np.ndarray, log_sums: np.ndarray,
+                   n_docs: int)
+        Adds frequencies and log_sums of several documents at once.
+
+    index(bigram: tuple)
+        Gets the id of a candidate.
+
+    key(candidate_id: int)
+        Gets the bigram of a candidate id.
+
+    keys()
+        Lists bigrams of all candidates in the order of their ids.
+
+    to_dict(column: str)
+        Converts a column into a dictionary with bigrams as keys.
+
+    documents()
+        Yields candidate ids and frequencies of every document.
+
+    document_matrix()
+        Gets per-document frequencies as a sparse CSR matrix.
+
+    aligned(frequencies: dict)
+        Aligns frequencies of another corpus to the candidate ids.
+    """
+
+    def __init__(self, keep_documents: bool = True):
+        """
+        Parameters
+        ----------
+        keep_documents : bool
+            Keep frequencies per document. Without them the domain consensus
+            is computed from log_sums and memory does not grow with the
+            number of documents.
+        """
+        self.keep_documents = keep_documents
+        self.words = []
+        self.columns = {}
+        self.n_docs = 0
+
+        self._word_ids = {}
+        self._bigram_ids = {}
+        self._first = array('i')
+        self._second = array('i')
+        self._counts = array('q')
+        self._log_sums = array('d')
+
+        # document-major sparse rows: candidates of the document k are
+        # _doc_candidates[_doc_ptr[k]:_doc_ptr[k + 1]]
+        self._doc_ptr = array('q', [0])
+        self._doc_candidates = array('i')
+        self._doc_counts = array('q')
+
+        self._cache = {}
+
+    def __getstate__(self) -> dict:
+        """Pickle the table without cached numpy copies."""
+        state = self.__dict__.copy()
+        state['_cache'] = {}
+
+        return state
+
+    def __len__(self) -> int:
+        """Return the number of candidates."""
+        return len(self._counts)
+
+    def __contains__(self, bigram: tuple) -> bool:
+        """Check if a bigram is a candidate."""
+        return self.index(bigram) is not None
+
+    @property
+    def first(self) -> np.ndarray:
+        """Word ids of the first words of the candidates."""
+        return self._array('first', self._first, np.int32)
+
+    @property
+    def second(self) -> np.ndarray:
+        """Word ids of the second words of the candidates."""
+        return self._array('second', self._second, np.int32)
+
+    @property
+    def counts(self) -> np.ndarray:
+        """Absolute frequencies of the candidates across all documents."""
+        return self._array('counts', self._counts, np.int64)
+
+    @property
+    def log_sums(self) -> np.ndarray:
+        """Sums of f * log2(f) over the frequencies f per document."""
+        return self._array('log_sums', self._log_sums, np.float64)
+
+    @property
+    def active(self) -> np.ndarray:
+        """True for candidates, which occur in the documents.
+
+        Ids are never reused, so candidates of removed documents stay in the
+        table with the frequency 0 and are not active.
+        """
+        return self.counts > 0
+
+    @property
+    def total(self) -> int:
+        """Number of occurences of all candidates."""
+        return int(self.counts.sum())
+
+    def add_document(self, doc_bigrams_frequency: dict) -> int:
+        """
+        Intern candidates of a document and add their frequencies.
+
+        Parameters
+        ----------
+        doc_bigrams_frequency : dict
+            Bigrams and their absolute frequencies in a text.
+
+        Returns
+        -------
+        doc_id : int
+            Position of the document.
+        """
+        word_ids = self._word_ids
+        bigram_ids = self._bigram_ids
+        counts = self._counts
+        log_sums = self._log_sums
+
+        for (first_word, second_word), value in \
+                doc_bigrams_frequency.items():
+            first_id = word_ids.get(first_word)
+            if first_id is None:
+                first_id = word_ids[first_word] = len(self.words)
+                self.words.append(first_word)
+            second_id = word_ids.get(second_word)
+            if second_id is None:
+                second_id = word_ids[second_word] = len(self.words)
+                self.words.append(second_word)
+
+            packed = first_id << 32 | second_id
+            candidate_id = bigram_ids.get(packed)
+            if candidate_id is None:
+                candidate_id = bigram_ids[packed] = len(counts)
+                self._first.append(first_id)
+                self._second.append(second_id)
+                counts.append(0)
+                log_sums.append(0.0)
+
+            counts[candidate_id] += value
+            if value > 1:
+                log_sums[candidate_id] += value * math.log2(value)
+
+            if self.keep_documents:
+                self._doc_candidates.append(candidate_id)
+                self._doc_counts.append(value)
+
+        if self.keep_documents:
+            self._doc_ptr.append(len(self._doc_candidates))
+
+        self.n_docs += 1
+        self._cache.clear()
+
+        return self.n_docs - 1
+
+    def remove_document(self, doc_bigrams_frequency: dict):
+        """
+        Subtract frequencies of a document, which was added before.
+
+        Only possible for tables, which do not keep per-document
+        frequencies.
+
+        Parameters
+        ----------
+        doc_bigrams_frequency : dict
+            Bigrams and their absolute frequencies in the text.
+
+        Returns
+        -------
+        None.
+        """
+        if self.keep_documents:
+            raise ValueError("documents can not be removed from a table, "
+                             "which keeps per-document frequencies.")
+
+        counts = self._counts
+        log_sums = self._log_sums
+
+        for bigram, value in doc_bigrams_frequency.items():
+            candidate_id = self.index(bigram)
+            if candidate_id is None:
+                raise KeyError(bigram)
+
+            counts[candidate_id] -= value
+            if value > 1:
+                log_sums[candidate_id] -= value * math.log2(value)
+            if counts[candidate_id] == 0:
+                # drop rounding errors of removed documents
+                log_sums[candidate_id] = 0.0
+
+        self.n_docs -= 1
+        self._cache.clear()
+
+    def add_statistics(self, bigrams: list, counts: np.ndarray,
+                       log_sums: np.ndarray, n_docs: int):
+        """
+        Add frequencies and log_sums of several documents at once.
+
+        Only possible for tables, which do not keep per-document
+        frequencies, e.g. to merge tables of parts of a corpus.
+
+        Parameters
+        ----------
+        bigrams : list
+            Candidates.
+        counts : np.ndarray
+            Their absolute frequencies across the documents.
+        log_sums : np.ndarray
+            Their sums of f * log2(f) over the documents.
+        n_docs : int
+            Number of the documents.
+
+        Returns
+        -------
+        None.
+        """
+        if self.keep_documents:
+            raise ValueError("statistics can not be added to a table, "
+                             "which keeps per-document frequencies.")
+
+        word_ids = self._word_ids
+        bigram_ids = self._bigram_ids
+        table_counts = self._counts
+        table_log_sums = self._log_sums
+
+        for (first_word, second_word), value, log_sum in \
+                zip(bigrams, counts.tolist(), log_sums.tolist()):
+            first_id = word_ids.get(first_word)
+            if first_id is None:
+                first_id = word_ids[first_word] = len(self.words)
+                self.words.append(first_word)
+            second_id = word_ids.get(second_word)
+            if second_id is None:
+                second_id = word_ids[second_word] = len(self.words)
+                self.words.append(second_word)
+
+            packed = first_id << 32 | second_id
+            candidate_id = bigram_ids.get(packed)
+            if candidate_id is None:
+                candidate_id = bigram_ids[packed] = len(table_counts)
+                self._first.append(first_id)
+                self._second.append(second_id)
+                table_counts.append(0)
+                table_log_sums.append(0.0)
+
+            table_counts[candidate_id] += value
+            table_log_sums[candidate_id] += log_sum
+
+        self.n_docs += n_docs
+        self._cache.clear()
+
+    def index(self, bigram: tuple):
+        """
+        Get the id of a candidate.
+
+        Parameters
+        ----------
+        bigram : tuple
+            Two words.
+
+        Returns
+        -------
+        candidate_id : int or None
+            None if the bigram is not a candidate.
+        """
+        first_id = self._word_ids.get(bigram[0])
+        second_id = self._word_ids.get(bigram[1])
+
+        if first_id is None or second_id is None:
+            return None
+
+        return self._bigram_ids.get(first_id << 32 | second_id)
+
+    def key(self, candidate_id: int) -> tuple:
+        """Get the bigram of a candidate id."""
+        return (self.words[self._first[candidate_id]],
+                self.words[self._second[candidate_id]])
+
+    def keys(self) -> list:
+        """List bigrams of all candidates in the order of their ids."""
+        words = self.words
+
+        return [(words[first_id], words[second_id]) for first_id, second_id
+                in zip(self._first, self._second)]
+
+    def to_dict(self, column: str) -> dict:
+        """
+        Convert a column into a dictionary.
+
+        Parameters
+        ----------
+        column : str
+            Column name, e.g. 'relevance', or 'counts'.
+
+        Returns
+        -------
+        output : dict
+            Bigrams and their values.
+        """
+        if column == 'counts':
+            values = self._counts.tolist()
+        else:
+            values = self.columns[column].tolist()
+
+        return dict(zip(self.keys(), values))
+
+    def documents(self):
+        """
+        Yield candidate ids and frequencies of every document.
+
+        Yields
+        ------
+        candidate_ids, counts : tuple
+            Two arrays of the same length for a document.
+        """
+        if not self.keep_documents:
+            raise ValueError("the table does not keep per-document "
+                             "frequencies.")
+
+        ptr = self._doc_ptr
+        for k in range(len(ptr) - 1):
+            yield (self._doc_candidates[ptr[k]:ptr[k + 1]],
+                   self._doc_counts[ptr[k]:ptr[k + 1]])
+
+    def document_matrix(self) -> tuple:
+        """
+        Get per-document frequencies as a sparse matrix in the CSR format.
+
+        Rows are documents and columns are candidate ids: the frequencies of
+        the document k are data[indptr[k]:indptr[k + 1]] and belong to the
+        candidates indices[indptr[k]:indptr[k + 1]].
+
+        Returns
+        -------
+        indptr, indices, data : tuple
+            indptr : np.ndarray
+                Row offsets, n_docs + 1 values.
+            indices : np.ndarray
+                Candidate ids.
+            data : np.ndarray
+                Frequencies.
+        """
+        if not self.keep_documents:
+            raise ValueError("the table does not keep per-document "
+                             "frequencies.")
+
+        return (self._array('doc_ptr', self._doc_ptr, np.int64),
+                self._array('doc_candidates', self._doc_candidates, np.int32),
+                self._array('doc_counts', self._doc_counts, np.int64))
+
+    def aligned(self, frequencies: dict, start: int = 0) -> np.ndarray:
+        """
+        Align frequencies of another corpus to the candidate ids.
+
+        Parameters
+        ----------
+        frequencies : dict or CountMinSketch
+            Bigrams and their absolute frequencies, e.g. in the reference
+            corpus.
+        start : int
+            Only candidates with an id >= start are aligned.
+
+        Returns
+        -------
+        output : np.ndarray
+            Frequency for each candidate id from start on, 0 if a candidate
+            is missing.
+        """
+        keys = self.keys() if start == 0 else \
+            [self.key(candidate_id) for candidate_id in
+             range(start, len(self))]
+
+        if not isinstance(frequencies, dict):
+            # approximate frequencies are estimated for all keys at once
+            return frequencies.query(keys)
+
+        get = frequencies.get
+
+        return np.fromiter((get(bigram, 0) for bigram in keys),
+                           dtype=np.int64, count=len(keys))
+
+    def _array(self, name: str, values: array, dtype) -> np.ndarray:
+        """Return a numpy copy of a growing array, cached until it grows."""
+        output = self._cache.get(name)
+
+        if output is None:
+            output = np.frombuffer(values, dtype=dtype).copy() \
+                if len(values) else np.zeros(0, dtype=dtype)
+            self._cache[name] = output
+
+        return output
+
+
+##############################################################################
+#                          A CLASS DEMONSTRATION                             #
+##############################################################################
+
+
+                 ##########################
+                 ###   DEMONSTRATION   ####
+                 ##########################
+
+
+def candidate_table_demo():
+    """Demonstrate how CandidateTable class can be used."""
+    print("\n")
+    print("-------------------------------------")
+    print("CandidateTable Class Demonstration")
+    print("-------------------------------------")
+    print("\n")
+
+    candidates_per_doc = [
+        {('machine', 'learning'): 1, ('learning', 'data'): 1,
+         ('data', 'outcome'): 1},
+        {('machine', 'learning'): 1, ('learning', 'analyses'): 1,
+         ('analyses', 'data'): 1, ('data', 'predicts'): 1,
+         ('predicts', 'outcome'): 1}]
+
+    table = CandidateTable()
+    for doc in candidates_per_doc:
+        table.add_document(doc)
+
+    print('\t', "Words and their ids: ")
+    print("\n")
+    print(list(enumerate(table.words)))
+    print("\n")
+    print('\t', "Candidates as pairs of word ids and their frequencies: ")
+    print("\n")
+    print(list(zip(table.first.tolist(), table.second.tolist(),
+                   table.counts.tolist())))
+    print("\n")
+    print("==================================================================")
+    print("\n")
+    print("\n")
+    print("TESTING BEGINS...")
+    print("\n")
+
+
+if __name__ == "__main__":
+    candidate_table_demo()
+    # the tests are kept in test_CandidateTable.py, so importing the
+    # class does not load unittest
+    import unittest
+    from test_CandidateTable import CandidateTableTest
+    unittest.main()
+    print("\n")
+    print("CandidateTable Class testing is done!")
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Datum: 17.10.2026
+# Mac OS
+"""
+Zweck: die Ergebnisse der Programmschritte zu sichern, damit ein
+abgebrochener Lauf fortgesetzt werden kann.
+
+Autorin: Daryna Ivanova
+"""
+
+import os
+import pickle
+import hashlib
+import tempfile
+
+
+# Bump whenever the content of a checkpoint changes.
+CHECKPOINT_VERSION = 1
+
+
+class Checkpoints():
+    """
+    Results of program stages, which a later run can resume from.
+
+    Every stage is stored in '<checkpoint_dir>/<stage>.pickle' together with
+    a key. A key covers the inputs and the configuration of the stage and
+    the key of the stage before, so a changed corpus also invalidates all
+    stages after the candidate selection. Checkpoints are only written and
+    loaded with resume, other runs cost no extra disk space.
+
+    Methods
+    -------
+    key(*parts)
+        Creates a key from the previous key, inputs and configuration.
+
+    load(stage: str, key: str)
+        Loads the result of a stage, if it was stored with this key.
+
+    store(stage: str, key: str, value)
+        Writes the result of a stage.
+    """
+
+    def __init__(self, checkpoint_dir: str = 'Cache/checkpoints',
+                 resume: bool = False):
+        """
+        Parameters
+        ----------
+        checkpoint_dir : str
+            Name of a directory, where the checkpoints are located.
+        resume : bool
+            Store and load results. Without it every stage is computed again
+            and nothing is written.
+        """
+        self.checkpoint_dir = os.path.join(os.getcwd(), checkpoint_dir)
+        self.resume = resume
+
+    def key(self, *parts) -> str:
+        """
+        Create a key.
+
+        Parameters
+        ----------
+        *parts
+            Key of the previous stage, fingerprints of input files and
+            parameters of the stage.
+
+        Returns
+        -------
+        key : str
+            A hex digest of all the parts.
+        """
+        digest = hashlib.sha1(str(CHECKPOINT_VERSION).encode('utf-8'))
+
+        for part in parts:
+            digest.update(b'\x00')
+            digest.update(repr(part).encode('utf-8'))
+
+        return digest.hexdigest()
+
+    def load(self, stage: str, key: str):
+        """
+        Load the result of a stage.
+
+        Parameters
+        ----------
+        stage : str
+            Name of the stage.
+        key : str
+            Key of the current inputs and configuration.
+
+        Returns
+        -------
+        value : object or None
+            The stored result, None without resume, if there is no
+            checkpoint or if it was stored with another key.
+        """
+        checkpoint_file = self._path(stage)
+
+        if not self.resume or not os.path.isfile(checkpoint_file):
+            return None
+
+        try:
+            with open(checkpoint_file, 'rb') as f:
+                checkpoint = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            # a damaged checkpoint is computed again
+            return None
+
+        if checkpoint.get('key') != key:
+            return None
+
+        return checkpoint['value']
+
+    def store(self, stage: str, key: str, value):
+        """
+        Write the result of a stage.
+
+        The file is written under a temporary name first, so an interrupted
+        run never leaves a half-written checkpoint behind. Without resume
+        nothing is written.
+
+        Parameters
+        ----------
+        stage : str
+            Name of the stage.
+        key : str
+            Key of the inputs and configuration of the result.
+        value : object
+            The result, anything which can be pickled.
+
+        Returns
+        -------
+        None.
+        """
+        if not self.resume:
+            return
+
+        os.makedirs(self.checkpoint_dir, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.checkpoint_dir, suffix='.tmp')
+
+        with os.fdopen(fd, 'wb', buffering=1024 * 1024) as f:
+            pickle.dump({'key': key, 'value': value}, f,
+                        protocol=pickle.HIGHEST_PROTOCOL)
+
+        os.replace(tmp, self._path(stage))
+
+    def _path(self, stage: str) -> str:
+        """Return the file name of a checkpoint."""
+        return os.path.join(self.checkpoint_dir, stage + '.pickle')
+
+
+def input_fingerprint(path: str) -> tuple:
+    """
+    Identify an input file or directory by names, sizes and modification
+    times, without reading it.
+
+    Parameters
+    ----------
+    path : str
+        A file or a directory, relative to the current directory.
+
+    Returns
+    -------
+    fingerprint : tuple
+        Changes whenever a file is added, removed or modified. Files of a
+        directory are listed in the order of their names, which is the
+        order they are read in.
+    """
+    full_path = os.path.join(os.getcwd(), path)
+
+    if os.path.isdir(full_path):
+        return tuple(sorted((entry.name, entry.stat().st_size,
+                             entry.stat().st_mtime_ns)
+                            for entry in os.scandir(full_path)))
+
+    stat = os.stat(full_path)
+
+    return (full_path, stat.st_size, stat.st_mtime_ns)
+
+
+##############################################################################
+#                          A CLASS DEMONSTRATION                             #
+##############################################################################
+
+
+                 ##########################
+                 ###   DEMONSTRATION   ####
+                 ##########################
+
+
+def checkpoints_demo():
+    """Demonstrate how Checkpoints class can be used."""
+    print("\n")
+    print("-------------------------------------")
+    print("Checkpoints Class Demonstration")
+    print("-------------------------------------")
+    print("\n")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        checkpoints = Checkpoints(tmp, resume=True)
+        key = checkpoints.key(input_fingerprint(tmp), 3)
+
+        print('\t', "Before the stage is stored: ")
+        print("\n")
+        print(checkpoints.load('candidates', key))
+        print("\n")
+
+        checkpoints.store('candidates', key, {('machine', 'learning'): 2})
+        print('\t', "After the stage is stored: ")
+        print("\n")
+        print(checkpoints.load('candidates', key))
+
+    print("\n")
+    print("==================================================================")
+    print("\n")
+    print("\n")
+    print("TESTING BEGINS...")
+    print("\n")
+
+
+if __name__ == "__main__":
+    checkpoints_demo()
+    # the tests are kept in test_Checkpoints.py, so importing the
+    # class does not load unittest
+    import unittest
+    from test_Checkpoints import CheckpointsTest
+    unittest.main()
+    print("\n")
+    print("Checkpoints Class testing is done!")
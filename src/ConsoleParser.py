@@ -8,9 +8,7 @@ Zweck: Programmauführung in der Kommandozeile. Hilfsklasse.
 Autorin: Daryna Ivanova
 """
 
-import unittest
 import argparse
-import mock
 
 
 class ConsoleParser():
@@ -20,7 +18,8 @@ class ConsoleParser():
     Methods
     -------
     parse()
-        Defines required arguments and parses them.
+        Defines required arguments and parses them. All the parsed arguments,
+        including optional ones, are stored in the attribute args.
     """
 
     def parse(self) -> tuple:
@@ -42,16 +41,103 @@ class ConsoleParser():
                                 domain consensus scores.')
         parser.add_argument('theta', type=str, help='A threshold needed to \
                             be reached for a candidate to refer to the final \
-                                terminology.')
+                                terminology. "-" for none, with --top-k.')
         parser.add_argument('goldstandard_file', type=str, help='A txt file \
                             with the gold terminology')
+        parser.add_argument('--workers', type=int, default=1, help='Number \
+                            of processes, which read the corpus texts.')
+        parser.add_argument('--stream', action='store_true', help='Reduce \
+                            the corpus texts as they are read instead of \
+                            keeping every document in memory.')
+        parser.add_argument('--memory-target', type=int, default=None,
+                            help='Memory in MB, which texts being read in \
+                            the streaming mode may take (with --stream).')
+        parser.add_argument('--state', type=str, default=None, help='A file \
+                            with the saved corpus state. Only texts added to \
+                            or deleted from the corpus since the last run \
+                            are processed.')
+        parser.add_argument('--no-document-cache', action='store_true',
+                            help='Tokenize and tag every text again instead \
+                            of reusing candidates of unchanged texts.')
+        parser.add_argument('--text-output', action='store_true',
+                            help='Also write a txt file with final terms \
+                            for every alpha/theta combination.')
+        parser.add_argument('--serve', type=str, default=None,
+                            metavar='ADDRESS', help='Keep the statistics \
+                            in memory and answer requests on host:port or \
+                            on a Unix socket path.')
+        parser.add_argument('--dedup', type=float, default=None,
+                            metavar='J', help='Skip texts, which are \
+                            near-duplicates (estimated Jaccard similarity \
+                            of 5-word shingles >= J) of an earlier text, \
+                            see src/NearDuplicates.py.')
+        parser.add_argument('--shard', type=_shard, default=None,
+                            metavar='I/K', help='Only handle the shard I of \
+                            K of the corpus (documents I, I + K, ...), \
+                            together with --partial-out.')
+        parser.add_argument('--partial-out', type=str, default=None,
+                            metavar='FILE', help='With --shard, write the \
+                            candidate statistics of the shard to FILE and \
+                            stop, see src/PartialStatistics.py.')
+        parser.add_argument('--merge', type=str, nargs='+', default=None,
+                            metavar='FILE', help='Merge partial files of all \
+                            shards instead of reading the corpus.')
+        parser.add_argument('--sketch-epsilon', type=float, default=None,
+                            metavar='EPSILON', help='Count reference \
+                            bigrams approximately in a Count-Min sketch: a \
+                            frequency is at most EPSILON * total too large. \
+                            Memory is about 22 / EPSILON bytes per row.')
+        parser.add_argument('--sketch-delta', type=float, default=0.01,
+                            metavar='DELTA', help='Probability, that a \
+                            sketch frequency exceeds this error (default: \
+                            0.01).')
+        parser.add_argument('--top-k', type=int, default=None, metavar='K',
+                            help='Also choose the K best terms of every \
+                            alpha and write them to Output/top_<K>_<alpha>\
+                            .txt.')
+        parser.add_argument('--export-model', type=str, default=None,
+                            metavar='FILE', help='Write the statistics of \
+                            the corpus to a model file, which scores single \
+                            new texts, see src/FrozenModel.py.')
+        parser.add_argument('--resume', action='store_true', help='Save \
+                            results of stages to Cache/checkpoints and load \
+                            them, if the corpus, the data and the options \
+                            did not change since they were stored.')
+        parser.add_argument('--report', type=str, default=None, help='A \
+                            json file for time and memory of every stage \
+                            and counters of the run.')
+        parser.add_argument('--trace-memory', action='store_true',
+                            help='Trace memory allocations of every stage \
+                            (slower).')
+        parser.add_argument('--profile-stage', type=str, default=None,
+                            choices=['candidates', 'reference', 'relevance',
+                                     'consensus', 'state', 'grid',
+                                     'decision', 'top_k', 'curves'],
+                            help='Write cProfile data of this stage to \
+                            profile_<stage>.prof.')
 
         args = parser.parse_args()
 
+        if args.memory_target is not None and not args.stream:
+            parser.error("--memory-target is only used with --stream")
+
+        if args.shard is not None and args.partial_out is None:
+            parser.error("--shard needs --partial-out for the statistics "
+                         "of the shard")
+
+        # optional arguments are kept for the caller
+        self.args = args
+
         # split alpha values
         alphas_list_str = args.alpha.split(', ')
         thetas_list_str = args.theta.split(', ')
 
+        # the k best terms can be chosen without any theta
+        if args.theta.strip() == '-':
+            if args.top_k is None:
+                parser.error("theta '-' is only allowed with --top-k")
+            thetas_list_str = []
+
         alphas_list = []
         thetas_list = []
 
@@ -67,29 +153,22 @@ class ConsoleParser():
         return output
 
 
-##############################################################################
-#                    A CLASS TESTING AND DEMONSTRATION                       #
-##############################################################################
-
+def _shard(value: str) -> tuple:
+    """Parse 'I/K' into (I, K) with 0 <= I < K."""
+    try:
+        index, count = (int(part) for part in value.split('/'))
+    except ValueError:
+        raise argparse.ArgumentTypeError("a shard is given as I/K, e.g. 0/4")
 
-                 ###################
-                 ###   TESTING   ###
-                 ###################
+    if not 0 <= index < count:
+        raise argparse.ArgumentTypeError("a shard I/K needs 0 <= I < K")
 
+    return index, count
 
-class ConsoleParserTest(unittest.TestCase):
-    """Test ConsoleParser class units."""
 
-    @mock.patch('argparse.ArgumentParser.parse_args',
-                return_value=argparse.Namespace(corpus="clt", alpha="0.2",
-                                                theta="0.4",
-                                                goldstandard_file="gold.txt"))
-    def test_parse(self, mock_args):
-        """Test that the command-line arguments are parsed."""
-        res = ConsoleParser().parse()
-        self.assertEqual(res, ("clt", [0.2], [0.4], "gold.txt"),
-                         "arguments are not parsed.")
-        print("Arguments were successfully parsed.")
+##############################################################################
+#                          A CLASS DEMONSTRATION                             #
+##############################################################################
 
 
                  ##########################
@@ -125,6 +204,10 @@ def console_parser_demo():
 
 if __name__ == "__main__":
     console_parser_demo()
+    # the tests are kept in test_ConsoleParser.py, so importing the
+    # class does not load unittest
+    import unittest
+    from test_ConsoleParser import ConsoleParserTest
     unittest.main()
     print("\n")
     print("ConsoleParser Class testing is done!")
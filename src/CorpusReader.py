@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Datum: 17.10.2026
+# Mac OS
+"""
+Zweck: die Texte des Domänekorpus aus Verzeichnissen und Archiven zu lesen.
+
+Autorin: Daryna Ivanova
+"""
+
+import os
+import io
+import gzip
+import json
+import hashlib
+import tarfile
+import zipfile
+import tempfile
+
+
+# Suffixes of the supported archives
+_TAR = ('.tar', '.tar.gz', '.tgz', '.tar.bz2', '.tbz2', '.tar.xz', '.txz')
+_ZIP = ('.zip',)
+_JSONL = ('.jsonl', '.jsonl.gz')
+
+
+class CorpusReader():
+    """
+    Read documents of a corpus without extracting it to the disk.
+
+    A corpus is a directory with txt files, a tar archive (also compressed
+    with gzip, bzip2 or xz), a zip archive or a JSONL file (also gzipped)
+    with a text per line. Tar and JSONL files are read sequentially through
+    a large buffer, so they can be streamed from slow network storage.
+
+    Names of documents stay the same when other documents are added or
+    removed: a JSONL record without an 'id' is named by a digest of its
+    text. A name, which occurs again in an archive, gets the number of its
+    occurrence, e.g. '<id>#2'.
+
+    Methods
+    -------
+    documents()
+        Yields name and content of every document.
+
+    mean_document_size()
+        Estimates the size of a document without reading the corpus.
+
+    is_archive(corpus: str)
+        Checks if a corpus is an archive.
+    """
+
+    def __init__(self, corpus: str, text_field: str = 'text',
+                 buffer_size: int = 1024 * 1024):
+        """
+        Parameters
+        ----------
+        corpus : str
+            Name of a directory or an archive, relative to the current
+            directory.
+        text_field : str
+            Field of a JSONL record, which contains the text.
+        buffer_size : int
+            Size of the read buffer for archives in bytes.
+        """
+        self.corpus = corpus
+        self.path = os.path.join(os.getcwd(), corpus)
+        self.text_field = text_field
+        self.buffer_size = buffer_size
+
+    @staticmethod
+    def is_archive(corpus: str) -> bool:
+        """Check if a corpus is an archive and not a directory."""
+        return corpus.lower().endswith(_TAR + _ZIP + _JSONL)
+
+    def documents(self):
+        """
+        Yield name and content of every document.
+
+        Documents of a directory are yielded in the order of their names,
+        documents of an archive in the order they are stored. Names are
+        unique.
+
+        Yields
+        ------
+        name, content : tuple
+            name : str
+                Path of a txt file or '<archive>/<member>' for archives.
+            content : bytes
+                Content of the document.
+        """
+        lower = self.path.lower()
+
+        if os.path.isdir(self.path):
+            for file in sorted(os.listdir(self.path)):
+                file_path = self.path + '/' + file
+                yield file_path, read_file(file_path)
+        elif lower.endswith(_TAR):
+            yield from _unique_names(self._tar_documents())
+        elif lower.endswith(_ZIP):
+            yield from _unique_names(self._zip_documents())
+        elif lower.endswith(_JSONL):
+            yield from _unique_names(self._jsonl_documents())
+        else:
+            raise ValueError("unknown corpus format: " + self.corpus)
+
+    def mean_document_size(self) -> float:
+        """
+        Estimate the size of a document without reading the corpus.
+
+        Returns
+        -------
+        mean_size : float or None
+            Mean size in bytes, None if it cannot be known in advance (tar
+            and JSONL files).
+        """
+        if os.path.isdir(self.path):
+            sizes = [entry.stat().st_size for entry in os.scandir(self.path)]
+        elif self.path.lower().endswith(_ZIP):
+            with zipfile.ZipFile(self.path) as archive:
+                sizes = [info.file_size for info in archive.infolist()
+                         if not info.is_dir()]
+        else:
+            return None
+
+        return sum(sizes) / len(sizes) if sizes else None
+
+    def _tar_documents(self):
+        """Stream regular files of a tar archive."""
+        with open(self.path, 'rb', buffering=self.buffer_size) as f:
+            # 'r|*' reads the archive strictly sequentially
+            with tarfile.open(fileobj=f, mode='r|*') as archive:
+                for member in archive:
+                    if not member.isfile() or _hidden(member.name):
+                        continue
+                    yield (self.path + '/' + member.name,
+                           archive.extractfile(member).read())
+
+    def _zip_documents(self):
+        """Read files of a zip archive in the stored order."""
+        with zipfile.ZipFile(self.path) as archive:
+            for info in archive.infolist():
+                if info.is_dir() or _hidden(info.filename):
+                    continue
+                yield self.path + '/' + info.filename, archive.read(info)
+
+    def _jsonl_documents(self):
+        """Read a text per line of a (gzipped) JSONL file."""
+        if self.path.lower().endswith('.gz'):
+            f = io.BufferedReader(gzip.open(self.path, 'rb'),
+                                  buffer_size=self.buffer_size)
+        else:
+            f = open(self.path, 'rb', buffering=self.buffer_size)
+
+        with f:
+            for line in f:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                content = record[self.text_field].encode('utf-8')
+                if 'id' in record:
+                    name = str(record['id'])
+                else:
+                    # independent of the position in the file
+                    name = hashlib.sha1(content).hexdigest()
+                yield self.path + '/' + name, content
+
+
+def read_file(file_path: str) -> bytes:
+    """
+    Read a whole file with a single unbuffered read.
+
+    Parameters
+    ----------
+    file_path : str
+        Path of a file.
+
+    Returns
+    -------
+    content : bytes
+        Content of the file.
+    """
+    with open(file_path, 'rb', buffering=0) as f:
+        return f.readall()
+
+
+def _unique_names(documents):
+    """Number repeated names of documents by their occurrence."""
+    occurrences = {}
+
+    for name, content in documents:
+        occurrences[name] = occurrences.get(name, 0) + 1
+        if occurrences[name] > 1:
+            name += '#' + str(occurrences[name])
+        yield name, content
+
+
+def _hidden(name: str) -> bool:
+    """Check if an archive member is Mac OS metadata and not a text."""
+    base_name = name.rsplit('/', 1)[-1]
+
+    return base_name.startswith('._') or name.startswith('__MACOSX/')
+
+
+##############################################################################
+#                          A CLASS DEMONSTRATION                             #
+##############################################################################
+
+
+                 ##########################
+                 ###   DEMONSTRATION   ####
+                 ##########################
+
+
+def corpus_reader_demo():
+    """Demonstrate how CorpusReader class can be used."""
+    print("\n")
+    print("-------------------------------------")
+    print("CorpusReader Class Demonstration")
+    print("-------------------------------------")
+    print("\n")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        with zipfile.ZipFile(os.path.join(tmp, 'texts.zip'), 'w') as f:
+            f.writestr('a.txt', 'Machine learning predicts the outcome.')
+            f.writestr('b.txt', 'Language processing provides data.')
+
+        print('\t', "Documents of texts.zip: ")
+        print("\n")
+        for name, content in CorpusReader(tmp + '/texts.zip').documents():
+            print(name.rsplit('/', 1)[-1], content)
+
+    print("\n")
+    print("==================================================================")
+    print("\n")
+    print("\n")
+    print("TESTING BEGINS...")
+    print("\n")
+
+
+if __name__ == "__main__":
+    corpus_reader_demo()
+    # the tests are kept in test_CorpusReader.py, so importing the
+    # class does not load unittest
+    import unittest
+    from test_CorpusReader import CorpusReaderTest
+    unittest.main()
+    print("\n")
+    print("CorpusReader Class testing is done!")
@@ -0,0 +1,580 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Datum: 17.10.2026
+# Mac OS
+"""
+Zweck: den Domänekorpus schrittweise zu aktualisieren.
+
+Autorin: Daryna Ivanova
+"""
+
+import os
+import pickle
+import hashlib
+import tempfile
+import numpy as np
+
+from array import array
+
+try:
+    from src.CandidateSelection import CandidateSelection, PIPELINE_VERSION
+    from src.CandidateTable import CandidateTable
+    from src.CorpusReader import CorpusReader
+    from src.DomainConsensus import DomainConsensus
+    from src.DomainRelevance import DomainRelevance
+except ModuleNotFoundError:
+    from CandidateSelection import CandidateSelection, PIPELINE_VERSION
+    from CandidateTable import CandidateTable
+    from CorpusReader import CorpusReader
+    from DomainConsensus import DomainConsensus
+    from DomainRelevance import DomainRelevance
+
+
+class CorpusState():
+    """
+    Domain corpus statistics, which are updated document by document.
+
+    The state keeps a CandidateTable without per-document rows together with
+    the candidates of every document, so documents can be added and removed
+    later. A document, which changed since it was added (size and
+    modification time of a file, content of an archive member or a received
+    text), is removed and added again. The consensus of a candidate only
+    depends on its own frequencies, therefore it is recomputed only for
+    candidates of changed documents.
+    Domain Relevance depends on the number of occurences of all candidates
+    and is recomputed for all of them with one vectorized operation.
+
+    A saved state is only loaded for the same PIPELINE_VERSION, stopwords
+    and NLTK data, otherwise it is built again from the corpus. Aligned
+    reference frequencies are reused only for the same reference.
+
+    Attributes
+    ----------
+    table : CandidateTable
+        Candidates with the columns 'probability', 'relevance' and
+        'consensus'.
+    documents : dict
+        Document name and candidate ids and frequencies of the document.
+    versions : dict
+        Document name and the version, which was added.
+
+    Methods
+    -------
+    add_documents(files: list, workers: int = 1)
+        Reads txt files and adds their candidates.
+
+    add_contents(documents: dict, workers: int = 1)
+        Adds documents, which were already read, e.g. received texts.
+
+    remove_documents(files: list)
+        Removes candidates of documents, which were added before.
+
+    sync(folder_name: str, workers: int = 1)
+        Adds new and removes deleted txt files of a directory or documents
+        of an archive.
+
+    add_counts(name: str, doc_bigrams_frequency: dict)
+        Adds candidates of a document, which were extracted before.
+
+    save()
+        Writes the changes since the last save to the state file.
+    """
+
+    def __init__(self, reference_freq: dict, reference_total: int,
+                 state_file: str = None, filter_freq_n: int = 3,
+                 configuration: tuple = None):
+        """
+        Parameters
+        ----------
+        reference_freq : dict or CountMinSketch
+            Reference candidates and their (approximate) absolute
+            frequencies.
+        reference_total : int
+            Number of occurences of all reference candidates.
+        state_file : str
+            A file, where the state is saved. An existing file is loaded.
+        filter_freq_n : int
+            Filter out the words, which occur less than n times in a text.
+        configuration : tuple
+            PIPELINE_VERSION and CandidateSelection.data_fingerprint(),
+            computed for a state file if not given.
+        """
+        if configuration is None and state_file is not None:
+            configuration = (PIPELINE_VERSION,) + \
+                CandidateSelection().data_fingerprint()
+
+        self.reference_freq = reference_freq
+        self.reference_total = reference_total
+        self.state_file = state_file
+        self.filter_freq_n = filter_freq_n
+        self.configuration = configuration
+
+        self.table = CandidateTable(keep_documents=False)
+        self.documents = {}
+        self.versions = {}
+        self._reference_counts = np.zeros(0, dtype=np.int64)
+
+        # changes since the last save and the journal they are appended to
+        self._changes = []
+        self._generation = None
+        self._journal_end = 0
+
+        if state_file is not None and os.path.isfile(state_file):
+            with open(state_file, 'rb') as f:
+                saved = pickle.load(f)
+
+            if saved['filter_freq_n'] != filter_freq_n:
+                raise ValueError("the state was created with filter_freq_n = "
+                                 + str(saved['filter_freq_n']))
+
+            if saved.get('configuration') == configuration:
+                self._load(saved)
+            else:
+                # candidates of another program version or NLTK data
+                print("The state " + state_file + " was created with other "
+                      "NLTK data or another program version, it is built "
+                      "again.")
+
+    def add_documents(self, files: list, workers: int = 1, cache=None,
+                      **options) -> int:
+        """
+        Read txt files and add their candidates.
+
+        Files, which are already in the state and did not change since, are
+        skipped. A changed file replaces its earlier version.
+
+        Parameters
+        ----------
+        files : list
+            Paths of the txt files.
+        workers : int
+            Number of processes, which handle the documents.
+        cache : ArtifactCache
+            Reuse candidates of documents, which were handled before.
+        **options
+            Needed for method testing.
+
+        Returns
+        -------
+        n_added : int
+            Number of added documents, also of changed ones.
+        """
+        versions = {file: _file_version(file) for file in files}
+        stale = [file for file in files if self._stale(file, versions[file])]
+        files = [file for file in files if file in stale or
+                 file not in self.documents]
+
+        # all candidates first, so a failure leaves the state unchanged
+        docs = list(CandidateSelection().iter_file_candidates(
+            files, self.filter_freq_n, workers=workers, cache=cache,
+            **options))
+
+        changed = [self._remove(file) for file in stale]
+        changed.extend(self._add(file, doc, versions[file]) for file, doc in
+                       zip(files, docs))
+        self._update_scores(changed)
+
+        return len(files)
+
+    def add_contents(self, documents: dict, workers: int = 1, cache=None,
+                     **options) -> int:
+        """
+        Add documents, which were already read, e.g. received texts.
+
+        Documents, which are already in the state with the same content, are
+        skipped. A changed content replaces the earlier one.
+
+        Parameters
+        ----------
+        documents : dict
+            Document name and its content as bytes.
+        workers : int
+            Number of processes, which handle the documents.
+        cache : ArtifactCache
+            Reuse candidates of documents, which were handled before.
+        **options
+            Needed for method testing.
+
+        Returns
+        -------
+        n_added : int
+            Number of added documents, also of changed ones.
+        """
+        versions = {name: _content_version(content) for name, content in
+                    documents.items()}
+        stale = [name for name in documents
+                 if self._stale(name, versions[name])]
+        names = [name for name in documents if name in stale or
+                 name not in self.documents]
+
+        # all candidates first, so a failure leaves the state unchanged
+        docs = list(CandidateSelection().iter_text_candidates(
+            (documents[name] for name in names), self.filter_freq_n,
+            workers=workers, cache=cache, **options))
+
+        changed = [self._remove(name) for name in stale]
+        changed.extend(self._add(name, doc, versions[name]) for name, doc in
+                       zip(names, docs))
+        self._update_scores(changed)
+
+        return len(names)
+
+    def add_counts(self, name: str, doc_bigrams_frequency: dict):
+        """
+        Add candidates of a document, which were extracted before.
+
+        Parameters
+        ----------
+        name : str
+            Document name.
+        doc_bigrams_frequency : dict
+            Bigrams and their absolute frequencies in the text.
+
+        Returns
+        -------
+        None.
+        """
+        if name in self.documents:
+            raise ValueError("document already added: " + name)
+
+        self._update_scores([self._add(name, doc_bigrams_frequency)])
+
+    def remove_documents(self, files: list) -> int:
+        """
+        Remove candidates of documents, which were added before.
+
+        Parameters
+        ----------
+        files : list
+            Document names, e.g. paths of the txt files.
+
+        Returns
+        -------
+        n_removed : int
+            Number of removed documents.
+        """
+        changed = [self._remove(file) for file in files]
+        self._update_scores(changed)
+
+        return len(changed)
+
+    def sync(self, folder_name: str, workers: int = 1, cache=None,
+             **options) -> tuple:
+        """
+        Add new and remove deleted txt files of a directory.
+
+        A changed file is removed and added again. An archive (see
+        CorpusReader) is read completely, but only its new and changed
+        documents are tokenized and tagged. The state is changed only after
+        all of them are handled, so a failure leaves it unchanged.
+
+        Parameters
+        ----------
+        folder_name : str
+            Name of a directory, where domain corpus texts are located, or
+            of an archive.
+        workers : int
+            Number of processes, which handle the new documents.
+        cache : ArtifactCache
+            Reuse candidates of documents, which were handled before.
+        **options
+            Needed for method testing.
+
+        Returns
+        -------
+        n_added, n_removed : tuple
+            Number of added and removed documents, a changed document is
+            counted in both.
+        """
+        if CorpusReader.is_archive(folder_name):
+            return self._sync_archive(folder_name, workers, cache, **options)
+
+        path = os.getcwd() + '/' + folder_name
+        files = [path + '/' + file for file in sorted(os.listdir(path))]
+        present = {file: _file_version(file) for file in files}
+        n_stale = sum(self._stale(file, present[file]) for file in files)
+
+        # changed files are replaced by add_documents
+        n_added = self.add_documents(files, workers=workers, cache=cache,
+                                     **options)
+        n_removed = self.remove_documents(
+            [file for file in self.documents if file.startswith(path + '/')
+             and file not in present])
+
+        return n_added, n_removed + n_stale
+
+    def save(self):
+        """
+        Write the changes since the last save to the state file.
+
+        Changes are appended to a journal '<state_file>.journal', so a
+        save costs time and space in proportion to the added and removed
+        documents and not to the whole state. The journal is replayed when
+        the state is loaded. Once it grows larger than half of the state
+        file, the whole state is written again and the journal is emptied.
+
+        Returns
+        -------
+        None.
+        """
+        journal_file = self.state_file + '.journal'
+
+        if self._generation is None or not os.path.isfile(journal_file) \
+                or not os.path.isfile(self.state_file) \
+                or os.path.getsize(journal_file) > \
+                os.path.getsize(self.state_file) // 2:
+            self._write_state()
+        elif self._changes:
+            with open(journal_file, 'r+b') as f:
+                # a torn record of an interrupted save is overwritten
+                f.truncate(self._journal_end)
+                f.seek(self._journal_end)
+                pickle.dump(self._changes, f,
+                            protocol=pickle.HIGHEST_PROTOCOL)
+                f.flush()
+                os.fsync(f.fileno())
+                self._journal_end = f.tell()
+
+        self._changes = []
+
+    def _write_state(self):
+        """Write the whole state and start an empty journal."""
+        self._generation = os.urandom(16).hex()
+        directory = os.path.dirname(os.path.abspath(self.state_file))
+
+        # the state first: a journal of another generation is ignored
+        for file_name, value in (
+                (self.state_file,
+                 {'table': self.table, 'documents': self.documents,
+                  'versions': self.versions,
+                  'filter_freq_n': self.filter_freq_n,
+                  'configuration': self.configuration,
+                  'reference': self._reference(),
+                  'reference_counts': self._reference_counts,
+                  'generation': self._generation}),
+                (self.state_file + '.journal', self._generation)):
+            fd, tmp = tempfile.mkstemp(dir=directory, suffix='.tmp')
+
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+                self._journal_end = f.tell()
+
+            os.replace(tmp, file_name)
+
+    def _load(self, saved: dict):
+        """Take over a saved state and apply its journal."""
+        self.table = saved['table']
+        self.documents = saved['documents']
+        self.versions = saved.get('versions', {})
+        self._generation = saved.get('generation')
+
+        # aligned reference frequencies stay valid for the same reference
+        if saved['reference'] == self._reference():
+            self._reference_counts = saved['reference_counts']
+
+        self._replay_journal()
+        self._update_scores(np.arange(len(self.table)))
+
+    def _replay_journal(self):
+        """Apply the changes, which were saved after the state file."""
+        journal_file = self.state_file + '.journal'
+        if not os.path.isfile(journal_file):
+            return
+
+        with open(journal_file, 'rb') as f:
+            try:
+                generation = pickle.load(f)
+            except (EOFError, pickle.UnpicklingError):
+                return
+            if generation != self._generation:
+                # the changes are already in the state file
+                return
+            self._journal_end = f.tell()
+
+            while True:
+                try:
+                    changes = pickle.load(f)
+                except (EOFError, pickle.UnpicklingError):
+                    # end of the journal or a torn record
+                    break
+
+                for change in changes:
+                    if change[0] == 'add':
+                        self._add(*change[1:])
+                    else:
+                        self._remove(change[1])
+                self._journal_end = f.tell()
+
+        self._changes = []
+
+    def _sync_archive(self, corpus: str, workers: int, cache,
+                      **options) -> tuple:
+        """Add new and changed, remove deleted documents of an archive."""
+        reader = CorpusReader(corpus)
+        versions = {}
+        names = []
+
+        def read_documents():
+            for name, content in reader.documents():
+                version = versions[name] = _content_version(content)
+                if name not in self.documents or self._stale(name, version):
+                    names.append(name)
+                    yield content
+
+        # all candidates first, so a failure leaves the state unchanged
+        docs = list(CandidateSelection().iter_text_candidates(
+            read_documents(), self.filter_freq_n, workers=workers,
+            cache=cache, **options))
+
+        stale = [name for name in names if name in self.documents]
+        deleted = [name for name in self.documents
+                   if name.startswith(reader.path + '/') and
+                   name not in versions]
+
+        changed = [self._remove(name) for name in stale + deleted]
+        changed.extend(self._add(name, doc, versions[name]) for name, doc in
+                       zip(names, docs))
+        self._update_scores(changed)
+
+        return len(names), len(stale) + len(deleted)
+
+    def _add(self, name: str, doc_bigrams_frequency: dict,
+             version=None) -> array:
+        """Add a document to the table and return its candidate ids."""
+        self.table.add_document(doc_bigrams_frequency)
+
+        candidate_ids = array('i', [self.table.index(bigram) for bigram in
+                                    doc_bigrams_frequency])
+        counts = array('q', doc_bigrams_frequency.values())
+        self.documents[name] = candidate_ids, counts
+        if version is not None:
+            self.versions[name] = version
+        self._changes.append(('add', name, doc_bigrams_frequency, version))
+
+        return candidate_ids
+
+    def _remove(self, name: str) -> array:
+        """Remove a document from the table and return its candidate ids."""
+        candidate_ids, counts = self.documents.pop(name)
+        self.versions.pop(name, None)
+        self.table.remove_document(
+            {self.table.key(candidate_id): value for candidate_id, value
+             in zip(candidate_ids, counts)})
+        self._changes.append(('remove', name))
+
+        return candidate_ids
+
+    def _stale(self, name: str, version) -> bool:
+        """Check if a document was added in another version."""
+        if name not in self.documents:
+            return False
+
+        # documents of states without versions are taken as unchanged
+        return self.versions.setdefault(name, version) != version
+
+    def _reference(self) -> tuple:
+        """Identify exact or approximate reference frequencies."""
+        if isinstance(self.reference_freq, dict):
+            return 'exact', len(self.reference_freq), self.reference_total
+
+        bounds = self.reference_freq.error_bounds()
+
+        return ('sketch', bounds['epsilon'], bounds['delta'],
+                self.reference_freq.seed, self.reference_total)
+
+    def _update_scores(self, changed: list):
+        """Update scores after candidates of the given ids changed."""
+        table = self.table
+
+        # reference frequencies of new candidates
+        n_known = len(self._reference_counts)
+        if n_known < len(table):
+            new_counts = table.aligned(self.reference_freq, n_known)
+            self._reference_counts = np.concatenate((self._reference_counts,
+                                                     new_counts))
+
+        counts = table.counts
+        total = table.total
+
+        if total > 0:
+            table.columns['probability'] = counts / total
+            table.columns['relevance'] = DomainRelevance().relevance_scores(
+                counts, self._reference_counts, total, self.reference_total)
+        else:
+            table.columns['probability'] = np.zeros(len(table))
+            table.columns['relevance'] = np.zeros(len(table))
+
+        if isinstance(changed, np.ndarray):
+            candidate_ids = changed
+        elif changed:
+            candidate_ids = np.unique(np.concatenate(
+                [np.frombuffer(ids, dtype=np.int32) for ids in changed
+                 if len(ids)] or [np.zeros(0, dtype=np.int32)]))
+        else:
+            candidate_ids = np.zeros(0, dtype=np.int64)
+
+        DomainConsensus().table_consensus(table, candidate_ids)
+
+
+def _file_version(file_path: str) -> tuple:
+    """Size and modification time of a file."""
+    stat = os.stat(file_path)
+
+    return stat.st_size, stat.st_mtime_ns
+
+
+def _content_version(content: bytes) -> str:
+    """Digest of the content of a document."""
+    return hashlib.sha1(content).hexdigest()
+
+
+##############################################################################
+#                          A CLASS DEMONSTRATION                             #
+##############################################################################
+
+
+                 ##########################
+                 ###   DEMONSTRATION   ####
+                 ##########################
+
+
+def corpus_state_demo():
+    """Demonstrate how CorpusState class can be used."""
+    print("\n")
+    print("-------------------------------------")
+    print("CorpusState Class Demonstration")
+    print("-------------------------------------")
+    print("\n")
+
+    state = CorpusState({('machine', 'learning'): 3}, 3)
+    state.add_counts('a.txt', {('machine', 'learning'): 1,
+                               ('learning', 'data'): 2})
+    state.add_counts('b.txt', {('machine', 'learning'): 2})
+
+    print('\t', "Domain consensus after adding a.txt and b.txt: ")
+    print("\n")
+    print(state.table.to_dict('consensus'))
+    print("\n")
+
+    state.remove_documents(['b.txt'])
+
+    print('\t', "Domain consensus after removing b.txt: ")
+    print("\n")
+    print(state.table.to_dict('consensus'))
+    print("\n")
+    print("==================================================================")
+    print("\n")
+    print("\n")
+    print("TESTING BEGINS...")
+    print("\n")
+
+
+if __name__ == "__main__":
+    corpus_state_demo()
+    # the tests are kept in test_CorpusState.py, so importing the
+    # class does not load unittest
+    import unittest
+    from test_CorpusState import CorpusStateTest
+    unittest.main()
+    print("\n")
+    print("CorpusState Class testing is done!")
@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Datum: 17.10.2026
+# Mac OS
+"""
+Zweck: die Bigrammfrequenzen sehr großer Referenzkorpora näherungsweise und
+mit festem Speicherbedarf zu zählen.
+
+Autorin: Daryna Ivanova
+"""
+
+import os
+import math
+import hashlib
+import tempfile
+import numpy as np
+
+
+class CountMinSketch():
+    """
+    Approximate bigram frequencies in a fixed amount of memory.
+
+    A table of depth x width counters, every bigram is counted in one
+    counter per row. The estimate of a bigram is the smallest of its
+    counters, so it is never smaller than the true frequency and, with a
+    probability of at least 1 - delta, at most epsilon * total larger, where
+    total is the number of all counted occurences. Width is e / epsilon and
+    depth ln(1 / delta).
+
+    A sketch can be used instead of the reference frequencies dict, e.g. by
+    CandidateTable.aligned, DomainRelevance.table_relevance and
+    CorpusState. A bigram, which is not in the reference corpus, may get a
+    frequency > 0 and therefore a Domain Relevance < 1.
+
+    Methods
+    -------
+    update(counts: dict)
+        Counts bigrams with their frequencies.
+
+    query(bigrams: list)
+        Estimates frequencies of bigrams.
+
+    get(bigram: tuple, default: int)
+        Estimates the frequency of a bigram like dict.get.
+
+    error_bounds()
+        Describes memory and error of the sketch.
+
+    save(sketch_file: str)
+        Writes the sketch to a npz file.
+
+    load(sketch_file: str)
+        Reads a sketch from a npz file.
+
+    arrays()
+        Gives the arrays of the sketch for storing it in other files.
+
+    from_arrays(arrays: dict)
+        Creates a sketch from its arrays.
+    """
+
+    def __init__(self, epsilon: float = 1e-6, delta: float = 0.01,
+                 seed: int = 0):
+        """
+        Parameters
+        ----------
+        epsilon : float
+            Relative error of an estimate with respect to the total.
+        delta : float
+            Probability, that an estimate exceeds the error.
+        seed : int
+            Seed of the hash functions.
+        """
+        self.epsilon = epsilon
+        self.delta = delta
+        self.seed = seed
+        self.width = math.ceil(math.e / epsilon)
+        self.depth = math.ceil(math.log(1 / delta))
+        self.table = np.zeros((self.depth, self.width), dtype=np.int64)
+        self.total = 0
+
+    def update(self, counts: dict):
+        """
+        Count bigrams with their frequencies.
+
+        Parameters
+        ----------
+        counts : dict
+            Bigrams and their absolute frequencies, e.g. of a part of the
+            reference corpus.
+
+        Returns
+        -------
+        None.
+        """
+        if not counts:
+            return
+
+        columns = self._columns(counts.keys())
+        values = np.fromiter(counts.values(), dtype=np.int64,
+                             count=len(counts))
+
+        for row in range(self.depth):
+            np.add.at(self.table[row], columns[row], values)
+        self.total += int(values.sum())
+
+    def query(self, bigrams) -> np.ndarray:
+        """
+        Estimate frequencies of bigrams.
+
+        Parameters
+        ----------
+        bigrams : list
+            Bigrams.
+
+        Returns
+        -------
+        estimates : np.ndarray
+            Estimated absolute frequency of every bigram.
+        """
+        bigrams = list(bigrams)
+        if not bigrams:
+            return np.zeros(0, dtype=np.int64)
+
+        columns = self._columns(bigrams)
+
+        return np.min(self.table[np.arange(self.depth)[:, None], columns],
+                      axis=0)
+
+    def get(self, bigram: tuple, default: int = 0) -> int:
+        """Estimate the frequency of a bigram, default if it is 0."""
+        estimate = int(self.query([bigram])[0])
+
+        return estimate if estimate > 0 else default
+
+    def error_bounds(self) -> dict:
+        """
+        Describe memory and error of the sketch.
+
+        A reference probability c / total is overestimated by at most
+        epsilon, which is also the largest error of the reference
+        probability in Domain Relevance.
+
+        Returns
+        -------
+        bounds : dict
+            Parameters, memory in bytes, the largest overcount and the
+            probability, that it holds for a bigram.
+        """
+        return {'epsilon': self.epsilon, 'delta': self.delta,
+                'width': self.width, 'depth': self.depth,
+                'memory_bytes': int(self.table.nbytes), 'total': self.total,
+                'max_overcount': math.ceil(self.epsilon * self.total),
+                'max_probability_error': self.epsilon,
+                'confidence': 1 - self.delta}
+
+    def save(self, sketch_file: str):
+        """
+        Write the sketch to a npz file, see ReferenceCache.store.
+
+        Parameters
+        ----------
+        sketch_file : str
+            Path of the file.
+
+        Returns
+        -------
+        None.
+        """
+        directory = os.path.dirname(os.path.abspath(sketch_file))
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=directory, suffix='.npz')
+
+        with os.fdopen(fd, 'wb', buffering=1024 * 1024) as f:
+            np.savez(f, **self.arrays())
+
+        os.replace(tmp, sketch_file)
+
+    def arrays(self) -> dict:
+        """Arrays, which describe the sketch completely."""
+        return {'table': self.table,
+                'parameters': np.array([self.epsilon, self.delta]),
+                'seed_and_total': np.array([self.seed, self.total],
+                                           dtype=np.int64)}
+
+    @classmethod
+    def load(cls, sketch_file: str):
+        """
+        Read a sketch from a npz file.
+
+        Parameters
+        ----------
+        sketch_file : str
+            Path of the file.
+
+        Returns
+        -------
+        sketch : CountMinSketch
+            The saved sketch.
+        """
+        with np.load(sketch_file) as data:
+            return cls.from_arrays(data)
+
+    @classmethod
+    def from_arrays(cls, arrays):
+        """Create a sketch from the result of arrays."""
+        epsilon, delta = arrays['parameters'].tolist()
+        seed, total = arrays['seed_and_total'].tolist()
+
+        sketch = cls.__new__(cls)
+        sketch.epsilon = epsilon
+        sketch.delta = delta
+        sketch.seed = seed
+        sketch.table = arrays['table']
+        sketch.depth, sketch.width = sketch.table.shape
+        sketch.total = total
+
+        return sketch
+
+    def _columns(self, bigrams) -> np.ndarray:
+        """Counter of every bigram in every row, shape (depth, n)."""
+        salt = self.seed.to_bytes(16, 'little')
+        digests = b''.join(
+            hashlib.blake2b((first_word + ' ' + second_word).encode('utf-8'),
+                            digest_size=16, salt=salt).digest()
+            for first_word, second_word in bigrams)
+        hashes = np.frombuffer(digests, dtype='<u8').reshape(-1, 2)
+
+        # row i uses h1 + i * h2, two hashes are enough for all rows
+        rows = np.arange(self.depth, dtype=np.uint64)[:, None]
+
+        return ((hashes[:, 0] + rows * hashes[:, 1]) %
+                np.uint64(self.width)).astype(np.int64)
+
+
+##############################################################################
+#                          A CLASS DEMONSTRATION                             #
+##############################################################################
+
+
+                 ##########################
+                 ###   DEMONSTRATION   ####
+                 ##########################
+
+
+def count_min_sketch_demo():
+    """Demonstrate how CountMinSketch class can be used."""
+    print("\n")
+    print("-------------------------------------")
+    print("CountMinSketch Class Demonstration")
+    print("-------------------------------------")
+    print("\n")
+
+    sketch = CountMinSketch(epsilon=0.01, delta=0.01)
+    sketch.update({('machine', 'learning'): 3, ('data', 'outcome'): 1,
+                   ('big', 'question'): 5})
+
+    print('\t', "Estimated frequency of 'machine learning': ")
+    print("\n")
+    print(sketch.get(('machine', 'learning')))
+    print("\n")
+    print('\t', "Error bounds: ")
+    print("\n")
+    print(sketch.error_bounds())
+    print("\n")
+    print("==================================================================")
+    print("\n")
+    print("\n")
+    print("TESTING BEGINS...")
+    print("\n")
+
+
+if __name__ == "__main__":
+    count_min_sketch_demo()
+    # the tests are kept in test_CountMinSketch.py, so importing the
+    # class does not load unittest
+    import unittest
+    from test_CountMinSketch import CountMinSketchTest
+    unittest.main()
+    print("\n")
+    print("CountMinSketch Class testing is done!")
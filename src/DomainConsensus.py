@@ -8,8 +8,13 @@ Zweck: die Verteilung eines Begriffs allein im Domänekorpus zu messen.
 Autorin: Daryna Ivanova
 """
 
-import unittest
 import math
+import numpy as np
+
+try:
+    from src.CandidateTable import CandidateTable
+except ModuleNotFoundError:
+    from CandidateTable import CandidateTable
 
 
 class DomainConsensus():
@@ -27,6 +32,9 @@ class DomainConsensus():
 
     consensus_for_term(ptds_of_some_term: list)
         A procedure for domain consensus computation.
+
+    table_consensus(table: CandidateTable, candidate_ids=None)
+        Computes the domain consensus for all or some candidates of a table.
     """
 
     def term_distr(self, candidates_total: dict, candidates_per_doc: list,
@@ -115,65 +123,78 @@ class DomainConsensus():
 
         return entropy_for_some_term
 
+    def table_consensus(self, table, candidate_ids=None) -> np.ndarray:
+        """
+        Compute the domain consensus for all candidates of a CandidateTable.
 
-##############################################################################
-#                    A CLASS TESTING AND DEMONSTRATION                       #
-##############################################################################
-
-
-                 ###################
-                 ###   TESTING   ###
-                 ###################
+        The per-document frequencies of the table are used if it keeps them,
+        otherwise its log_sums (see _consensus_from_arrays). Both ways are
+        vectorized over all candidates. The column 'consensus' is written to
+        the table.
 
+        Parameters
+        ----------
+        table : CandidateTable
+            Domain corpus candidates.
+        candidate_ids : np.ndarray
+            Only recompute the consensus of these candidates and keep the
+            rest of the column. Needs a table without per-document
+            frequencies. None (default) computes all candidates.
 
-class DomainConsensusTest(unittest.TestCase):
-    """A class for DomainConsensus units testing."""
+        Returns
+        -------
+        consensus : np.ndarray
+            Domain consensus for each candidate id.
+        """
+        totals = table.counts
+
+        if candidate_ids is not None:
+            consensus = np.zeros(len(table))
+            previous = table.columns.get('consensus')
+            if previous is not None:
+                consensus[:len(previous)] = previous
+
+            candidate_ids = np.asarray(candidate_ids, dtype=np.int64)
+            consensus[candidate_ids] = self._consensus_from_arrays(
+                totals[candidate_ids], table.log_sums[candidate_ids])
+        elif table.keep_documents:
+            # one Pt(d) value per non-zero entry of the sparse matrix,
+            # summed up per candidate id in a single segmented reduction
+            candidate_ids, counts = table.document_matrix()[1:]
+            ptd = counts / totals[candidate_ids]
+            consensus = np.bincount(candidate_ids, weights=-ptd * np.log2(ptd),
+                                    minlength=len(table))
+        else:
+            consensus = self._consensus_from_arrays(totals, table.log_sums)
+
+        table.columns['consensus'] = consensus
 
-    def test_term_distr(self):
-        """Test that actual result corresponds the expected one."""
-        # Frequency per document
-        candidates_total = {
-            ('machine', 'learning'): 2, ('learning', 'data'): 1,
-            ('data', 'outcome'): 1}
+        return consensus
 
-        # Candidates from the whole corpus
-        candidates = [
-            ('machine', 'learning'), ('learning', 'data'),
-            ('data', 'outcome'), ('machine', 'learning')
-            ]
+    def _consensus_from_arrays(self, totals: np.ndarray,
+                               log_sums: np.ndarray) -> np.ndarray:
+        """
+        Measure the domain consensus without per-document distributions.
 
-        # Frequency in the whole corpus
-        candidates_per_doc = [
-            {('machine', 'learning'): 1, ('learning', 'data'): 1,
-             ('data', 'outcome'): 1}, {('machine', 'learning'): 1}]
+        With the frequency f of a term in a text d and its total frequency F,
+        Pt(d) = f / F and therefore
 
-        expected_result = {('machine', 'learning'): [0.5, 0.5],
-                           ('learning', 'data'): [1.0],
-                           ('data', 'outcome'): [1.0]}
+            H = Σ Pt(d) log2(1 / Pt(d)) = log2(F) - Σ f log2(f) / F,
 
-        self.assertEqual(DomainConsensus().term_distr(candidates_total,
-                                                      candidates_per_doc,
-                                                      candidates),
-                         expected_result, "incorrect result")
+        so F and the log_sums Σ f log2(f) are sufficient. Candidates without
+        text get 0.
+        """
+        consensus = np.zeros(len(totals))
+        found = totals > 0
+        consensus[found] = np.maximum(
+            np.log2(totals[found]) - log_sums[found] / totals[found], 0.0)
 
-        print("Term distribution testing is successfully executed!")
+        return consensus
 
-    def test_domain_consensus(self):
-        """Test that a result type is dictionary."""
-        domain_consensus = {
-            ('machine', 'learning'): 1.0, ('learning', 'data'): 0.0,
-            ('data', 'outcome'): 0.0}
-        self.assertIsInstance(domain_consensus, dict,
-                              "output value should be of dict type.")
-        print("Domain consensus method testing is done!")
 
-    def test_consensus_for_term(self):
-        """Test that result is a float number."""
-        ptd_for_a_term = [0.01, 0.5]
-        self.assertIsNotNone(DomainConsensus().consensus_for_term(
-                                                        ptd_for_a_term),
-                             "a resulting value should be float, not None")
-        print("Consensus for a term testing is successfully executed!")
+##############################################################################
+#                          A CLASS DEMONSTRATION                             #
+##############################################################################
 
 
                  ##########################
@@ -273,6 +294,10 @@ def domain_consensus_demo():
 
 if __name__ == "__main__":
     domain_consensus_demo()
+    # the tests are kept in test_DomainConsensus.py, so importing the
+    # class does not load unittest
+    import unittest
+    from test_DomainConsensus import DomainConsensusTest
     unittest.main()
     print("\n")
     print("DomainConsensus Class testing is done!")
@@ -8,7 +8,12 @@ Zweck: die Häufigkeit von Kandidaten in Domäne- vs. Referenzkorpus zu erfassen
 Autorin: Daryna Ivanova
 """
 
-import unittest
+import numpy as np
+
+try:
+    from src.CandidateTable import CandidateTable
+except ModuleNotFoundError:
+    from CandidateTable import CandidateTable
 
 
 class DomainRelevance():
@@ -100,59 +105,80 @@ class DomainRelevance():
 
         return domain_relevance
 
+    def relevance_scores(self, domain_counts: np.ndarray,
+                         reference_counts: np.ndarray, domain_total: int,
+                         reference_total: int) -> np.ndarray:
+        """
+        Compute Domain Relevance for a batch of candidates at once.
 
-##############################################################################
-#                    A CLASS TESTING AND DEMONSTRATION                       #
-##############################################################################
+        Parameters
+        ----------
+        domain_counts : np.ndarray
+            Absolute frequencies of the candidates in the domain corpus.
+        reference_counts : np.ndarray
+            Absolute frequencies of the same candidates, in the same order,
+            in the reference corpus. 0 if a candidate is not in the
+            reference corpus.
+        domain_total : int
+            Number of occurences of all domain candidates.
+        reference_total : int
+            Number of occurences of all reference candidates.
 
+        Returns
+        -------
+        relevance : np.ndarray
+            Domain Relevance for each candidate, 1 if a candidate is not in
+            the reference corpus.
+        """
+        relevance = np.ones(len(domain_counts), dtype=np.float64)
 
-                 ###################
-                 ###   TESTING   ###
-                 ###################
+        # candidates, which occur in the reference corpus
+        found = np.asarray(reference_counts) > 0
+        d = np.asarray(domain_counts)[found] / domain_total
+        relevance[found] = d / (d + np.asarray(reference_counts)[found] /
+                                reference_total)
 
+        return relevance
 
-class DomainRelevanceTest(unittest.TestCase):
-    """A class for DomainRelevance units testing."""
+    def table_relevance(self, table, reference_freq: dict,
+                        reference_total: int) -> np.ndarray:
+        """
+        Compute Domain Relevance for all candidates of a CandidateTable.
 
-    def test_cond_probability(self):
-        """Test that an actual result corresponds the expected one."""
-        candidates_total = {('language', 'processing'): 2,
-                            ('linguistics', 'provides'): 1,
-                            ('automatic', 'language'): 1}
-        candidates = [('language', 'processing'), ('linguistics', 'provides'),
-                      ('automatic', 'language'), ('language', 'processing')]
+        The columns 'probability' (P(t|D) in the domain corpus) and
+        'relevance' are written to the table.
 
-        res = DomainRelevance().cond_probability(candidates, candidates_total)
+        Parameters
+        ----------
+        table : CandidateTable
+            Domain corpus candidates.
+        reference_freq : dict or CountMinSketch
+            Reference candidates and their (approximate) absolute
+            frequencies.
+        reference_total : int
+            Number of occurences of all reference candidates.
 
-        expected_res = {('language', 'processing'): 0.5,
-                        ('linguistics', 'provides'): 0.25,
-                        ('automatic', 'language'): 0.25}
-        self.assertEqual(res, expected_res,
-                         "doesn't correspond the expected result.")
-        print("Conditional probability testing is successfully executed!")
+        Returns
+        -------
+        relevance : np.ndarray
+            Domain Relevance for each candidate id.
+        """
+        domain_counts = table.counts
+        domain_total = table.total
+        relevance = self.relevance_scores(domain_counts,
+                                          table.aligned(reference_freq),
+                                          domain_total, reference_total)
+        domain_tprob = domain_counts / domain_total
 
-    def test_relevance(self):
-        """Test that DR scores are not greater than 1."""
-        reference_tprob = {('machine', 'learning'): 0.5,
-                           ('automatic', 'langugage'): 0.25,
-                           ('data', 'output'): 0.75,
-                           ('outcome', 'analyses'): 0.14,
-                           ('climate', 'catastrophy'): 0.29,
-                           ('big', 'question'): 0.345,
-                           ('predicts', 'outcome'): 0.14}
+        table.columns['probability'] = domain_tprob
+        table.columns['relevance'] = relevance
 
-        candidates = [('language', 'processing'), ('linguistics', 'provides'),
-                      ('automatic', 'language'), ('language', 'processing')]
+        return relevance
 
-        domain_tprob = {('language', 'processing'): 0.5,
-                        ('linguistics', 'provides'): 0.25,
-                        ('automatic', 'language'): 0.25}
 
-        res = DomainRelevance().relevance(domain_tprob, reference_tprob,
-                                          candidates)
-        for score in res.values():
-            self.assertLessEqual(score, 1, "DR scores must be <= 1")
-        print("Domain Relevance testing is successfully executed!")
+##############################################################################
+#                          A CLASS DEMONSTRATION                             #
+##############################################################################
 
 
                  ##########################
@@ -246,6 +272,10 @@ def domain_relevance_demo():
 
 if __name__ == "__main__":
     domain_relevance_demo()
+    # the tests are kept in test_DomainRelevance.py, so importing the
+    # class does not load unittest
+    import unittest
+    from test_DomainRelevance import DomainRelevanceTest
     unittest.main()
     print("\n")
     print("DomainRelevance Class testing is done!")
@@ -0,0 +1,362 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Datum: 17.10.2026
+# Mac OS
+"""
+Zweck: die Statistiken eines verarbeiteten Korpus einzufrieren und einzelne
+neue Dokumente damit zu bewerten.
+
+Autorin: Daryna Ivanova
+"""
+
+import os
+import tempfile
+import numpy as np
+
+try:
+    from src.CandidateSelection import CandidateSelection
+    from src.CandidateTable import CandidateTable
+    from src.CountMinSketch import CountMinSketch
+    from src.DomainRelevance import DomainRelevance
+except ModuleNotFoundError:
+    from CandidateSelection import CandidateSelection
+    from CandidateTable import CandidateTable
+    from CountMinSketch import CountMinSketch
+    from DomainRelevance import DomainRelevance
+
+
+class FrozenModel():
+    """
+    Statistics of a processed domain corpus for scoring single documents.
+
+    A model file keeps for every domain candidate its frequency, the sum of
+    f * log2(f) over the texts (enough for the Domain Consensus, see
+    DomainConsensus.table_consensus) and its reference frequency, and
+    the frequencies of reference bigrams, which are no domain candidates
+    (or the whole CountMinSketch of approximate reference frequencies).
+    Bigrams are stored as sorted word id pairs, so the candidates of a
+    document are looked up with one binary search.
+
+    A document is scored as if it had been added to the corpus: its
+    frequencies are added to the stored ones before Domain Relevance and
+    Domain Consensus of its candidates are computed.
+
+    Methods
+    -------
+    export(table: CandidateTable, reference_freq: dict, reference_total: int)
+        Writes the model of a scored corpus.
+
+    document_scores(doc_bigrams_frequency: dict)
+        Computes Domain Relevance and Domain Consensus of the candidates of
+        a document.
+
+    score(doc_bigrams_frequency: dict, alpha: float, theta: float)
+        Chooses the terms of a document, whose candidates are known.
+
+    extract(text: str, alpha: float, theta: float)
+        Extracts and chooses the terms of a text.
+    """
+
+    def __init__(self, model_file: str = 'Cache/model.npz'):
+        """
+        Parameters
+        ----------
+        model_file : str
+            Path of the model, relative to the current directory.
+        """
+        self.model_file = os.path.join(os.getcwd(), model_file)
+        self._data = None
+        self._word_ids = None
+        self._sketch = None
+
+    def export(self, table: CandidateTable, reference_freq: dict,
+               reference_total: int, filter_freq_n: int = 3):
+        """
+        Write the model of a scored corpus.
+
+        Parameters
+        ----------
+        table : CandidateTable
+            Candidates of the domain corpus. Only active candidates are
+            exported.
+        reference_freq : dict or CountMinSketch
+            Reference candidates and their (approximate) absolute
+            frequencies.
+        reference_total : int
+            Number of occurences of all reference candidates.
+        filter_freq_n : int
+            Frequency filter, which the candidates were extracted with.
+
+        Returns
+        -------
+        None.
+        """
+        words = list(table.words)
+        word_ids = {word: word_id for word_id, word in enumerate(words)}
+        active = table.active
+
+        keys = table.first[active].astype(np.int64) << 32 | \
+            table.second[active]
+        order = np.argsort(keys)
+
+        # reference bigrams, which are no domain candidates
+        reference_keys = []
+        reference_counts = []
+        sketch_arrays = {}
+        reference_only = reference_freq
+        if not isinstance(reference_freq, dict):
+            # the sketch answers for bigrams, which are no domain candidates
+            sketch_arrays = {'sketch_' + name: values for name, values in
+                             reference_freq.arrays().items()}
+            reference_only = {}
+
+        for (first_word, second_word), value in reference_only.items():
+            candidate_id = table.index((first_word, second_word))
+            if candidate_id is not None and active[candidate_id]:
+                continue
+            for word in (first_word, second_word):
+                if word not in word_ids:
+                    word_ids[word] = len(words)
+                    words.append(word)
+            reference_keys.append(word_ids[first_word] << 32 |
+                                  word_ids[second_word])
+            reference_counts.append(value)
+
+        reference_keys = np.array(reference_keys, dtype=np.int64)
+        reference_order = np.argsort(reference_keys)
+
+        arrays = {
+            'words': np.frombuffer('\n'.join(words).encode('utf-8'),
+                                   dtype=np.uint8),
+            'keys': keys[order],
+            'counts': table.counts[active][order],
+            'log_sums': table.log_sums[active][order],
+            'reference_counts': table.aligned(reference_freq)[active][order],
+            'reference_keys': reference_keys[reference_order],
+            'reference_only_counts': np.array(
+                reference_counts, dtype=np.int64)[reference_order],
+            'totals': np.array([table.counts[active].sum(), reference_total,
+                                table.n_docs, filter_freq_n],
+                               dtype=np.int64)}
+        arrays.update(sketch_arrays)
+
+        directory = os.path.dirname(self.model_file)
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=directory, suffix='.npz')
+
+        with os.fdopen(fd, 'wb', buffering=1024 * 1024) as f:
+            np.savez(f, **arrays)
+
+        os.replace(tmp, self.model_file)
+        self._data = None
+
+    def document_scores(self, doc_bigrams_frequency: dict) -> dict:
+        """
+        Compute Domain Relevance and Domain Consensus of a document.
+
+        Parameters
+        ----------
+        doc_bigrams_frequency : dict
+            Bigrams and their absolute frequencies in the document.
+
+        Returns
+        -------
+        scores : dict
+            Candidates of the document and their (relevance, consensus).
+        """
+        data = self._load()
+        if not doc_bigrams_frequency:
+            return {}
+
+        get = self._word_ids.get
+        packed = np.fromiter(
+            (_pack(get(first_word), get(second_word)) for first_word,
+             second_word in doc_bigrams_frequency), dtype=np.int64,
+            count=len(doc_bigrams_frequency))
+        values = np.fromiter(doc_bigrams_frequency.values(), dtype=np.int64,
+                             count=len(doc_bigrams_frequency))
+
+        position, found = _lookup(data['keys'], packed)
+        totals = values + _take(data['counts'], position, found)
+        log_sums = values * np.log2(values) + \
+            _take(data['log_sums'], position, found)
+
+        if self._sketch is not None:
+            reference_only_counts = self._sketch.query(doc_bigrams_frequency)
+        else:
+            reference_position, reference_found = _lookup(
+                data['reference_keys'], packed)
+            reference_only_counts = _take(data['reference_only_counts'],
+                                          reference_position, reference_found)
+        reference_counts = np.where(
+            found, _take(data['reference_counts'], position, found),
+            reference_only_counts)
+
+        domain_total, reference_total = data['totals'][:2].tolist()
+        relevance = DomainRelevance().relevance_scores(
+            totals, reference_counts, domain_total + int(values.sum()),
+            reference_total)
+
+        # see DomainConsensus.table_consensus
+        consensus = np.maximum(np.log2(totals) - log_sums / totals, 0.0)
+
+        return {bigram: (candidate_relevance, candidate_consensus) for
+                bigram, candidate_relevance, candidate_consensus in
+                zip(doc_bigrams_frequency, relevance.tolist(),
+                    consensus.tolist())}
+
+    def score(self, doc_bigrams_frequency: dict, alpha: float,
+              theta: float) -> dict:
+        """
+        Choose the terms of a document, whose candidates are known.
+
+        Parameters
+        ----------
+        doc_bigrams_frequency : dict
+            Bigrams and their absolute frequencies in the document.
+        alpha : float
+            A factor, which controls the cotribution of domain relevance and
+            domain consensus scores.
+        theta : float
+            A threshold needed to be reached for a candidate to refer to the
+            final terminology.
+
+        Returns
+        -------
+        final_terms : dict
+            Terms of the document with their decision scores.
+        """
+        final_terms = {}
+
+        for bigram, (relevance, consensus) in \
+                self.document_scores(doc_bigrams_frequency).items():
+            decision_score = alpha * relevance + (1 - alpha) * consensus
+            if decision_score > theta:
+                final_terms[bigram] = decision_score
+
+        return final_terms
+
+    def extract(self, text: str, alpha: float, theta: float) -> dict:
+        """
+        Extract and choose the terms of a text.
+
+        Candidates are extracted with the frequency filter of the model.
+
+        Parameters
+        ----------
+        text : str
+            Content of a document.
+        alpha : float
+            A factor, which controls the cotribution of domain relevance and
+            domain consensus scores.
+        theta : float
+            A threshold needed to be reached for a candidate to refer to the
+            final terminology.
+
+        Returns
+        -------
+        final_terms : dict
+            Terms of the text with their decision scores.
+        """
+        filter_freq_n = int(self._load()['totals'][3])
+        doc_bigrams_frequency = CandidateSelection().document_candidates(
+            text, filter_freq_n)
+
+        return self.score(doc_bigrams_frequency, alpha, theta)
+
+    def _load(self) -> dict:
+        """Read the model once."""
+        if self._data is None:
+            with np.load(self.model_file) as model:
+                self._data = {name: model[name] for name in model.files}
+            words = bytes(self._data['words']).decode('utf-8').split('\n')
+            self._word_ids = {word: word_id for word_id, word in
+                              enumerate(words)}
+            if 'sketch_table' in self._data:
+                self._sketch = CountMinSketch.from_arrays(
+                    {name[len('sketch_'):]: values for name, values in
+                     self._data.items() if name.startswith('sketch_')})
+
+        return self._data
+
+
+def _pack(first_id: int, second_id: int) -> int:
+    """Pack word ids of a bigram, -1 if a word is unknown."""
+    if first_id is None or second_id is None:
+        return -1
+
+    return first_id << 32 | second_id
+
+
+def _lookup(keys: np.ndarray, packed: np.ndarray) -> tuple:
+    """Positions of packed bigrams in sorted keys and if they were found."""
+    position = np.minimum(np.searchsorted(keys, packed),
+                          max(len(keys) - 1, 0))
+
+    if len(keys) == 0:
+        return position, np.zeros(len(packed), dtype=bool)
+
+    return position, keys[position] == packed
+
+
+def _take(values: np.ndarray, position: np.ndarray,
+          found: np.ndarray) -> np.ndarray:
+    """Values at the found positions, 0 for bigrams, which were not found."""
+    if len(values) == 0:
+        return np.zeros(len(position), dtype=values.dtype)
+
+    return np.where(found, values[position], 0)
+
+
+##############################################################################
+#                          A CLASS DEMONSTRATION                             #
+##############################################################################
+
+
+                 ##########################
+                 ###   DEMONSTRATION   ####
+                 ##########################
+
+
+def frozen_model_demo():
+    """Demonstrate how FrozenModel class can be used."""
+    print("\n")
+    print("-------------------------------------")
+    print("FrozenModel Class Demonstration")
+    print("-------------------------------------")
+    print("\n")
+
+    table = CandidateTable()
+    table.add_document({('machine', 'learning'): 1, ('learning', 'data'): 2})
+    table.add_document({('machine', 'learning'): 2})
+
+    with tempfile.TemporaryDirectory() as tmp:
+        model = FrozenModel(os.path.join(tmp, 'model.npz'))
+        model.export(table, {('machine', 'learning'): 3}, 3)
+
+        new_doc = {('machine', 'learning'): 1, ('data', 'outcome'): 2}
+        print('\t', "Scores of a new document: ", new_doc)
+        print("\n")
+        print(model.document_scores(new_doc))
+        print("\n")
+        print('\t', "Terms for alpha = 0.5, theta = 0.6: ")
+        print("\n")
+        print(model.score(new_doc, 0.5, 0.6))
+
+    print("\n")
+    print("==================================================================")
+    print("\n")
+    print("\n")
+    print("TESTING BEGINS...")
+    print("\n")
+
+
+if __name__ == "__main__":
+    frozen_model_demo()
+    # the tests are kept in test_FrozenModel.py, so importing the
+    # class does not load unittest
+    import unittest
+    from test_FrozenModel import FrozenModelTest
+    unittest.main()
+    print("\n")
+    print("FrozenModel Class testing is done!")
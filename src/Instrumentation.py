@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Datum: 17.10.2026
+# Mac OS
+"""
+Zweck: die Laufzeit und den Speicherbedarf einzelner Programmschritte
+während der Programmausführung zu protokollieren.
+
+Autorin: Daryna Ivanova
+"""
+
+import sys
+import json
+import time
+import cProfile
+import tracemalloc
+
+from contextlib import contextmanager
+from datetime import datetime
+
+try:
+    import resource
+except ImportError:
+    # not available on Windows, peak RSS is not reported there
+    resource = None
+
+
+class Instrumentation():
+    """
+    Per-stage measurements of a program run.
+
+    For every stage wall time, CPU time of the process and of finished
+    worker processes and the resident set size are recorded. The operating
+    system only reports the peak of the whole process lifetime, so a stage
+    gets this peak (process_peak_rss_bytes) and how far the stage raised it
+    (peak_rss_increase_bytes), which is 0 if an earlier stage needed more.
+    With trace_memory the memory allocated by Python code is traced as
+    well, which makes the run noticeably slower. One stage can be profiled
+    with cProfile.
+
+    Methods
+    -------
+    stage(name: str)
+        Context manager, which measures a stage.
+
+    count(name: str, value: int)
+        Records a counter of the run.
+
+    detail(name: str, value)
+        Records other information about the run.
+
+    report()
+        Collects all the measurements.
+
+    write(report_file: str)
+        Writes the report as json.
+    """
+
+    def __init__(self, trace_memory: bool = False, profile_stage: str = None,
+                 profile_file: str = None):
+        """
+        Parameters
+        ----------
+        trace_memory : bool
+            Trace allocations with tracemalloc.
+        profile_stage : str
+            Name of a stage, which is profiled with cProfile.
+        profile_file : str
+            File for the profile data, 'profile_<stage>.prof' by default.
+        """
+        self.trace_memory = trace_memory
+        self.profile_stage = profile_stage
+        self.profile_file = profile_file or 'profile_' + str(profile_stage) \
+            + '.prof'
+        self.started = datetime.now()
+        self.stages = []
+        self.counters = {}
+        self.details = {}
+
+    @contextmanager
+    def stage(self, name: str):
+        """
+        Measure a stage.
+
+        Parameters
+        ----------
+        name : str
+            Name of the stage in the report.
+
+        Yields
+        ------
+        record : dict
+            Measurements of the stage, filled in when the stage ends.
+        """
+        record = {'stage': name}
+        profiler = None
+
+        if self.trace_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+            tracemalloc.reset_peak()
+            traced_before = tracemalloc.get_traced_memory()[0]
+
+        if name == self.profile_stage:
+            profiler = cProfile.Profile()
+            profiler.enable()
+
+        rss_before = _peak_rss()
+        children_before = _children_cpu_time()
+        cpu_before = time.process_time()
+        wall_before = time.perf_counter()
+
+        try:
+            yield record
+        finally:
+            record['wall_seconds'] = time.perf_counter() - wall_before
+            record['cpu_seconds'] = time.process_time() - cpu_before
+            record['children_cpu_seconds'] = _children_cpu_time() - \
+                children_before
+
+            if profiler is not None:
+                profiler.disable()
+                profiler.dump_stats(self.profile_file)
+                record['profile_file'] = self.profile_file
+
+            record['process_peak_rss_bytes'] = _peak_rss()
+            record['peak_rss_increase_bytes'] = None if rss_before is None \
+                else record['process_peak_rss_bytes'] - rss_before
+
+            if self.trace_memory:
+                current, peak = tracemalloc.get_traced_memory()
+                record['traced_peak_bytes'] = peak - traced_before
+                record['traced_net_bytes'] = current - traced_before
+
+            self.stages.append(record)
+
+    def count(self, name: str, value: int):
+        """
+        Record a counter of the run, e.g. number of documents.
+
+        Parameters
+        ----------
+        name : str
+            Name of the counter.
+        value : int
+            Its value.
+
+        Returns
+        -------
+        None.
+        """
+        self.counters[name] = value
+
+    def detail(self, name: str, value):
+        """
+        Record other information about the run, e.g. error bounds.
+
+        Parameters
+        ----------
+        name : str
+            Name of the information in the report.
+        value
+            Anything, which can be written as json.
+
+        Returns
+        -------
+        None.
+        """
+        self.details[name] = value
+
+    def report(self, **information) -> dict:
+        """
+        Collect all the measurements.
+
+        Parameters
+        ----------
+        **information
+            Anything else, which belongs to the report, e.g. arguments.
+
+        Returns
+        -------
+        report : dict
+            Start and end of the run, stages and counters, ready for json.
+        """
+        report = {'started': self.started.isoformat(),
+                  'finished': datetime.now().isoformat(),
+                  'python': sys.version.split()[0],
+                  'stages': self.stages, 'counters': self.counters}
+        report.update(self.details)
+        report.update(information)
+
+        return report
+
+    def write(self, report_file: str, **information):
+        """
+        Write the report as json.
+
+        Parameters
+        ----------
+        report_file : str
+            Path of the json file.
+        **information
+            Anything else, which belongs to the report.
+
+        Returns
+        -------
+        None.
+        """
+        with open(report_file, 'w', encoding='utf-8') as f:
+            json.dump(self.report(**information), f, indent=2, default=str)
+
+
+def _peak_rss() -> int:
+    """
+    Peak resident set size of the process lifetime in bytes, None if
+    unknown.
+    """
+    if resource is None:
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    # bytes on Mac OS, kilobytes on Linux
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def _children_cpu_time() -> float:
+    """CPU time of finished child processes, e.g. of worker processes."""
+    if resource is None:
+        return 0.0
+
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+
+    return usage.ru_utime + usage.ru_stime
+
+
+##############################################################################
+#                          A CLASS DEMONSTRATION                             #
+##############################################################################
+
+
+                 ##########################
+                 ###   DEMONSTRATION   ####
+                 ##########################
+
+
+def instrumentation_demo():
+    """Demonstrate how Instrumentation class can be used."""
+    print("\n")
+    print("-------------------------------------")
+    print("Instrumentation Class Demonstration")
+    print("-------------------------------------")
+    print("\n")
+
+    instrumentation = Instrumentation()
+    with instrumentation.stage('count'):
+        sum(range(100000))
+    instrumentation.count('documents', 1)
+
+    print('\t', "Measurements of a stage 'count': ")
+    print("\n")
+    print(instrumentation.report())
+    print("\n")
+    print("==================================================================")
+    print("\n")
+    print("\n")
+    print("TESTING BEGINS...")
+    print("\n")
+
+
+if __name__ == "__main__":
+    instrumentation_demo()
+    # the tests are kept in test_Instrumentation.py, so importing the
+    # class does not load unittest
+    import unittest
+    from test_Instrumentation import InstrumentationTest
+    unittest.main()
+    print("\n")
+    print("Instrumentation Class testing is done!")
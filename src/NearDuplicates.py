@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Datum: 17.10.2026
+# Mac OS
+"""
+Zweck: nahezu gleiche Texte des Domänekorpus (z.B. mehrere Versionen eines
+Artikels) vor der Kandidatenauswahl zu erkennen.
+
+Autorin: Daryna Ivanova
+"""
+
+import re
+import zlib
+import numpy as np
+
+
+class NearDuplicates():
+    """
+    Find near-duplicate texts with MinHash signatures and LSH banding.
+
+    A text is described by the set of its shingles, i.e. of all sequences
+    of shingle_size consecutive words. The share of equal values of two
+    MinHash signatures estimates the Jaccard similarity of these sets.
+    Signatures are split into bands, texts with an equal band are compared
+    and joined if their estimated similarity reaches the threshold. Every
+    text is hashed once and compared only to texts of the same buckets, so
+    the time grows roughly linearly with the corpus.
+
+    Near-duplicates are collapsed into the first text of their group, the
+    other texts are skipped.
+
+    Methods
+    -------
+    signature(content: bytes)
+        Computes the MinHash signature of a text.
+
+    representatives(signatures: list)
+        Finds the first text of the group of every text.
+
+    keep(documents)
+        Decides which texts are counted.
+    """
+
+    def __init__(self, threshold: float = 0.8, num_perm: int = 128,
+                 shingle_size: int = 5, seed: int = 0):
+        """
+        Parameters
+        ----------
+        threshold : float
+            Smallest estimated Jaccard similarity of near-duplicates.
+        num_perm : int
+            Number of hash functions, i.e. length of a signature.
+        shingle_size : int
+            Number of words in a shingle.
+        seed : int
+            Seed of the hash functions.
+        """
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self.bands, self.rows = _bands(threshold, num_perm)
+        self.duplicates = {}
+
+        # odd multipliers of multiply-shift hashing, one per hash function
+        generator = np.random.default_rng(seed)
+        self._multipliers = generator.integers(
+            0, 2 ** 63, num_perm, dtype=np.uint64) * np.uint64(2) + \
+            np.uint64(1)
+
+    def signature(self, content: bytes) -> np.ndarray:
+        """
+        Compute the MinHash signature of a text.
+
+        Parameters
+        ----------
+        content : bytes
+            Content of a text.
+
+        Returns
+        -------
+        signature : np.ndarray
+            num_perm uint32 values.
+        """
+        words = re.findall(r'\w+', content.decode('utf-8', 'replace').lower())
+        size = self.shingle_size
+        shingles = [' '.join(words[i:i + size]) for i in
+                    range(max(len(words) - size + 1, 1))]
+
+        hashes = np.unique(np.fromiter(
+            (zlib.crc32(shingle.encode('utf-8')) for shingle in shingles),
+            dtype=np.uint64, count=len(shingles)))
+
+        signature = np.full(self.num_perm, 2 ** 32 - 1, dtype=np.uint64)
+        multipliers = self._multipliers[:, None]
+
+        # bounded blocks, so long texts need little memory
+        for start in range(0, len(hashes), 4096):
+            values = (multipliers * hashes[None, start:start + 4096]) >> \
+                np.uint64(32)
+            np.minimum(signature, values.min(axis=1), out=signature)
+
+        return signature.astype(np.uint32)
+
+    def representatives(self, signatures: list) -> list:
+        """
+        Find the first text of the group of every text.
+
+        Parameters
+        ----------
+        signatures : list
+            Signatures of the texts in the corpus order.
+
+        Returns
+        -------
+        representatives : list
+            For every text the position of the first text, which it is a
+            near-duplicate of, or its own position.
+        """
+        parent = list(range(len(signatures)))
+
+        def find(doc_id: int) -> int:
+            while parent[doc_id] != doc_id:
+                parent[doc_id] = parent[parent[doc_id]]
+                doc_id = parent[doc_id]
+            return doc_id
+
+        if not signatures:
+            return []
+
+        matrix = np.vstack(signatures)
+
+        for band in range(self.bands):
+            buckets = {}
+            band_rows = matrix[:, band * self.rows:(band + 1) * self.rows]
+
+            for doc_id, row in enumerate(band_rows):
+                other = buckets.setdefault(row.tobytes(), doc_id)
+                if other == doc_id:
+                    continue
+
+                first, second = find(other), find(doc_id)
+                if first != second and np.mean(
+                        matrix[other] == matrix[doc_id]) >= self.threshold:
+                    # the earlier text represents the group
+                    parent[max(first, second)] = min(first, second)
+
+        return [find(doc_id) for doc_id in range(len(signatures))]
+
+    def keep(self, documents) -> list:
+        """
+        Decide which texts are counted.
+
+        The names of skipped texts and of the texts, which represent them,
+        are kept in the attribute duplicates.
+
+        Parameters
+        ----------
+        documents : iterable
+            (name, content) of every text in the corpus order.
+
+        Returns
+        -------
+        keep : list
+            True for every text, which is not a near-duplicate of an earlier
+            one.
+        """
+        names = []
+        signatures = []
+        for name, content in documents:
+            names.append(name)
+            signatures.append(self.signature(content))
+
+        representatives = self.representatives(signatures)
+
+        for doc_id, representative in enumerate(representatives):
+            if representative != doc_id:
+                self.duplicates[names[doc_id]] = names[representative]
+
+        return [representative == doc_id for doc_id, representative in
+                enumerate(representatives)]
+
+
+def _bands(threshold: float, num_perm: int) -> tuple:
+    """
+    Choose bands and rows per band for a similarity threshold.
+
+    Texts with the similarity s share a band with the probability
+    1 - (1 - s^rows)^bands, which rises steeply around (1 / bands)^(1 /
+    rows). The steepest choice below the threshold is taken, since pairs
+    are verified with the whole signature afterwards.
+    """
+    best = (num_perm, 1)
+
+    for rows in range(1, num_perm + 1):
+        bands = num_perm // rows
+        if (1 / bands) ** (1 / rows) <= threshold:
+            best = (bands, rows)
+
+    return best
+
+
+##############################################################################
+#                          A CLASS DEMONSTRATION                             #
+##############################################################################
+
+
+                 ##########################
+                 ###   DEMONSTRATION   ####
+                 ##########################
+
+
+def near_duplicates_demo():
+    """Demonstrate how NearDuplicates class can be used."""
+    print("\n")
+    print("-------------------------------------")
+    print("NearDuplicates Class Demonstration")
+    print("-------------------------------------")
+    print("\n")
+
+    text = ("Machine learning predicts the outcome of the experiment. "
+            "Language processing provides language data for the model. ")
+    documents = [('preprint.txt', (text * 3).encode('utf-8')),
+                 ('camera_ready.txt', (text * 3 + 'Thanks.').encode('utf-8')),
+                 ('other.txt', b'Terminology extraction from scientific '
+                  b'texts with relevance and consensus scores.')]
+
+    near_duplicates = NearDuplicates(threshold=0.7)
+    print('\t', "Texts, which are counted: ")
+    print("\n")
+    print(near_duplicates.keep(documents))
+    print("\n")
+    print('\t', "Skipped near-duplicates: ")
+    print("\n")
+    print(near_duplicates.duplicates)
+    print("\n")
+    print("==================================================================")
+    print("\n")
+    print("\n")
+    print("TESTING BEGINS...")
+    print("\n")
+
+
+if __name__ == "__main__":
+    near_duplicates_demo()
+    # the tests are kept in test_NearDuplicates.py, so importing the
+    # class does not load unittest
+    import unittest
+    from test_NearDuplicates import NearDuplicatesTest
+    unittest.main()
+    print("\n")
+    print("NearDuplicates Class testing is done!")
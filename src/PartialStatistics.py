@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Datum: 17.10.2026
+# Mac OS
+"""
+Zweck: die Statistiken einzelner Teile des Domänekorpus zu speichern und zu
+einer gemeinsamen Kandidatentabelle zusammenzuführen.
+
+Autorin: Daryna Ivanova
+"""
+
+import os
+import hashlib
+import tempfile
+import numpy as np
+
+try:
+    from src.CandidateTable import CandidateTable
+except ModuleNotFoundError:
+    from CandidateTable import CandidateTable
+
+
+class PartialStatistics():
+    """
+    Candidate statistics of one shard of a corpus in a mergeable file.
+
+    The shard i of k consists of the documents at the positions i, i + k,
+    i + 2k, ... of the corpus (name order of a directory, stored order of
+    an archive), so every node has to see the same corpus. A partial file
+    keeps
+
+    - 'words', 'first', 'second': the candidates of the shard,
+    - 'doc_ptr', 'doc_candidates', 'doc_counts': per-document frequencies
+      as a CSR matrix and 'positions' of the documents in the corpus, or
+      'counts' and 'log_sums' for a table without per-document
+      frequencies,
+    - 'shard' (i, k), 'n_docs' and 'filter_freq_n',
+    - with the listing of the corpus: 'names' of the documents of the
+      table, 'n_shard' documents of the shard (also skipped ones),
+      'n_corpus' and a 'corpus' digest of all names.
+
+    Partial files with names are only merged, if they were created from
+    the same listing and every document of the corpus belongs to exactly
+    one of them.
+
+    Merging partial files with per-document frequencies adds the documents
+    in the order of their positions, which gives exactly the table of a
+    single run over the whole corpus. Without them frequencies and log_sums
+    are summed up, the Domain Consensus then equals the one of a single run
+    up to the rounding of these sums.
+
+    Methods
+    -------
+    write(table: CandidateTable, shard: tuple, filter_freq_n: int,
+          listing: list, skipped)
+        Writes the statistics of a shard.
+
+    merge(partial_files: list)
+        Combines partial files into one CandidateTable.
+    """
+
+    def __init__(self, partial_file: str):
+        """
+        Parameters
+        ----------
+        partial_file : str
+            Path of the partial file, relative to the current directory.
+        """
+        self.partial_file = os.path.join(os.getcwd(), partial_file)
+
+    def write(self, table: CandidateTable, shard: tuple,
+              filter_freq_n: int = 3, listing: list = None, skipped=()):
+        """
+        Write the statistics of a shard.
+
+        Parameters
+        ----------
+        table : CandidateTable
+            Candidates of the documents of the shard, added in the order of
+            the corpus.
+        shard : tuple
+            (i, k): the table belongs to the shard i of k.
+        filter_freq_n : int
+            Frequency filter, which the candidates were extracted with.
+        listing : list
+            Names of all the documents of the corpus in the corpus order,
+            see CandidateSelection.iter_document_candidates. Without it
+            the documents of the shard are assumed to be all in the table.
+        skipped : set
+            Names of documents of the shard, which are not in the table,
+            e.g. near-duplicates.
+
+        Returns
+        -------
+        None.
+        """
+        index, count = shard
+        arrays = {'words': _encode(table.words),
+                  'first': table.first, 'second': table.second,
+                  'shard': np.array([index, count], dtype=np.int64),
+                  'n_docs': np.array(table.n_docs, dtype=np.int64),
+                  'filter_freq_n': np.array(filter_freq_n, dtype=np.int64)}
+
+        positions = index + count * np.arange(table.n_docs, dtype=np.int64)
+
+        if listing is not None:
+            positions = [position for position in
+                         range(index, len(listing), count)
+                         if listing[position] not in skipped]
+            if len(positions) != table.n_docs:
+                raise ValueError("the table has " + str(table.n_docs) +
+                                 " documents, the listing of the shard " +
+                                 str(len(positions)))
+
+            names = [listing[position] for position in positions]
+            arrays.update({'names': _encode(names),
+                           'n_shard': np.array(len(listing[index::count]),
+                                               dtype=np.int64),
+                           'n_corpus': np.array(len(listing),
+                                                dtype=np.int64),
+                           'corpus': _encode([hashlib.sha1(
+                               '\n'.join(listing).encode('utf-8')
+                           ).hexdigest()])})
+            positions = np.array(positions, dtype=np.int64)
+
+        if table.keep_documents:
+            doc_ptr, doc_candidates, doc_counts = table.document_matrix()
+            arrays.update({'doc_ptr': doc_ptr,
+                           'doc_candidates': doc_candidates,
+                           'doc_counts': doc_counts,
+                           'positions': positions})
+        else:
+            arrays.update({'counts': table.counts,
+                           'log_sums': table.log_sums})
+
+        directory = os.path.dirname(self.partial_file)
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=directory, suffix='.npz')
+
+        with os.fdopen(fd, 'wb', buffering=1024 * 1024) as f:
+            np.savez(f, **arrays)
+
+        os.replace(tmp, self.partial_file)
+
+    @staticmethod
+    def merge(partial_files: list) -> CandidateTable:
+        """
+        Combine partial files into one CandidateTable.
+
+        Parameters
+        ----------
+        partial_files : list
+            Paths of the partial files of all shards of a corpus.
+
+        Returns
+        -------
+        table : CandidateTable
+            Candidates of the whole corpus.
+        """
+        partials = []
+        for partial_file in partial_files:
+            with np.load(os.path.join(os.getcwd(), partial_file)) as data:
+                partials.append({name: data[name] for name in data.files})
+
+        _check_shards(partials)
+        keep_documents = all('doc_ptr' in partial for partial in partials)
+        table = CandidateTable(keep_documents=keep_documents)
+
+        keys = []
+        for partial in partials:
+            words = _decode(partial['words'])
+            keys.append([(words[first_id], words[second_id]) for
+                         first_id, second_id in
+                         zip(partial['first'].tolist(),
+                             partial['second'].tolist())])
+
+        if not keep_documents:
+            for partial, partial_keys in zip(partials, keys):
+                if 'doc_ptr' in partial:
+                    table.add_statistics(*_totals(partial, partial_keys))
+                else:
+                    table.add_statistics(partial_keys, partial['counts'],
+                                         partial['log_sums'],
+                                         int(partial['n_docs']))
+            return table
+
+        # (position, partial, document) of all documents in corpus order
+        documents = sorted(
+            (position, number, doc_id) for number, partial in
+            enumerate(partials) for doc_id, position in
+            enumerate(partial['positions'].tolist()))
+
+        for _, number, doc_id in documents:
+            partial = partials[number]
+            start, end = partial['doc_ptr'][doc_id:doc_id + 2].tolist()
+            partial_keys = keys[number]
+            table.add_document(dict(zip(
+                (partial_keys[candidate_id] for candidate_id in
+                 partial['doc_candidates'][start:end].tolist()),
+                partial['doc_counts'][start:end].tolist())))
+
+        return table
+
+
+def _encode(names: list) -> np.ndarray:
+    """Store strings without newlines as one uint8 array."""
+    return np.frombuffer('\n'.join(names).encode('utf-8'), dtype=np.uint8)
+
+
+def _decode(data: np.ndarray) -> list:
+    """Restore strings stored by _encode."""
+    return bytes(data).decode('utf-8').split('\n')
+
+
+def _check_shards(partials: list):
+    """Check that the partial files are all shards of one corpus."""
+    if not partials:
+        raise ValueError("no partial files to merge")
+
+    filters = {int(partial['filter_freq_n']) for partial in partials}
+    if len(filters) > 1:
+        raise ValueError("partial files were created with different "
+                         "filter_freq_n: " + str(sorted(filters)))
+
+    shards = sorted(tuple(partial['shard'].tolist()) for partial in partials)
+    count = shards[0][1]
+    if shards != [(index, count) for index in range(count)]:
+        raise ValueError("partial files are not the shards 0.." +
+                         str(count - 1) + " of " + str(count) + ": " +
+                         str(shards))
+
+    with_names = ['names' in partial for partial in partials]
+    if any(with_names) and not all(with_names):
+        raise ValueError("only some partial files know their documents")
+    if not any(with_names):
+        return
+
+    if len({bytes(partial['corpus']) for partial in partials}) > 1:
+        raise ValueError("partial files were created from different "
+                         "listings of the corpus")
+
+    names = [name for partial in partials if int(partial['n_docs'])
+             for name in _decode(partial['names'])]
+    if len(set(names)) != len(names):
+        raise ValueError("documents are in several partial files")
+
+    n_corpus = int(partials[0]['n_corpus'])
+    if sum(int(partial['n_shard']) for partial in partials) != n_corpus:
+        raise ValueError("partial files do not cover the " + str(n_corpus) +
+                         " documents of the corpus")
+
+
+def _totals(partial: dict, partial_keys: list) -> tuple:
+    """Frequencies and log_sums of a partial file with documents."""
+    n_candidates = len(partial_keys)
+    doc_candidates = partial['doc_candidates']
+    doc_counts = partial['doc_counts']
+
+    counts = np.bincount(doc_candidates, weights=doc_counts,
+                         minlength=n_candidates).astype(np.int64)
+    log_sums = np.bincount(doc_candidates,
+                           weights=doc_counts * np.log2(doc_counts),
+                           minlength=n_candidates)
+
+    return partial_keys, counts, log_sums, int(partial['n_docs'])
+
+
+##############################################################################
+#                          A CLASS DEMONSTRATION                             #
+##############################################################################
+
+
+                 ##########################
+                 ###   DEMONSTRATION   ####
+                 ##########################
+
+
+def partial_statistics_demo():
+    """Demonstrate how PartialStatistics class can be used."""
+    print("\n")
+    print("-------------------------------------")
+    print("PartialStatistics Class Demonstration")
+    print("-------------------------------------")
+    print("\n")
+
+    documents = [{('machine', 'learning'): 1, ('learning', 'data'): 2},
+                 {('machine', 'learning'): 2, ('data', 'outcome'): 1}]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        partial_files = []
+        for index in range(2):
+            table = CandidateTable()
+            table.add_document(documents[index])
+            partial_files.append(os.path.join(tmp, str(index) + '.npz'))
+            PartialStatistics(partial_files[-1]).write(table, (index, 2))
+
+        print('\t', "Frequencies of both shards merged: ")
+        print("\n")
+        print(PartialStatistics.merge(partial_files).to_dict('counts'))
+
+    print("\n")
+    print("==================================================================")
+    print("\n")
+    print("\n")
+    print("TESTING BEGINS...")
+    print("\n")
+
+
+if __name__ == "__main__":
+    partial_statistics_demo()
+    # the tests are kept in test_PartialStatistics.py, so importing the
+    # class does not load unittest
+    import unittest
+    from test_PartialStatistics import PartialStatisticsTest
+    unittest.main()
+    print("\n")
+    print("PartialStatistics Class testing is done!")
@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Datum: 17.10.2026
+# Mac OS
+"""
+Zweck: die Statistiken des Referenzkorpus auf der Festplatte zu speichern.
+
+Autorin: Daryna Ivanova
+"""
+
+import os
+import hashlib
+import tempfile
+import numpy as np
+
+
+# Bump whenever the way reference bigrams are produced changes.
+FORMAT_VERSION = 2
+
+
+class ReferenceCache():
+    """
+    Persistent on-disk store of reference corpus bigram frequencies.
+
+    Every entry consists of two aligned files: 'reference_<key>.npy' keeps
+    the absolute frequencies as a memory-mappable int64 array and
+    'reference_<key>.txt' keeps the bigrams, one per line.
+
+    Methods
+    -------
+    cache_key(*parts)
+        Creates a key from everything the reference statistics depend on.
+
+    load(key: str, candidates=None)
+        Loads reference frequencies and their total if they were stored,
+        optionally only of the given candidates.
+
+    store(key: str, reference_freq: dict)
+        Writes reference frequencies to the cache directory.
+    """
+
+    def __init__(self, cache_dir: str = 'Cache'):
+        """
+        Parameters
+        ----------
+        cache_dir : str
+            Name of a directory, where the cache files are located.
+        """
+        self.cache_dir = os.path.join(os.getcwd(), cache_dir)
+
+    def cache_key(self, *parts) -> str:
+        """
+        Create a cache key.
+
+        Parameters
+        ----------
+        *parts
+            Stopword lists, NLTK data version, filter parameters and anything
+            else the reference statistics depend on.
+
+        Returns
+        -------
+        key : str
+            A hex digest of all the parts.
+        """
+        digest = hashlib.sha1(str(FORMAT_VERSION).encode('utf-8'))
+
+        for part in parts:
+            digest.update(b'\x00')
+            digest.update(repr(part).encode('utf-8'))
+
+        return digest.hexdigest()
+
+    def load(self, key: str, candidates=None):
+        """
+        Load cached reference frequencies.
+
+        With candidates only the frequencies of these bigrams are kept, the
+        other ones are read from the disk and dropped at once. The total
+        still covers all reference candidates.
+
+        Parameters
+        ----------
+        key : str
+            A cache key.
+        candidates : set, frozenset or CandidateTable
+            Domain candidates, anything which supports 'in'. None keeps all
+            reference candidates.
+
+        Returns
+        -------
+        reference_freq, total : tuple or None
+            reference_freq : dict
+                {key: reference candidate, value: it's absolute frequency}
+            total : int
+                Number of occurences of all reference candidates.
+            None if there is no such entry in the cache.
+        """
+        counts_file, bigrams_file = self._paths(key)
+
+        if not (os.path.isfile(counts_file) and os.path.isfile(bigrams_file)):
+            return None
+
+        counts = np.load(counts_file, mmap_mode='r')
+
+        with open(bigrams_file, 'r', encoding='utf-8') as f:
+            if candidates is None:
+                bigrams = [tuple(line.split(' ')) for line in
+                           f.read().splitlines()]
+                reference_freq = dict(zip(bigrams, counts.tolist()))
+            else:
+                bigrams = []
+                positions = []
+                for position, line in enumerate(f):
+                    bigram = tuple(line.rstrip('\n').split(' '))
+                    if bigram in candidates:
+                        bigrams.append(bigram)
+                        positions.append(position)
+                reference_freq = dict(zip(bigrams,
+                                          counts[positions].tolist()))
+
+        return reference_freq, int(counts.sum())
+
+    def store(self, key: str, reference_freq: dict):
+        """
+        Write reference frequencies to the cache.
+
+        Files are written under temporary names first, so an interrupted run
+        never leaves a half-written entry behind.
+
+        Parameters
+        ----------
+        key : str
+            A cache key.
+        reference_freq : dict
+            Reference candidates and their absolute frequencies.
+
+        Returns
+        -------
+        None.
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+        counts_file, bigrams_file = self._paths(key)
+
+        counts = np.fromiter(reference_freq.values(), dtype=np.int64,
+                             count=len(reference_freq))
+
+        fd, tmp_counts = tempfile.mkstemp(dir=self.cache_dir, suffix='.npy')
+        with os.fdopen(fd, 'wb') as f:
+            np.save(f, counts)
+
+        fd, tmp_bigrams = tempfile.mkstemp(dir=self.cache_dir, suffix='.txt')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(''.join(bigram[0] + ' ' + bigram[1] + '\n'
+                            for bigram in reference_freq.keys()))
+
+        os.replace(tmp_bigrams, bigrams_file)
+        os.replace(tmp_counts, counts_file)
+
+    def _paths(self, key: str) -> tuple:
+        """Return file names of a cache entry."""
+        prefix = os.path.join(self.cache_dir, 'reference_' + key)
+
+        return prefix + '.npy', prefix + '.txt'
+
+
+##############################################################################
+#                          A CLASS DEMONSTRATION                             #
+##############################################################################
+
+
+                 ##########################
+                 ###   DEMONSTRATION   ####
+                 ##########################
+
+
+def reference_cache_demo():
+    """Demonstrate how ReferenceCache class can be used."""
+    print("\n")
+    print("-------------------------------------")
+    print("ReferenceCache Class Demonstration")
+    print("-------------------------------------")
+    print("\n")
+
+    reference_freq = {('machine', 'learning'): 3, ('data', 'outcome'): 1}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = ReferenceCache(tmp)
+        key = cache.cache_key('stopwords.txt', 'nltk 3.6', 0)
+        cache.store(key, reference_freq)
+
+        print('\t', "Cache files: ")
+        print("\n")
+        print(sorted(os.listdir(tmp)))
+        print("\n")
+        print('\t', "Loaded reference frequencies and their total: ")
+        print("\n")
+        print(cache.load(key))
+
+    print("\n")
+    print("==================================================================")
+    print("\n")
+    print("\n")
+    print("TESTING BEGINS...")
+    print("\n")
+
+
+if __name__ == "__main__":
+    reference_cache_demo()
+    # the tests are kept in test_ReferenceCache.py, so importing the
+    # class does not load unittest
+    import unittest
+    from test_ReferenceCache import ReferenceCacheTest
+    unittest.main()
+    print("\n")
+    print("ReferenceCache Class testing is done!")
@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Datum: 17.10.2026
+# Mac OS
+"""
+Zweck: die Terme aller Alpha/Theta-Kombinationen in einer Datei zu speichern.
+
+Autorin: Daryna Ivanova
+"""
+
+import os
+import tempfile
+import numpy as np
+
+try:
+    from src.CandidateTable import CandidateTable
+    from src.TermDecision import TermDecision
+except ModuleNotFoundError:
+    from CandidateTable import CandidateTable
+    from TermDecision import TermDecision
+
+
+class ResultStore():
+    """
+    Final terms of all alpha/theta combinations in one compact file.
+
+    For a fixed alpha the terms of a greater theta are a subset of the terms
+    of a smaller one. Therefore candidates are sorted by their decision
+    scores once per alpha, and the terms of a theta are the first cuts[alpha,
+    theta] candidates of this ranking. A file keeps
+
+    - 'words': the words of all stored terms, joined with new lines,
+    - 'first', 'second': word ids of every stored term,
+    - 'alphas', 'thetas' and 'cuts' (number of terms per combination),
+    - 'order_<i>', 'scores_<i>': term ids and decision scores of the i-th
+      alpha, the best one first, down to the smallest theta.
+
+    Methods
+    -------
+    write(table: CandidateTable, alphas: list, thetas: list)
+        Ranks candidates for every alpha and writes the file.
+
+    combinations()
+        Lists all stored alpha/theta combinations.
+
+    terms(alpha: float, theta: float)
+        Reads final terms of a combination.
+    """
+
+    def __init__(self, result_file: str = 'Output/results.npz'):
+        """
+        Parameters
+        ----------
+        result_file : str
+            Path of the file, relative to the current directory.
+        """
+        self.result_file = os.path.join(os.getcwd(), result_file)
+        self._data = None
+        self._words = None
+
+    def write(self, table: CandidateTable, alphas: list, thetas: list):
+        """
+        Rank candidates for every alpha and write the file.
+
+        Parameters
+        ----------
+        table : CandidateTable
+            Candidates with Domain Relevance and Domain Consensus. Only
+            active candidates can be terms.
+        alphas : list
+            Values of alpha.
+        thetas : list
+            Values of theta.
+
+        Returns
+        -------
+        None.
+        """
+        alphas = np.asarray(alphas, dtype=np.float64)
+        thetas = np.asarray(thetas, dtype=np.float64)
+        active_ids = np.flatnonzero(table.active)
+        relevance = table.columns['relevance'][active_ids]
+        consensus = table.columns['consensus'][active_ids]
+
+        cuts = np.zeros((len(alphas), len(thetas)), dtype=np.int64)
+        orders = []
+        scores = []
+
+        for row, alpha in enumerate(alphas.tolist()):
+            decision_scores = alpha * relevance + (1 - alpha) * consensus
+            order = np.argsort(-decision_scores, kind='stable')
+            sorted_scores = decision_scores[order]
+
+            # number of candidates with a score > theta
+            cuts[row] = np.searchsorted(-sorted_scores, -thetas, side='left')
+            keep = int(cuts[row].max()) if len(thetas) else 0
+
+            orders.append(active_ids[order[:keep]])
+            scores.append(sorted_scores[:keep])
+
+        # only candidates, which are a term of some combination, are stored
+        candidate_ids = np.unique(np.concatenate(
+            orders + [np.zeros(0, dtype=np.int64)]))
+        word_ids, stored_word_ids = np.unique(np.concatenate(
+            (table.first[candidate_ids], table.second[candidate_ids])),
+            return_inverse=True)
+
+        arrays = {'alphas': alphas, 'thetas': thetas, 'cuts': cuts,
+                  'first': stored_word_ids[:len(candidate_ids)].astype(
+                      np.int32),
+                  'second': stored_word_ids[len(candidate_ids):].astype(
+                      np.int32),
+                  'words': np.frombuffer('\n'.join(
+                      table.words[word_id] for word_id in word_ids.tolist()
+                      ).encode('utf-8'), dtype=np.uint8)}
+
+        for row, (order, sorted_scores) in enumerate(zip(orders, scores)):
+            arrays['order_' + str(row)] = np.searchsorted(
+                candidate_ids, order).astype(np.int32)
+            arrays['scores_' + str(row)] = sorted_scores
+
+        directory = os.path.dirname(self.result_file)
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=directory, suffix='.npz')
+
+        with os.fdopen(fd, 'wb', buffering=1024 * 1024) as f:
+            np.savez(f, **arrays)
+
+        os.replace(tmp, self.result_file)
+        self._data = None
+
+    def combinations(self) -> list:
+        """
+        List all stored alpha/theta combinations.
+
+        Returns
+        -------
+        combinations : list
+            (alpha, theta, number of terms) for every combination.
+        """
+        data = self._load()
+
+        return [(alpha, theta, int(data['cuts'][row, column]))
+                for row, alpha in enumerate(data['alphas'].tolist())
+                for column, theta in enumerate(data['thetas'].tolist())]
+
+    def terms(self, alpha: float, theta: float) -> dict:
+        """
+        Read final terms of a combination.
+
+        Any theta, which is not smaller than the smallest stored theta, can
+        be read, since the terms of such a theta are a prefix of the stored
+        ranking.
+
+        Parameters
+        ----------
+        alpha : float
+            A stored value of alpha.
+        theta : float
+            A threshold needed to be reached for a candidate to refer to the
+            final terminology.
+
+        Returns
+        -------
+        final_terms : dict
+            Terms with their decision scores, the best one first.
+        """
+        data = self._load()
+        alphas = data['alphas'].tolist()
+
+        if alpha not in alphas:
+            raise KeyError("alpha " + str(alpha) + " is not stored in " +
+                           self.result_file)
+        if len(data['thetas']) == 0 or theta < data['thetas'].min():
+            raise ValueError("theta " + str(theta) + " is smaller than the "
+                             "smallest stored theta")
+
+        row = alphas.index(alpha)
+        sorted_scores = data['scores_' + str(row)]
+        cut = int(np.searchsorted(-sorted_scores, -theta, side='left'))
+
+        order = data['order_' + str(row)][:cut].tolist()
+        first = data['first']
+        second = data['second']
+        words = self._words
+
+        return {(words[first[term_id]], words[second[term_id]]): score
+                for term_id, score in zip(order,
+                                          sorted_scores[:cut].tolist())}
+
+    def _load(self):
+        """Open the file once, arrays are read when they are needed."""
+        if self._data is None:
+            self._data = np.load(self.result_file)
+            self._words = bytes(self._data['words']).decode('utf-8').\
+                split('\n')
+
+        return self._data
+
+
+##############################################################################
+#                          A CLASS DEMONSTRATION                             #
+##############################################################################
+
+
+                 ##########################
+                 ###   DEMONSTRATION   ####
+                 ##########################
+
+
+def result_store_demo():
+    """Demonstrate how ResultStore class can be used."""
+    print("\n")
+    print("-------------------------------------")
+    print("ResultStore Class Demonstration")
+    print("-------------------------------------")
+    print("\n")
+
+    table = CandidateTable()
+    table.add_document({('machine', 'learning'): 2, ('learning', 'data'): 1,
+                        ('data', 'outcome'): 1})
+    table.columns['relevance'] = np.array([0.64, 1.0, 1.0])
+    table.columns['consensus'] = np.array([1.0, 0.0, 0.0])
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = ResultStore(os.path.join(tmp, 'results.npz'))
+        store.write(table, [0.2, 0.7], [0.3, 0.6])
+
+        for alpha, theta, n_terms in store.combinations():
+            print('\t', "alpha = " + str(alpha) + ", theta = " + str(theta) +
+                  ", " + str(n_terms) + " terms: ")
+            print(store.terms(alpha, theta))
+            print("\n")
+
+    print("==================================================================")
+    print("\n")
+    print("\n")
+    print("TESTING BEGINS...")
+    print("\n")
+
+
+if __name__ == "__main__":
+    result_store_demo()
+    # the tests are kept in test_ResultStore.py, so importing the
+    # class does not load unittest
+    import unittest
+    from test_ResultStore import ResultStoreTest
+    unittest.main()
+    print("\n")
+    print("ResultStore Class testing is done!")
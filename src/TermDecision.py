@@ -8,8 +8,14 @@ Zweck: die Berechnung der Entscheidungspunktzahl für jeden Termkandidat.
 Autorin: Daryna Ivanova
 """
 
-import unittest
 import os
+import heapq
+import numpy as np
+
+try:
+    from src.CandidateTable import CandidateTable
+except ModuleNotFoundError:
+    from CandidateTable import CandidateTable
 
 
 class TermDecision():
@@ -21,6 +27,35 @@ class TermDecision():
     decision_function(candidates: list, relevance: dict, consensus: dict,
                       alpha: float, theta: float)
         Determine if a candidate is a term according to it's score.
+
+    table_decision(table: CandidateTable, alpha: float, theta: float)
+        Determine final terms from the columns of a CandidateTable.
+
+    top_terms(candidates: list, relevance: dict, consensus: dict,
+              alpha: float, k: int, theta: float)
+        Choose the k best candidates with a bounded heap.
+
+    table_top_terms(table: CandidateTable, alpha: float, k: int,
+                    theta: float)
+        Choose the k best candidates of a CandidateTable.
+
+    decision_grid(relevance: np.ndarray, consensus: np.ndarray,
+                  alphas: list, thetas: list, gold_mask: np.ndarray,
+                  n_relevant: int)
+        Evaluates every alpha/theta combination with one sort per alpha.
+
+    table_grid(table: CandidateTable, alphas: list, thetas: list,
+               gold_terminology: list)
+        Evaluates every alpha/theta combination for a CandidateTable.
+
+    table_ranking(table: CandidateTable, alpha: float)
+        Ranks all candidates of a CandidateTable by their decision scores.
+
+    outputter(alpha: float, theta: float, final_terms: dict)
+        Writes final terms of a combination to a txt file.
+
+    top_outputter(alpha: float, k: int, ranked_terms: list)
+        Writes the k best terms of an alpha to a txt file.
     """
 
     def decision_function(self, candidates: list, relevance: dict,
@@ -68,6 +103,287 @@ class TermDecision():
 
         return final_terms
 
+    def table_decision(self, table, alpha: float, theta: float) -> dict:
+        """
+        Decide which candidates of a CandidateTable are terms.
+
+        Uses the columns 'relevance' and 'consensus' and writes the decision
+        scores to the column 'decision'. Only active candidates can be
+        terms.
+
+        Parameters
+        ----------
+        table : CandidateTable
+            Candidates with Domain Relevance and Domain Consensus.
+        alpha : float
+            A factor, which controls the cotribution of domain relevance and
+            domain consensus scores.
+        theta : float
+            A threshold needed to be reached for a candidate to refer to the
+            final terminology.
+
+        Returns
+        -------
+        final_terms : dict
+            Terms with their decision scores.
+        """
+        decision_scores = alpha * table.columns['relevance'] \
+            + (1 - alpha) * table.columns['consensus']
+        table.columns['decision'] = decision_scores
+
+        final_terms = {}
+        passed = (decision_scores > theta) & table.active
+        for candidate_id in np.flatnonzero(passed).tolist():
+            final_terms[table.key(candidate_id)] = \
+                float(decision_scores[candidate_id])
+
+        return final_terms
+
+    def top_terms(self, candidates, relevance: dict, consensus: dict,
+                  alpha: float, k: int, theta: float = None) -> list:
+        """
+        Choose the k best candidates instead of or in addition to a theta.
+
+        Decision scores are streamed through a heap of at most k candidates,
+        so only O(k) memory is needed besides the scores themselves. Of
+        candidates with equal scores the one seen first is preferred.
+
+        Parameters
+        ----------
+        candidates : iterable
+            Bigrams of the whole corpus.
+        relevance : dict
+            Domain relevance for each term.
+        consensus : dict
+            Domain consensus for each term.
+        alpha : float
+            A factor, which controls the cotribution of domain relevance and
+            domain consensus scores.
+        k : int
+            Number of terms.
+        theta : float
+            If given, a candidate needs a score > theta as well.
+
+        Returns
+        -------
+        ranked_terms : list
+            At most k (term, decision score) pairs, the best one first.
+        """
+        # (score, -position, term): the root is the worst chosen candidate
+        heap = []
+        chosen = set()
+
+        for position, candidate in enumerate(candidates):
+            if candidate in chosen:
+                continue
+
+            f_t = alpha * relevance[candidate] \
+                + (1 - alpha) * consensus[candidate]
+
+            if theta is not None and f_t <= theta:
+                continue
+
+            if len(heap) < k:
+                heapq.heappush(heap, (f_t, -position, candidate))
+                chosen.add(candidate)
+            elif k > 0 and f_t > heap[0][0]:
+                removed = heapq.heapreplace(heap, (f_t, -position,
+                                                   candidate))
+                chosen.discard(removed[2])
+                chosen.add(candidate)
+
+        return [(term, score) for score, _, term in sorted(heap,
+                                                           reverse=True)]
+
+    def table_top_terms(self, table, alpha: float, k: int,
+                        theta: float = None, chunk_size: int = 65536) -> list:
+        """
+        Choose the k best candidates of a CandidateTable.
+
+        Decision scores are computed for chunk_size candidates at a time.
+        The best candidates of a chunk are selected with a partition and
+        pushed through a heap of at most k candidates, so besides the table
+        only O(k + chunk_size) memory is needed. The result is the beginning
+        of table_ranking.
+
+        Parameters
+        ----------
+        table : CandidateTable
+            Candidates with Domain Relevance and Domain Consensus.
+        alpha : float
+            A factor, which controls the cotribution of domain relevance and
+            domain consensus scores.
+        k : int
+            Number of terms.
+        theta : float
+            If given, a candidate needs a score > theta as well.
+        chunk_size : int
+            Number of candidates, which are scored at once.
+
+        Returns
+        -------
+        ranked_terms : list
+            At most k (term, decision score) pairs, the best one first.
+        """
+        relevance = table.columns['relevance']
+        consensus = table.columns['consensus']
+        counts = table.counts
+
+        # (score, -id, id): the root is the worst chosen candidate, of
+        # equal scores the larger id as in the stable table_ranking
+        heap = []
+
+        for start in range(0, len(table) if k > 0 else 0, chunk_size):
+            end = start + chunk_size
+            scores = alpha * relevance[start:end] \
+                + (1 - alpha) * consensus[start:end]
+
+            passed = counts[start:end] > 0
+            if theta is not None:
+                passed &= scores > theta
+            chunk_ids = np.flatnonzero(passed)
+
+            if k < len(chunk_ids):
+                chunk_scores = scores[chunk_ids]
+                kth_score = np.partition(chunk_scores, len(chunk_ids) - k)[
+                    len(chunk_ids) - k]
+                chunk_ids = chunk_ids[chunk_scores >= kth_score]
+
+            for chunk_id, score in zip(chunk_ids.tolist(),
+                                       scores[chunk_ids].tolist()):
+                item = (score, -(start + chunk_id), start + chunk_id)
+                if len(heap) < k:
+                    heapq.heappush(heap, item)
+                elif item > heap[0]:
+                    heapq.heapreplace(heap, item)
+
+        return [(table.key(candidate_id), score) for score, _, candidate_id
+                in sorted(heap, reverse=True)]
+
+    def decision_grid(self, relevance: np.ndarray, consensus: np.ndarray,
+                      alphas: list, thetas: list, gold_mask: np.ndarray,
+                      n_relevant: int) -> tuple:
+        """
+        Compute precision, recall and number of terms for a whole grid.
+
+        Decision scores are computed and sorted once per alpha. The terms of
+        a theta are then the candidates behind the position found by binary
+        search, and the number of gold terms among them is read from a
+        cumulative sum, so a grid costs O(|alphas| * N log N) instead of
+        O(|alphas| * |thetas| * N).
+
+        Parameters
+        ----------
+        relevance : np.ndarray
+            Domain relevance for each candidate.
+        consensus : np.ndarray
+            Domain consensus for each candidate.
+        alphas : list
+            Factors, which control the cotribution of domain relevance and
+            domain consensus scores.
+        thetas : list
+            Thresholds needed to be reached for a candidate to refer to the
+            final terminology.
+        gold_mask : np.ndarray
+            True for each candidate, which is in the gold standard.
+        n_relevant : int
+            Number of gold standard terms.
+
+        Returns
+        -------
+        precision, recall, n_terms : tuple
+            Arrays of the shape (len(alphas), len(thetas)). Precision is 0
+            for combinations without terms.
+        """
+        thetas = np.asarray(thetas, dtype=np.float64)
+        n_candidates = len(relevance)
+        gold_mask = np.asarray(gold_mask, dtype=bool)
+
+        precision = np.zeros((len(alphas), len(thetas)))
+        recall = np.zeros((len(alphas), len(thetas)))
+        n_terms = np.zeros((len(alphas), len(thetas)), dtype=np.int64)
+
+        for row, alpha in enumerate(alphas):
+            decision_scores = alpha * relevance + (1 - alpha) * consensus
+            order = np.argsort(decision_scores, kind='stable')
+            sorted_scores = decision_scores[order]
+
+            # gold terms among the k best candidates is hits[k]
+            hits = np.zeros(n_candidates + 1, dtype=np.int64)
+            np.cumsum(gold_mask[order][::-1], out=hits[1:])
+
+            # number of candidates with a score > theta
+            count = n_candidates - np.searchsorted(sorted_scores, thetas,
+                                                   side='right')
+            retrieved_relevant = hits[count]
+
+            n_terms[row] = count
+            precision[row] = np.divide(retrieved_relevant, count,
+                                       out=np.zeros(len(thetas)),
+                                       where=count > 0)
+            if n_relevant > 0:
+                recall[row] = retrieved_relevant / n_relevant
+
+        return precision, recall, n_terms
+
+    def table_grid(self, table, alphas: list, thetas: list,
+                   gold_terminology: list) -> tuple:
+        """
+        Evaluate every alpha/theta combination for a CandidateTable.
+
+        Parameters
+        ----------
+        table : CandidateTable
+            Candidates with Domain Relevance and Domain Consensus.
+        alphas : list
+            Values of alpha.
+        thetas : list
+            Values of theta.
+        gold_terminology : list or frozenset
+            Gold standard terms.
+
+        Returns
+        -------
+        precision, recall, n_terms : tuple
+            See decision_grid.
+        """
+        gold = gold_terminology
+        if not isinstance(gold, (set, frozenset)):
+            gold = set(gold)
+        gold_mask = np.fromiter((bigram in gold for bigram in table.keys()),
+                                dtype=bool, count=len(table))
+        active = table.active
+
+        return self.decision_grid(table.columns['relevance'][active],
+                                  table.columns['consensus'][active], alphas,
+                                  thetas, gold_mask[active],
+                                  len(gold_terminology))
+
+    def table_ranking(self, table, alpha: float) -> list:
+        """
+        Rank all candidates of a CandidateTable by their decision scores.
+
+        Parameters
+        ----------
+        table : CandidateTable
+            Candidates with Domain Relevance and Domain Consensus.
+        alpha : float
+            A factor, which controls the cotribution of domain relevance and
+            domain consensus scores.
+
+        Returns
+        -------
+        ranked_terms : list
+            (term, decision score) pairs, the best one first.
+        """
+        decision_scores = alpha * table.columns['relevance'] \
+            + (1 - alpha) * table.columns['consensus']
+        order = np.argsort(-decision_scores, kind='stable')
+        order = order[table.active[order]]
+
+        return [(table.key(candidate_id), score) for candidate_id, score in
+                zip(order.tolist(), decision_scores[order].tolist())]
+
     def outputter(self, alpha: float, theta: float, final_terms: dict):
         """
         Create an output txt files for each alpha/theta combination.
@@ -90,6 +406,8 @@ class TermDecision():
         -------
         None.
         """
+        os.makedirs(os.getcwd() + "/Output", exist_ok=True)
+
         # create txt file with result according to alpha and theta values
         with open(os.getcwd() + "/Output/" + "result_" + str(alpha) + "_" +
                   str(theta) + ".txt", 'w') as f:
@@ -100,46 +418,38 @@ class TermDecision():
             for key, value in final_terms.items():
                 f.write(key[0] + ' ' + key[1] + '\t' + str(value) + '\n')
 
+    def top_outputter(self, alpha: float, k: int, ranked_terms: list):
+        """
+        Create an output txt file with the k best terms of an alpha.
 
-##############################################################################
-#                    A CLASS TESTING AND DEMONSTRATION                       #
-##############################################################################
-
-
-                 ###################
-                 ###   TESTING   ###
-                 ###################
+        Parameters
+        ----------
+        alpha : float
+            A factor, which controls the cotribution of domain relevance and
+            domain consensus scores.
+        k : int
+            Number of terms.
+        ranked_terms : list
+            (term, decision score) pairs, the best one first.
 
+        Returns
+        -------
+        None.
+        """
+        os.makedirs(os.getcwd() + "/Output", exist_ok=True)
 
-class TermDecisionTest(unittest.TestCase):
-    """A class for TermDecision units testing."""
+        with open(os.getcwd() + "/Output/" + "top_" + str(k) + "_" +
+                  str(alpha) + ".txt", 'w') as f:
 
-    def test_decision_function(self):
-        """Test that the method returnes correct result."""
-        candidates = [('a', 'b'), ('a', 'c'), ('a', 'a'), ('a', 'b')]
-        relevance = {('a', 'b'): 1.0, ('a', 'c'): 0.25, ('a', 'a'): 0.5}
-        consensus = {('a', 'b'): 0.5, ('a', 'c'): 0.01, ('a', 'a'): 0.1}
-        alpha = 0.6
-        theta = 0.3
-        result = {('a', 'b'): 0.8, ('a', 'a'): 0.33999999999999997}
+            f.write("\u03b1 = " + str(alpha) + ', ' + "k = " + str(k) + '\n')
 
-        self.assertEqual(TermDecision().decision_function(candidates,
-                                                          relevance, consensus,
-                                                          alpha, theta),
-                         result, "result is not correct.")
-        print("Decision function testing is successfully executed!")
+            for key, value in ranked_terms:
+                f.write(key[0] + ' ' + key[1] + '\t' + str(value) + '\n')
 
-    def test_outputter(self):
-        """Test  that outputter() method creates a file."""
-        alpha = 0.6
-        theta = 0.3
-        final_terms = {('a', 'b'): 0.8, ('a', 'a'): 0.33999999999999997}
-        TermDecision().outputter(alpha, theta, final_terms)
 
-        outputter_result = os.getcwd() + "/Output/result_0.6_0.3.txt"
-        self.assertTrue(os.path.isfile(outputter_result),
-                        "no such file was found.")
-        print("Output functionn testing is successfully executed!")
+##############################################################################
+#                          A CLASS DEMONSTRATION                             #
+##############################################################################
 
 
                  ##########################
@@ -226,6 +536,10 @@ def term_decision_demo():
 
 if __name__ == "__main__":
     term_decision_demo()
+    # the tests are kept in test_TermDecision.py, so importing the
+    # class does not load unittest
+    import unittest
+    from test_TermDecision import TermDecisionTest
     unittest.main()
     print("\n")
     print("TermDecision Class testing is done!")
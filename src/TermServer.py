@@ -0,0 +1,360 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Datum: 17.10.2026
+# Mac OS
+"""
+Zweck: ein lokaler Dienst, der die Statistiken im Speicher behält und
+Anfragen zur Terminologieextraktion beantwortet.
+
+Autorin: Daryna Ivanova
+"""
+
+import os
+import json
+import hashlib
+import socketserver
+
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+try:
+    from src.CandidateSelection import CandidateSelection
+    from src.CorpusState import CorpusState
+    from src.TermDecision import TermDecision
+except ModuleNotFoundError:
+    from CandidateSelection import CandidateSelection
+    from CorpusState import CorpusState
+    from TermDecision import TermDecision
+
+
+class TermServer():
+    """
+    Answer scoring, sweep and ingest requests from a warm CorpusState.
+
+    Reference frequencies, the POS tagger and the domain statistics are
+    loaded once and stay in memory, so a request only costs the work it
+    asks for. Requests are JSON objects sent with POST, answers are JSON
+    objects:
+
+    - /score  {"candidates": [["machine", "learning"], ...],
+               "alpha": 0.5}
+      Domain Relevance, Domain Consensus and the decision score of every
+      candidate, null for unknown candidates.
+    - /sweep  {"alphas": [...], "thetas": [...],
+               "gold": [["machine", "learning"], ...]}
+      Precision, recall and number of terms of every combination. Without
+      "gold" the gold standard of the server is used.
+    - /terms  {"alpha": 0.5, "theta": 0.3}
+      Final terms of a combination.
+    - /ingest {"texts": ["...", ...], "names": [...]} or
+              {"corpus": "acl_texts"}
+      Adds received texts (named by their hash without "names") or
+      synchronizes a directory or an archive.
+    - /save   {}
+      Writes the state to its file.
+
+    GET /status gives the number of texts and candidates.
+
+    Methods
+    -------
+    handle(path: str, request: dict)
+        Answers a request.
+
+    serve(address: str)
+        Listens on a local TCP port or a Unix socket.
+    """
+
+    def __init__(self, state: CorpusState, gold_terminology=frozenset(),
+                 workers: int = 1, cache=None):
+        """
+        Parameters
+        ----------
+        state : CorpusState
+            Domain statistics, updated by ingest requests.
+        gold_terminology : frozenset
+            Gold standard terms for sweep requests.
+        workers : int
+            Number of processes, which handle ingested documents.
+        cache : ArtifactCache
+            Reuse candidates of documents, which were handled before.
+        """
+        self.state = state
+        self.gold_terminology = frozenset(gold_terminology)
+        self.workers = workers
+        self.cache = cache
+
+    def warm_up(self):
+        """Load the stopwords and the POS tagger before the first request."""
+        selection = CandidateSelection()
+        selection.stopword_lexicon()
+        selection.pos_tags(('language', 'processing'))
+
+    def handle(self, path: str, request: dict) -> dict:
+        """
+        Answer a request.
+
+        Parameters
+        ----------
+        path : str
+            '/score', '/sweep', '/terms', '/ingest', '/save' or '/status'.
+        request : dict
+            Parameters of the request.
+
+        Returns
+        -------
+        answer : dict
+            Result of the request.
+        """
+        handlers = {'/score': self._score, '/sweep': self._sweep,
+                    '/terms': self._terms, '/ingest': self._ingest,
+                    '/save': self._save, '/status': self._status}
+
+        if path not in handlers:
+            raise KeyError("unknown request: " + path)
+
+        return handlers[path](request)
+
+    def serve(self, address: str):
+        """
+        Listen on a local TCP port or a Unix socket until interrupted.
+
+        Parameters
+        ----------
+        address : str
+            'host:port', 'port' for 127.0.0.1 or a path of a Unix socket.
+
+        Returns
+        -------
+        None.
+        """
+        server = self.http_server(address)
+        print("Serving on " + address)
+
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+            if isinstance(server, socketserver.UnixStreamServer):
+                os.remove(address)
+
+    def http_server(self, address: str):
+        """Create an HTTP server for an address, see serve."""
+        handler = _handler(self)
+
+        if address.isdigit():
+            address = ':' + address
+        if ':' in address and '/' not in address:
+            host, port = address.rsplit(':', 1)
+            # only local clients, unless a host is given explicitly
+            return HTTPServer((host or '127.0.0.1', int(port)), handler)
+
+        if os.path.exists(address):
+            os.remove(address)
+
+        return _UnixHTTPServer(address, handler)
+
+    def _score(self, request: dict) -> dict:
+        """Scores of the requested candidates."""
+        table = self.state.table
+        alpha = float(request.get('alpha', 0.5))
+        relevance = table.columns['relevance']
+        consensus = table.columns['consensus']
+        active = table.active
+
+        scores = []
+        for first_word, second_word in request['candidates']:
+            candidate_id = table.index((first_word, second_word))
+            if candidate_id is None or not active[candidate_id]:
+                scores.append(None)
+                continue
+
+            candidate_relevance = float(relevance[candidate_id])
+            candidate_consensus = float(consensus[candidate_id])
+            scores.append({'relevance': candidate_relevance,
+                           'consensus': candidate_consensus,
+                           'decision': alpha * candidate_relevance +
+                           (1 - alpha) * candidate_consensus})
+
+        return {'scores': scores}
+
+    def _sweep(self, request: dict) -> dict:
+        """Precision, recall and number of terms for a grid."""
+        gold = self.gold_terminology
+        if 'gold' in request:
+            gold = frozenset(tuple(term) for term in request['gold'])
+
+        precision, recall, n_terms = TermDecision().table_grid(
+            self.state.table, request['alphas'], request['thetas'], gold)
+
+        return {'alphas': request['alphas'], 'thetas': request['thetas'],
+                'precision': precision.tolist(), 'recall': recall.tolist(),
+                'n_terms': n_terms.tolist()}
+
+    def _terms(self, request: dict) -> dict:
+        """Final terms of a combination, the best one first."""
+        final_terms = TermDecision().table_decision(
+            self.state.table, float(request['alpha']),
+            float(request['theta']))
+        ranked_terms = sorted(final_terms.items(), key=lambda item: -item[1])
+
+        return {'terms': [[term[0], term[1], score] for term, score in
+                          ranked_terms]}
+
+    def _ingest(self, request: dict) -> dict:
+        """
+        Add received texts or synchronize a corpus.
+
+        The request is checked before the state is changed, and the state
+        only changes once all documents are handled, so a failed request
+        leaves it as it was.
+        """
+        if 'corpus' in request:
+            corpus = request['corpus']
+            cwd = os.path.realpath(os.getcwd())
+            path = os.path.realpath(os.path.join(cwd, str(corpus)))
+            # clients may only read below the working directory
+            if os.path.commonpath((cwd, path)) != cwd:
+                raise ValueError("corpus outside the working directory: " +
+                                 str(corpus))
+            if not os.path.exists(path):
+                raise ValueError("corpus not found: " + str(corpus))
+            n_added, n_removed = self.state.sync(
+                corpus, workers=self.workers, cache=self.cache)
+            return {'added': n_added, 'removed': n_removed}
+
+        texts = request['texts']
+        if not isinstance(texts, list) or not all(
+                isinstance(text, str) for text in texts):
+            raise ValueError("texts must be a list of strings")
+        contents = [text.encode('utf-8') for text in texts]
+
+        names = request.get('names')
+        if names is None:
+            names = [hashlib.sha1(content).hexdigest() for content in
+                     contents]
+        if not isinstance(names, list) or not all(
+                isinstance(name, str) for name in names):
+            raise ValueError("names must be a list of strings")
+        if len(names) != len(contents):
+            raise ValueError("got " + str(len(names)) + " names for " +
+                             str(len(contents)) + " texts")
+        if len(set(names)) != len(names):
+            raise ValueError("names must be unique")
+
+        n_added = self.state.add_contents(dict(zip(names, contents)),
+                                          workers=self.workers,
+                                          cache=self.cache)
+
+        return {'added': n_added, 'removed': 0}
+
+    def _save(self, request: dict) -> dict:
+        """Write the state to its file."""
+        if self.state.state_file is None:
+            raise ValueError("the server was started without a state file")
+        self.state.save()
+
+        return {'saved': self.state.state_file}
+
+    def _status(self, request: dict) -> dict:
+        """Number of texts and candidates."""
+        return {'texts': len(self.state.documents),
+                'candidates': int(self.state.table.active.sum())}
+
+
+class _UnixHTTPServer(socketserver.UnixStreamServer):
+    """HTTP server on a Unix socket."""
+
+    def get_request(self):
+        request, _ = super().get_request()
+        # BaseHTTPRequestHandler expects a (host, port) client address
+        return request, ('local', 0)
+
+
+def _handler(term_server: TermServer):
+    """Create a request handler class, which answers with term_server."""
+
+    class Handler(BaseHTTPRequestHandler):
+
+        def do_GET(self):
+            self._answer({})
+
+        def do_POST(self):
+            length = int(self.headers.get('Content-Length', 0))
+            try:
+                request = json.loads(self.rfile.read(length) or b'{}')
+            except ValueError as error:
+                self._send(400, {'error': str(error)})
+                return
+            self._answer(request)
+
+        def log_message(self, format, *args):
+            pass
+
+        def _answer(self, request: dict):
+            try:
+                answer = term_server.handle(self.path, request)
+            except (KeyError, ValueError, TypeError) as error:
+                self._send(400, {'error': str(error)})
+                return
+            except Exception as error:
+                # e.g. an unreadable file, the client still gets an answer
+                self._send(500, {'error': type(error).__name__ + ': ' +
+                                 str(error)})
+                return
+            self._send(200, answer)
+
+        def _send(self, status: int, answer: dict):
+            body = json.dumps(answer).encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    return Handler
+
+
+##############################################################################
+#                          A CLASS DEMONSTRATION                             #
+##############################################################################
+
+
+                 ##########################
+                 ###   DEMONSTRATION   ####
+                 ##########################
+
+
+def term_server_demo():
+    """Demonstrate how TermServer class can be used."""
+    print("\n")
+    print("-------------------------------------")
+    print("TermServer Class Demonstration")
+    print("-------------------------------------")
+    print("\n")
+    print('\t', "Start the server from the main directory: ")
+    print("\n")
+    print("python3 main.py acl_texts '0.5' '0.3' gold_terminology.txt",
+          "--state state.pickle --serve localhost:8080")
+    print("\n")
+    print('\t', "Ask for scores: ")
+    print("\n")
+    print("curl -d '{\"candidates\": [[\"machine\", \"translation\"]]}'",
+          "localhost:8080/score")
+    print("\n")
+    print("==================================================================")
+    print("\n")
+    print("\n")
+    print("TESTING BEGINS...")
+    print("\n")
+
+
+if __name__ == "__main__":
+    term_server_demo()
+    # the tests are kept in test_TermServer.py, so importing the
+    # class does not load unittest
+    import unittest
+    from test_TermServer import TermServerTest
+    unittest.main()
+    print("\n")
+    print("TermServer Class testing is done!")
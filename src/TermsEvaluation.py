@@ -8,7 +8,6 @@ Zweck: die Bewertung von den Ergebnissen.
 Autorin: Daryna Ivanova
 """
 
-import unittest
 
 
 class TermsEvaluation():
@@ -20,8 +19,14 @@ class TermsEvaluation():
      gold_terminology(goldstandard_file: str)
          Gets terminology from a txt file.
 
+     gold_index(goldstandard_file: str)
+         Gets terminology from a txt file as a hashed index.
+
     precision_and_recall(final_terms: dict, gold_terminology_bigrams: list)
         Calculates measures of quality and quantity.
+
+    precision_recall_curve(ranked_terms: list, gold_index: frozenset)
+        Calculates precision and recall for every cutoff of a ranking.
     """
 
     def gold_terminology(self, goldstandard_file: str) -> list:
@@ -49,6 +54,24 @@ class TermsEvaluation():
 
         return gold_term_bigrams
 
+    def gold_index(self, goldstandard_file: str) -> frozenset:
+        """
+        Convert a txt file in a hashed index of bigrams.
+
+        Membership tests cost O(1) instead of O(|gold standard|) for a list.
+
+        Parameters
+        ----------
+        goldstandard_file : str
+            A file name.
+
+        Returns
+        -------
+        gold_index : frozenset
+            Terms from the gold standard.
+        """
+        return frozenset(self.gold_terminology(goldstandard_file))
+
     def precision_and_recall(self, final_terms: dict,
                              gold_terminology_bigrams: list) -> tuple:
         """
@@ -58,75 +81,114 @@ class TermsEvaluation():
         ----------
         final_terms : list
             Final terminology for a combination with the decision scores.
-        gold_terminology_bigrams : list
-            Gold standard terms.
+        gold_terminology_bigrams : list or frozenset
+            Gold standard terms. A list is hashed once per call, so pass the
+            result of gold_index when evaluating many combinations.
 
         Returns
         -------
         precision, recall : tuple
             precision : float
                 The fraction of retrieved terms that are relevant to the query.
+                0 if no terms were retrieved.
             recall : float
                  The fraction of the relevant terms that are successfully
-                 retrieved.
+                 retrieved. 0 if the gold standard is empty.
         """
         n_of_relevant_terms = len(gold_terminology_bigrams)
         n_of_retrieved_terms = len(final_terms)
         n_of_retrieved_relevant_terms = 0
 
+        gold = gold_terminology_bigrams
+        if not isinstance(gold, (set, frozenset)):
+            gold = set(gold)
+
         final_terms_keys = final_terms.keys()
 
         for key in final_terms_keys:
 
-            if key in gold_terminology_bigrams:
+            if key in gold:
                 n_of_retrieved_relevant_terms += 1
 
-        precision = n_of_retrieved_relevant_terms / n_of_retrieved_terms
-        recall = n_of_retrieved_relevant_terms / n_of_relevant_terms
+        precision = 0.0
+        recall = 0.0
+
+        if n_of_retrieved_terms > 0:
+            precision = n_of_retrieved_relevant_terms / n_of_retrieved_terms
+        if n_of_relevant_terms > 0:
+            recall = n_of_retrieved_relevant_terms / n_of_relevant_terms
 
         return precision, recall
 
+    def precision_recall_curve(self, ranked_terms: list,
+                               gold_index: frozenset) -> tuple:
+        """
+        Calculate precision and recall for every cutoff of a ranking.
 
-##############################################################################
-#                    A CLASS TESTING AND DEMONSTRATION                       #
-##############################################################################
+        The ranking is read once: precision and recall of the k best terms
+        follow from the number of gold terms among them.
 
+        Parameters
+        ----------
+        ranked_terms : list
+            Terms sorted by their decision scores, the best one first. Items
+            may also be (term, score) pairs.
+        gold_index : frozenset
+            Gold standard terms, see gold_index.
+
+        Returns
+        -------
+        precisions, recalls, average_precision, best_cutoff : tuple
+            precisions : list
+                Precision of the k best terms at the position k - 1.
+            recalls : list
+                Recall of the k best terms at the position k - 1.
+            average_precision : float
+                Mean of the precisions at the positions of gold terms, over
+                all gold terms.
+            best_cutoff : tuple
+                (k, f1): the number of best terms with the highest F1 score
+                and this score. (0, 0.0) if no gold term was retrieved.
+        """
+        n_of_relevant_terms = len(gold_index)
+        n_of_retrieved_relevant_terms = 0
+        precision_sum = 0.0
+        best_cutoff = (0, 0.0)
+
+        precisions = []
+        recalls = []
 
-                 ###################
-                 ###   TESTING   ###
-                 ###################
-
-
-class TermsEvaluationTest(unittest.TestCase):
-    """A class for TermsEvaluation units testing."""
-
-    def test_gold_terminology(self):
-        """Test gold_termiology(goldstandard_file: str) method."""
-        path_to_file = "toy_goldstandard.txt"
-        self.assertEqual(TermsEvaluation().gold_terminology(path_to_file),
-                         [('computational', 'linguistics'),
-                          ('language', 'processing'),
-                          ('automatic', 'processing'),
-                          ('data', 'driven'),
-                          ('machine', 'learning'),
-                          ('applied', 'linguistics'),
-                          ('data', 'mining')], "incorrect data extraction!")
-        print("Gold terminology convertation test is successfully executed!")
-
-    def test_precision_and_recall(self):
-        """Test that precision and recall return correct results."""
-        final_terms = {('machine', 'learning'): 0.8, ('data', 'mining'): 0.75}
-        gold_terms = [('computational', 'linguistics'),
-                      ('language', 'processing'),
-                      ('automatic', 'processing'),
-                      ('data', 'driven'),
-                      ('machine', 'learning'),
-                      ('applied', 'linguistics'),
-                      ('data', 'mining')]
-        self.assertTupleEqual(TermsEvaluation().precision_and_recall(
-            final_terms, gold_terms), (1.0, 0.2857142857142857),
-            "incorrect result.")
-        print("Precision and recall test is successfully executed!")
+        for k, term in enumerate(ranked_terms, start=1):
+            if isinstance(term[0], tuple):
+                term = term[0]
+
+            if term in gold_index:
+                n_of_retrieved_relevant_terms += 1
+                precision_sum += n_of_retrieved_relevant_terms / k
+
+            precision = n_of_retrieved_relevant_terms / k
+            recall = 0.0
+            if n_of_relevant_terms > 0:
+                recall = n_of_retrieved_relevant_terms / n_of_relevant_terms
+
+            precisions.append(precision)
+            recalls.append(recall)
+
+            if precision + recall > 0:
+                f1 = 2 * precision * recall / (precision + recall)
+                if f1 > best_cutoff[1]:
+                    best_cutoff = (k, f1)
+
+        average_precision = 0.0
+        if n_of_relevant_terms > 0:
+            average_precision = precision_sum / n_of_relevant_terms
+
+        return precisions, recalls, average_precision, best_cutoff
+
+
+##############################################################################
+#                          A CLASS DEMONSTRATION                             #
+##############################################################################
 
 
                  ##########################
@@ -196,6 +258,10 @@ def terms_evaluation_demo():
 
 if __name__ == "__main__":
     terms_evaluation_demo()
+    # the tests are kept in test_TermsEvaluation.py, so importing the
+    # class does not load unittest
+    import unittest
+    from test_TermsEvaluation import TermsEvaluationTest
     unittest.main()
     print("\n")
     print("TermsEvaluation Class testing is done!")
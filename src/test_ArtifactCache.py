@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Datum: 17.10.2026
+# Mac OS
+"""
+Zweck: die Klasse ArtifactCache zu testen.
+
+Autorin: Daryna Ivanova
+"""
+
+import os
+import tempfile
+import unittest
+
+try:
+    from src.ArtifactCache import ArtifactCache
+except ModuleNotFoundError:
+    from ArtifactCache import ArtifactCache
+
+
+class ArtifactCacheTest(unittest.TestCase):
+    """A class for ArtifactCache units testing."""
+
+    def test_put_and_get(self):
+        """Test that stored candidates are loaded unchanged."""
+        doc = {('language', 'processing'): 2, ('machine', 'learning'): 1}
+
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = ArtifactCache(os.path.join(tmp, 'documents.sqlite'))
+            key = cache.key(b'language processing')
+            self.assertIsNone(cache.get(key), "cache should be empty.")
+
+            cache.put(key, doc)
+            self.assertEqual(cache.get(key), doc, "candidates do not match.")
+            self.assertEqual(list(cache.get(key)), list(doc),
+                             "order of candidates is not kept.")
+            cache.close()
+        print("Artifact cache testing is successfully executed!")
+
+    def test_key(self):
+        """Test that a key depends on content and configuration."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'documents.sqlite')
+            first = ArtifactCache(path, ('stopwords', 3))
+            second = ArtifactCache(path, ('stopwords', 0))
+
+            self.assertNotEqual(first.key(b'a'), first.key(b'b'),
+                                "content should change the key.")
+            self.assertNotEqual(first.key(b'a'), second.key(b'a'),
+                                "configuration should change the key.")
+            first.close()
+            second.close()
+        print("Artifact key testing is successfully executed!")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Datum: 17.10.2026
+# Mac OS
+"""
+Zweck: die Klasse Benchmark zu testen.
+
+Autorin: Daryna Ivanova
+"""
+
+import unittest
+
+try:
+    from src.Benchmark import Benchmark, ZipfCorpus
+except ModuleNotFoundError:
+    from Benchmark import Benchmark, ZipfCorpus
+
+
+class BenchmarkTest(unittest.TestCase):
+    """A class for ZipfCorpus and Benchmark units testing."""
+
+    def test_zipf_corpus(self):
+        """Test that the corpus is reproducible and Zipfian."""
+        corpus = ZipfCorpus(5, doc_length=200, vocabulary=1000)
+        first = list(corpus.documents())
+        self.assertEqual(first, list(corpus.documents()),
+                         "the same seed should give the same corpus.")
+
+        for tokens in first:
+            self.assertEqual(len(tokens), 200)
+            self.assertTrue(all(token.isalpha() for token in tokens),
+                            "words should be alphabetic.")
+
+        tokens = [token for doc in first for token in doc]
+        self.assertGreater(tokens.count(corpus.word(0)),
+                           tokens.count(corpus.word(50)),
+                           "frequent ranks should occur more often.")
+        print("Zipf corpus testing is successfully executed!")
+
+    def test_compare(self):
+        """Test that regressions are found."""
+        baseline = {'results': [
+            {'stage': 'relevance', 'size': 10, 'status': 'ok',
+             'seconds': 1.0, 'peak_bytes': 100},
+            {'stage': 'term_distr', 'size': 10, 'status': 'ok',
+             'seconds': 1.0, 'peak_bytes': 100}]}
+        results = {'results': [
+            {'stage': 'relevance', 'size': 10, 'status': 'ok',
+             'seconds': 1.1, 'peak_bytes': 100},
+            {'stage': 'term_distr', 'size': 10, 'status': 'ok',
+             'seconds': 3.0, 'peak_bytes': 100}]}
+
+        rows = Benchmark().compare(results, baseline)
+        self.assertEqual([row[4] for row in rows], [False, True],
+                         "incorrect regressions.")
+        print("Benchmark comparison testing is successfully executed!")
+
+    def test_measure(self):
+        """Test that a stage is measured."""
+        benchmark = Benchmark(repeats=1)
+        output = benchmark.measure('sum', 3, sum, [1, 2, 3])
+        self.assertEqual(output, 6)
+        self.assertEqual(benchmark.results[0]['status'], 'ok')
+        self.assertIn('peak_bytes', benchmark.results[0])
+
+        # setup runs before the traced and every timed run
+        calls = []
+        benchmark.measure('sum', 3, sum, [1, 2, 3],
+                          setup=lambda: calls.append(1))
+        self.assertEqual(len(calls), 2)
+        print("Benchmark measurement testing is successfully executed!")
+
+
+if __name__ == "__main__":
+    unittest.main()
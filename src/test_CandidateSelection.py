@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Datum: 17.10.2026
+# Mac OS
+"""
+Zweck: die Klasse CandidateSelection zu testen.
+
+Autorin: Daryna Ivanova
+"""
+
+import os
+import tempfile
+import unittest
+
+try:
+    from src.CandidateSelection import CandidateSelection
+except ModuleNotFoundError:
+    from CandidateSelection import CandidateSelection
+
+
+class TestCandidateSelection(unittest.TestCase):
+    """A class for CandidateSelection units testing."""
+
+    def test_text_files_getter(self):
+        """
+        Test that Method can get data from a given folder and convert it into
+        bigrams, checking the accepted POS-Tags combinations.
+        """
+        folder_name = 'test_folder'
+        opt = CandidateSelection().frequency_filter
+        noun = CandidateSelection().isNoun
+        adj = CandidateSelection().isAdjective
+        v = CandidateSelection().isVerb
+        res = CandidateSelection().text_files_getter(folder_name, 0,
+                                                     function=opt,
+                                                     is_noun=noun,
+                                                     is_adj=adj,
+                                                     is_verb=v)
+        self.assertEqual(list(res[0].keys()), [('language', 'processing')],
+                         "incorrect result may be caused by hidden files \
+                        (e.g. .DS_Store on Mac OS). Make sure they are \
+                        deleted.")
+        print("Text files getter testing is successfully executed!")
+
+    def test_text_files_getter_workers(self):
+        """Test that worker processes give the same result as one process."""
+        folder_name = 'test_folder'
+        serial = CandidateSelection().text_files_getter(folder_name, 0)
+        documents = CandidateSelection().counters()['documents']
+        parallel = CandidateSelection().text_files_getter(folder_name, 0,
+                                                          workers=2)
+        self.assertEqual(serial[0], parallel[0],
+                         "candidates_total differs with worker processes.")
+        self.assertEqual(serial[1], parallel[1],
+                         "candidates_per_doc differs with worker processes.")
+        self.assertEqual(CandidateSelection().counters()['documents'],
+                         documents + 2,
+                         "documents of worker processes are not counted.")
+        print("Parallel text files getter testing is successfully executed!")
+
+    def test_archive_candidates(self):
+        """Test that an archive gives the candidates of the directory."""
+        import tarfile
+
+        folder_name = 'test_folder'
+        files = sorted(os.listdir(folder_name))
+        expected = list(CandidateSelection().iter_file_candidates(
+            [os.getcwd() + '/' + folder_name + '/' + file for file in files],
+            0))
+
+        with tempfile.TemporaryDirectory() as tmp:
+            with tarfile.open(tmp + '/texts.tar.gz', 'w:gz') as archive:
+                for file in files:
+                    archive.add(folder_name + '/' + file)
+
+            result = list(CandidateSelection().iter_document_candidates(
+                tmp + '/texts.tar.gz', 0))
+
+        self.assertEqual(result, expected,
+                         "candidates of the archive are not correct.")
+        print("Archive candidates testing is successfully executed!")
+
+    def test_document_cache(self):
+        """Test that cached candidates match extracted ones."""
+        folder_name = 'test_folder'
+        with tempfile.TemporaryDirectory() as tmp:
+            selection = CandidateSelection()
+            cache = selection.document_cache(0, tmp + '/documents.sqlite')
+            first = list(selection.iter_document_candidates(
+                folder_name, 0, cache=cache))
+            second = list(selection.iter_document_candidates(
+                folder_name, 0, cache=cache))
+            self.assertEqual(first, second, "cached candidates differ.")
+            self.assertEqual(cache.hits, 2, "documents were not cached.")
+            cache.close()
+        print("Document cache testing is successfully executed!")
+
+    def test_pos_tags(self):
+        """Test that memoized POS-Tags match nltk.pos_tag."""
+        import nltk
+
+        bigram = ('language', 'processing')
+        expected = tuple(tag for _, tag in nltk.pos_tag(bigram))
+        self.assertEqual(CandidateSelection().pos_tags(bigram), expected,
+                         "POS-Tags differ from nltk.pos_tag.")
+        self.assertEqual(CandidateSelection().pos_tags(bigram), expected,
+                         "memoized POS-Tags differ from nltk.pos_tag.")
+        print("POS-Tags testing is successfully executed!")
+
+    def test_pos_tags_memo(self):
+        """Test that the memo of POS-Tags keeps a bounded number of tags."""
+        # imported here, so that the program start does not load them
+        import sys
+        from unittest import mock
+
+        module = sys.modules[CandidateSelection.__module__]
+        tagger = mock.Mock()
+        tagger.tag.side_effect = lambda words: [(word, 'NN') for word in
+                                                words]
+
+        module._bigram_tags.cache_clear()
+        with mock.patch.object(module, '_TAGGER', tagger):
+            for number in range(3):
+                CandidateSelection().pos_tags(('word', 'w' * number))
+            CandidateSelection().pos_tags(('word', ''))
+        info = module._bigram_tags.cache_info()
+        module._bigram_tags.cache_clear()
+
+        self.assertEqual(tagger.tag.call_count, 3,
+                         "a memoized bigram was tagged again.")
+        self.assertEqual(info.maxsize, module._BIGRAM_TAGS_SIZE)
+        print("POS-Tags memo testing is successfully executed!")
+
+    def test_reuters_corpus(self):
+        """Check if a dictionary with frequencies was created."""
+        opt = CandidateSelection().frequency_filter
+        res = CandidateSelection().reuters_corpus(function=opt)
+        tuple_res = type(res[0]) is dict
+        self.assertTrue(tuple_res, "reuters_freq result doesn't contain \
+                        dictionary.")
+        print("Reuters corpus testing is successfully executed!")
+
+    def test_filter_text_files(self):
+        """Test that tokens are in lowercase and filtered."""
+        corpus = ['Language', 'proceSsing', 'linguistics', 'PROVIDES',
+                  'automatic', 'language', 'processing', 'the', '12345']
+        opt = CandidateSelection().frequency_filter
+        res = CandidateSelection().filter_text_files(corpus, 2, function=opt)
+        expect = [('language', 'processing'), ('processing', 'language'),
+                  ('language', 'processing')]
+        self.assertEqual(expect, res, "either stop words/ numbers or \
+                          punctuation were not removed or tokens are not in \
+                              a lower case.")
+        print("Text files filter testing is successfully executed!")
+
+    def test_bigram_counts(self):
+        """Test that the fused kernel matches filter_text_files."""
+        corpus = ['Language', 'proceSsing', 'linguistics', 'PROVIDES',
+                  'automatic', 'language', 'processing', 'the', '12345']
+        from nltk import FreqDist
+
+        selection = CandidateSelection()
+        for n in (0, 2, 3):
+            expect = dict(FreqDist(selection.filter_text_files(corpus, n)))
+            self.assertEqual(selection.bigram_counts(iter(corpus), n), expect,
+                             "fused kernel differs from filter_text_files.")
+        print("Bigram counts testing is successfully executed!")
+
+    def test_stopword_lexicon(self):
+        """Test that whole words from stopwords.txt are stopwords."""
+        lexicon = CandidateSelection().stopword_lexicon()
+        for word in ('about', 'across', 'interesting'):
+            self.assertIn(word, lexicon, "stopwords.txt words are missing.")
+        print("Stopword lexicon testing is successfully executed!")
+
+    def test_frequency_filter_tuple(self):
+        """Test that a result element is a tuple."""
+        tokens = ['language', 'processing', 'linguistics', 'provides',
+                  'automatic', 'language', 'processing']
+        res = CandidateSelection().frequency_filter(tokens, 0)
+        for element in res:
+            self.assertIsInstance(element, tuple,
+                                  "result elements should be tuples")
+        print("Frequency filter tests are successfully executed!")
+
+    def test_frequency_filter_result(self):
+        """Test that all the words with the frequency < 3 will be ignored."""
+        tokens = ['language', 'processing', 'linguistics', 'provides',
+                  'automatic', 'language', 'processing']
+        res = CandidateSelection().frequency_filter(tokens, 3)
+        self.assertCountEqual(res, [],
+                              "doesn't correspond the expected result.")
+        print("Frequency filter tests are successfully executed!")
+
+
+if __name__ == "__main__":
+    unittest.main()
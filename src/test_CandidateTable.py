@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Datum: 17.10.2026
+# Mac OS
+"""
+Zweck: die Klasse CandidateTable zu testen.
+
+Autorin: Daryna Ivanova
+"""
+
+import unittest
+
+try:
+    from src.CandidateTable import CandidateTable
+except ModuleNotFoundError:
+    from CandidateTable import CandidateTable
+
+
+class CandidateTableTest(unittest.TestCase):
+    """A class for CandidateTable units testing."""
+
+    candidates_per_doc = [
+        {('machine', 'learning'): 1, ('learning', 'data'): 1,
+         ('data', 'outcome'): 1}, {('machine', 'learning'): 2}]
+
+    def test_add_document(self):
+        """Test that candidates are interned and counted."""
+        table = CandidateTable()
+        for doc in self.candidates_per_doc:
+            table.add_document(doc)
+
+        self.assertEqual(len(table), 3, "incorrect number of candidates.")
+        self.assertEqual(table.to_dict('counts'),
+                         {('machine', 'learning'): 3, ('learning', 'data'): 1,
+                          ('data', 'outcome'): 1}, "incorrect frequencies.")
+        self.assertEqual(table.index(('learning', 'data')), 1,
+                         "incorrect candidate id.")
+        self.assertIsNone(table.index(('data', 'machine')),
+                          "a bigram is not a candidate.")
+        self.assertEqual(table.words, ['machine', 'learning', 'data',
+                                       'outcome'], "incorrect words.")
+        print("Add document testing is successfully executed!")
+
+    def test_documents(self):
+        """Test that per-document frequencies are kept."""
+        table = CandidateTable()
+        for doc in self.candidates_per_doc:
+            table.add_document(doc)
+
+        documents = [(list(ids), list(counts)) for ids, counts in
+                     table.documents()]
+        self.assertEqual(documents, [([0, 1, 2], [1, 1, 1]), ([0], [2])],
+                         "incorrect per-document frequencies.")
+        self.assertAlmostEqual(table.log_sums[0], 2.0)
+
+        indptr, indices, data = table.document_matrix()
+        self.assertEqual((indptr.tolist(), indices.tolist(), data.tolist()),
+                         ([0, 3, 4], [0, 1, 2, 0], [1, 1, 1, 2]),
+                         "incorrect sparse matrix.")
+        print("Documents testing is successfully executed!")
+
+    def test_remove_document(self):
+        """Test that removing a document restores the frequencies."""
+        table = CandidateTable(keep_documents=False)
+        for doc in self.candidates_per_doc:
+            table.add_document(doc)
+        table.remove_document(self.candidates_per_doc[0])
+
+        self.assertEqual(table.counts.tolist(), [2, 0, 0],
+                         "incorrect frequencies.")
+        self.assertEqual(table.active.tolist(), [True, False, False],
+                         "removed candidates should not be active.")
+        self.assertEqual(table.n_docs, 1, "incorrect number of documents.")
+        print("Remove document testing is successfully executed!")
+
+    def test_aligned(self):
+        """Test that frequencies are aligned to the candidate ids."""
+        table = CandidateTable()
+        for doc in self.candidates_per_doc:
+            table.add_document(doc)
+
+        reference_freq = {('data', 'outcome'): 4, ('big', 'data'): 2}
+        self.assertEqual(table.aligned(reference_freq).tolist(), [0, 0, 4],
+                         "frequencies are not aligned.")
+        print("Aligned frequencies testing is successfully executed!")
+
+
+if __name__ == "__main__":
+    unittest.main()
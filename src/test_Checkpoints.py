@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Datum: 17.10.2026
+# Mac OS
+"""
+Zweck: die Klasse Checkpoints zu testen.
+
+Autorin: Daryna Ivanova
+"""
+
+import os
+import tempfile
+import unittest
+
+try:
+    from src.Checkpoints import Checkpoints, input_fingerprint
+except ModuleNotFoundError:
+    from Checkpoints import Checkpoints, input_fingerprint
+
+
+class CheckpointsTest(unittest.TestCase):
+    """A class for Checkpoints units testing."""
+
+    def test_store_and_load(self):
+        """Test that a checkpoint is only used for its key with resume."""
+        with tempfile.TemporaryDirectory() as tmp:
+            key = Checkpoints(tmp).key('corpus', 3)
+            Checkpoints(tmp).store('candidates', key, {('a', 'b'): 1})
+            self.assertEqual(os.listdir(tmp), [],
+                             "checkpoint written without resume.")
+
+            checkpoints = Checkpoints(tmp, resume=True)
+            checkpoints.store('candidates', key, {('a', 'b'): 1})
+            self.assertIsNone(Checkpoints(tmp).load('candidates', key),
+                              "checkpoint loaded without resume.")
+            self.assertEqual(checkpoints.load('candidates', key),
+                             {('a', 'b'): 1})
+            self.assertIsNone(checkpoints.load(
+                'candidates', checkpoints.key('corpus', 0)))
+            self.assertIsNone(checkpoints.load('relevance', key))
+        print("Checkpoint testing is successfully executed!")
+
+    def test_input_fingerprint(self):
+        """Test that a fingerprint changes with the directory."""
+        with tempfile.TemporaryDirectory() as tmp:
+            with open(os.path.join(tmp, 'a.txt'), 'w') as f:
+                f.write('machine learning')
+            before = input_fingerprint(tmp)
+
+            with open(os.path.join(tmp, 'b.txt'), 'w') as f:
+                f.write('data outcome')
+            self.assertNotEqual(input_fingerprint(tmp), before)
+        print("Input fingerprint testing is successfully executed!")
+
+
+if __name__ == "__main__":
+    unittest.main()
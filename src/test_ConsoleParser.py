@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Datum: 17.10.2026
+# Mac OS
+"""
+Zweck: die Klasse ConsoleParser zu testen.
+
+Autorin: Daryna Ivanova
+"""
+
+import unittest
+import argparse
+
+try:
+    from src.ConsoleParser import ConsoleParser, _shard
+except ModuleNotFoundError:
+    from ConsoleParser import ConsoleParser, _shard
+
+
+class ConsoleParserTest(unittest.TestCase):
+    """Test ConsoleParser class units."""
+
+    def test_parse(self):
+        """Test that the command-line arguments are parsed."""
+        # imported here, so that the program start does not load it
+        from unittest import mock
+
+        with mock.patch('argparse.ArgumentParser.parse_args',
+                        return_value=argparse.Namespace(
+                            corpus="clt", alpha="0.2", theta="0.4",
+                            goldstandard_file="gold.txt", top_k=None,
+                            stream=False, memory_target=None, shard=None,
+                            partial_out=None)):
+            res = ConsoleParser().parse()
+        self.assertEqual(res, ("clt", [0.2], [0.4], "gold.txt"),
+                         "arguments are not parsed.")
+        self.assertEqual(_shard('1/4'), (1, 4))
+        self.assertRaises(argparse.ArgumentTypeError, _shard, '4/4')
+        print("Arguments were successfully parsed.")
+
+    def test_invalid_combinations(self):
+        """Test that options, which need another option, are rejected."""
+        # imported here, so that the program start does not load it
+        import io
+        import sys
+        from unittest import mock
+
+        for options in (['-'], ['0.4', '--memory-target', '100'],
+                        ['0.4', '--shard', '0/2']):
+            argv = ['main.py', 'clt', '0.2'] + options + ['gold.txt']
+            with mock.patch.object(sys, 'argv', argv), \
+                    mock.patch('sys.stderr', io.StringIO()), \
+                    self.assertRaises(SystemExit):
+                ConsoleParser().parse()
+
+        with mock.patch.object(sys, 'argv', ['main.py', 'clt', '0.2', '-',
+                                             'gold.txt', '--top-k', '5']):
+            self.assertEqual(ConsoleParser().parse()[2], [])
+        print("Invalid combinations were successfully rejected.")
+
+
+if __name__ == "__main__":
+    unittest.main()
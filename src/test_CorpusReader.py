@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Datum: 17.10.2026
+# Mac OS
+"""
+Zweck: die Klasse CorpusReader zu testen.
+
+Autorin: Daryna Ivanova
+"""
+
+import os
+import gzip
+import json
+import tarfile
+import zipfile
+import tempfile
+import unittest
+
+try:
+    from src.CorpusReader import CorpusReader
+except ModuleNotFoundError:
+    from CorpusReader import CorpusReader
+
+
+class CorpusReaderTest(unittest.TestCase):
+    """A class for CorpusReader units testing."""
+
+    texts = {'a.txt': b'Machine learning predicts the outcome.',
+             'b.txt': b'Language processing provides language data.'}
+
+    def contents(self, reader: CorpusReader) -> dict:
+        """Member names and contents of a corpus."""
+        return {name.rsplit('/', 1)[-1]: content for name, content in
+                reader.documents()}
+
+    def test_archives(self):
+        """Test that every archive gives the texts of the directory."""
+        with tempfile.TemporaryDirectory() as tmp:
+            folder = os.path.join(tmp, 'texts')
+            os.mkdir(folder)
+            for name, content in self.texts.items():
+                with open(os.path.join(folder, name), 'wb') as f:
+                    f.write(content)
+
+            with tarfile.open(os.path.join(tmp, 'texts.tar.gz'), 'w:gz') as f:
+                f.add(folder, arcname='texts')
+            with zipfile.ZipFile(os.path.join(tmp, 'texts.zip'), 'w') as f:
+                for name, content in self.texts.items():
+                    f.writestr('texts/' + name, content)
+            with gzip.open(os.path.join(tmp, 'texts.jsonl.gz'), 'wt') as f:
+                for name, content in self.texts.items():
+                    f.write(json.dumps({'id': name,
+                                        'text': content.decode()}) + '\n')
+
+            for corpus in ('texts', 'texts.tar.gz', 'texts.zip',
+                           'texts.jsonl.gz'):
+                reader = CorpusReader(os.path.join(tmp, corpus))
+                self.assertEqual(self.contents(reader), self.texts,
+                                 corpus + " is not read correctly.")
+
+            self.assertTrue(CorpusReader.is_archive('texts.tar.gz'))
+            self.assertFalse(CorpusReader.is_archive('texts'))
+        print("Corpus reader testing is successfully executed!")
+
+    def test_jsonl_names(self):
+        """Test that names of JSONL records are stable and unique."""
+        records = [{'text': 'Machine learning predicts the outcome.'},
+                   {'id': 'p1', 'text': 'Language processing.'},
+                   {'id': 'p1', 'text': 'Language data.'}]
+
+        with tempfile.TemporaryDirectory() as tmp:
+            corpus = os.path.join(tmp, 'texts.jsonl')
+            names = []
+            for first in (0, 1):
+                with open(corpus, 'w') as f:
+                    for record in records[first:]:
+                        f.write(json.dumps(record) + '\n')
+                names.append([name.rsplit('/', 1)[-1] for name, _ in
+                              CorpusReader(corpus).documents()])
+
+        self.assertEqual(names[0][1:], names[1],
+                         "names depend on the line of a record.")
+        self.assertEqual(names[1], ['p1', 'p1#2'])
+        print("JSONL names testing is successfully executed!")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Datum: 17.10.2026
+# Mac OS
+"""
+Zweck: die Klasse CorpusState zu testen.
+
+Autorin: Daryna Ivanova
+"""
+
+import os
+import tempfile
+import unittest
+
+try:
+    from src.CorpusState import CorpusState
+    from src.CandidateSelection import CandidateSelection
+except ModuleNotFoundError:
+    from CorpusState import CorpusState
+    from CandidateSelection import CandidateSelection
+
+
+class CorpusStateTest(unittest.TestCase):
+    """A class for CorpusState units testing."""
+
+    reference_freq = {('machine', 'learning'): 3, ('big', 'question'): 5}
+
+    # PIPELINE_VERSION and a data fingerprint, which need no NLTK data
+    configuration = (1, 'stopwords', 'nltk')
+
+    candidates_per_doc = {
+        'a.txt': {('machine', 'learning'): 1, ('learning', 'data'): 2},
+        'b.txt': {('machine', 'learning'): 2, ('data', 'outcome'): 1},
+        'c.txt': {('learning', 'data'): 1, ('data', 'outcome'): 3}}
+
+    def scores(self, state: CorpusState) -> dict:
+        """Relevance and consensus of the active candidates."""
+        active = state.table.active
+        relevance = state.table.to_dict('relevance')
+        consensus = state.table.to_dict('consensus')
+
+        return {bigram: (round(relevance[bigram], 12),
+                         round(consensus[bigram], 12))
+                for bigram, is_active in zip(state.table.keys(),
+                                             active.tolist()) if is_active}
+
+    def test_add_and_remove(self):
+        """Test that an updated state equals a state built from scratch."""
+        updated = CorpusState(self.reference_freq, 8)
+        for name, doc in self.candidates_per_doc.items():
+            updated.add_counts(name, doc)
+        updated.remove_documents(['b.txt'])
+
+        scratch = CorpusState(self.reference_freq, 8)
+        scratch.add_counts('a.txt', self.candidates_per_doc['a.txt'])
+        scratch.add_counts('c.txt', self.candidates_per_doc['c.txt'])
+
+        self.assertEqual(self.scores(updated), self.scores(scratch),
+                         "incremental update differs from a new state.")
+        print("Add and remove testing is successfully executed!")
+
+    def test_save(self):
+        """Test that a saved state is loaded again."""
+        with tempfile.TemporaryDirectory() as tmp:
+            state_file = os.path.join(tmp, 'state.pickle')
+            state = CorpusState(self.reference_freq, 8, state_file,
+                                configuration=self.configuration)
+            state.add_counts('a.txt', self.candidates_per_doc['a.txt'])
+            state.save()
+
+            loaded = CorpusState(self.reference_freq, 8, state_file,
+                                 configuration=self.configuration)
+            self.assertEqual(list(loaded.documents), ['a.txt'],
+                             "documents were not saved.")
+            self.assertEqual(self.scores(loaded), self.scores(state),
+                             "scores were not restored.")
+
+            # another program version or NLTK data builds the state again
+            rebuilt = CorpusState(self.reference_freq, 8, state_file,
+                                  configuration=(2, 'stopwords', 'nltk'))
+            self.assertEqual(rebuilt.documents, {})
+        print("Save testing is successfully executed!")
+
+    def test_journal(self):
+        """Test that later saves only append to the journal."""
+        with tempfile.TemporaryDirectory() as tmp:
+            state_file = os.path.join(tmp, 'state.pickle')
+            state = CorpusState(self.reference_freq, 8, state_file,
+                                configuration=self.configuration)
+            for name, doc in self.candidates_per_doc.items():
+                state.add_counts(name, doc)
+            state.save()
+
+            with open(state_file, 'rb') as f:
+                saved = f.read()
+            state.remove_documents(['b.txt'])
+            state.add_counts('d.txt', {('machine', 'learning'): 5})
+            state.save()
+
+            with open(state_file, 'rb') as f:
+                self.assertEqual(f.read(), saved,
+                                 "the whole state was written again.")
+
+            # a torn record of an interrupted save is ignored
+            with open(state_file + '.journal', 'ab') as f:
+                f.write(b'\x80\x05\x95')
+
+            loaded = CorpusState(self.reference_freq, 8, state_file,
+                                 configuration=self.configuration)
+            self.assertEqual(sorted(loaded.documents),
+                             ['a.txt', 'c.txt', 'd.txt'])
+            self.assertEqual(self.scores(loaded), self.scores(state),
+                             "journal was not replayed.")
+
+            loaded.add_counts('e.txt', {('learning', 'data'): 1})
+            loaded.save()
+            self.assertIn('e.txt', CorpusState(
+                self.reference_freq, 8, state_file,
+                configuration=self.configuration).documents)
+        print("Journal testing is successfully executed!")
+
+    def test_changed_document(self):
+        """Test that a changed document replaces its earlier version."""
+        # imported here, so that the program start does not load them
+        from collections import Counter
+        from unittest import mock
+
+        def counts(state: CorpusState) -> dict:
+            return {bigram: count for bigram, count in
+                    state.table.to_dict('counts').items() if count}
+
+        def text_candidates(self, texts, filter_freq_n, **options):
+            for text in texts:
+                words = text.decode('utf-8').split()
+                yield dict(Counter(zip(words, words[1:])))
+
+        def file_candidates(self, files, filter_freq_n, **options):
+            contents = []
+            for file in files:
+                with open(file, 'rb') as f:
+                    contents.append(f.read())
+            yield from text_candidates(self, contents, filter_freq_n)
+
+        with mock.patch.object(CandidateSelection, 'iter_text_candidates',
+                               text_candidates), \
+                mock.patch.object(CandidateSelection, 'iter_file_candidates',
+                                  file_candidates), \
+                tempfile.TemporaryDirectory(dir=os.getcwd()) as tmp:
+            state = CorpusState(self.reference_freq, 8)
+            state.add_contents({'a': b'machine learning data'})
+            self.assertEqual(state.add_contents(
+                {'a': b'machine learning data'}), 0)
+            state.add_contents({'a': b'data outcome'})
+            self.assertEqual(counts(state), {('data', 'outcome'): 1})
+
+            # a failing document leaves the state unchanged
+            self.assertRaises(UnicodeDecodeError, state.add_contents,
+                              {'a': b'big question', 'c': b'\xff'})
+            self.assertEqual(counts(state), {('data', 'outcome'): 1})
+            self.assertEqual(list(state.documents), ['a'])
+
+            with open(os.path.join(tmp, 'b.txt'), 'w') as f:
+                f.write('big question')
+            folder_name = os.path.basename(tmp)
+            self.assertEqual(state.sync(folder_name), (1, 0))
+            self.assertEqual(state.sync(folder_name), (0, 0))
+
+            with open(os.path.join(tmp, 'b.txt'), 'w') as f:
+                f.write('language processing tools')
+            self.assertEqual(state.sync(folder_name), (1, 1))
+            self.assertEqual(counts(state), {('data', 'outcome'): 1,
+                                             ('language', 'processing'): 1,
+                                             ('processing', 'tools'): 1})
+        print("Changed document testing is successfully executed!")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Datum: 17.10.2026
+# Mac OS
+"""
+Zweck: die Klasse CountMinSketch zu testen.
+
+Autorin: Daryna Ivanova
+"""
+
+import os
+import tempfile
+import unittest
+import numpy as np
+
+try:
+    from src.CountMinSketch import CountMinSketch
+except ModuleNotFoundError:
+    from CountMinSketch import CountMinSketch
+
+
+class CountMinSketchTest(unittest.TestCase):
+    """A class for CountMinSketch units testing."""
+
+    def counts(self) -> dict:
+        """Zipf distributed frequencies of 5000 bigrams."""
+        generator = np.random.default_rng(0)
+        values = generator.zipf(1.5, 5000)
+
+        return {('word' + str(number), 'next'): int(value) for number, value
+                in enumerate(values.tolist())}
+
+    def test_error_bounds(self):
+        """Test that estimates are not smaller and rarely too large."""
+        counts = self.counts()
+        sketch = CountMinSketch(epsilon=1e-3, delta=0.01)
+        sketch.update(counts)
+
+        true_counts = np.array(list(counts.values()))
+        estimates = sketch.query(counts.keys())
+        bounds = sketch.error_bounds()
+
+        self.assertEqual(bounds['total'], true_counts.sum())
+        self.assertTrue((estimates >= true_counts).all(),
+                        "an estimate is smaller than the frequency.")
+        too_large = estimates > true_counts + bounds['max_overcount']
+        self.assertLessEqual(too_large.mean(), sketch.delta)
+        print("Error bounds testing is successfully executed!")
+
+    def test_save_and_load(self):
+        """Test that a loaded sketch gives the same estimates."""
+        counts = self.counts()
+        sketch = CountMinSketch(epsilon=1e-2, delta=0.05, seed=3)
+        sketch.update(counts)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            sketch_file = os.path.join(tmp, 'sketch.npz')
+            sketch.save(sketch_file)
+            loaded = CountMinSketch.load(sketch_file)
+
+        self.assertTrue((loaded.query(counts) == sketch.query(counts)).all())
+        self.assertEqual(loaded.error_bounds(), sketch.error_bounds())
+        print("Sketch file testing is successfully executed!")
+
+
+if __name__ == "__main__":
+    unittest.main()
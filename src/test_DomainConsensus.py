@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Datum: 17.10.2026
+# Mac OS
+"""
+Zweck: die Klasse DomainConsensus zu testen.
+
+Autorin: Daryna Ivanova
+"""
+
+import unittest
+
+try:
+    from src.DomainConsensus import DomainConsensus
+    from src.CandidateTable import CandidateTable
+except ModuleNotFoundError:
+    from DomainConsensus import DomainConsensus
+    from CandidateTable import CandidateTable
+
+
+class DomainConsensusTest(unittest.TestCase):
+    """A class for DomainConsensus units testing."""
+
+    def test_term_distr(self):
+        """Test that actual result corresponds the expected one."""
+        # Frequency per document
+        candidates_total = {
+            ('machine', 'learning'): 2, ('learning', 'data'): 1,
+            ('data', 'outcome'): 1}
+
+        # Candidates from the whole corpus
+        candidates = [
+            ('machine', 'learning'), ('learning', 'data'),
+            ('data', 'outcome'), ('machine', 'learning')
+            ]
+
+        # Frequency in the whole corpus
+        candidates_per_doc = [
+            {('machine', 'learning'): 1, ('learning', 'data'): 1,
+             ('data', 'outcome'): 1}, {('machine', 'learning'): 1}]
+
+        expected_result = {('machine', 'learning'): [0.5, 0.5],
+                           ('learning', 'data'): [1.0],
+                           ('data', 'outcome'): [1.0]}
+
+        self.assertEqual(DomainConsensus().term_distr(candidates_total,
+                                                      candidates_per_doc,
+                                                      candidates),
+                         expected_result, "incorrect result")
+
+        print("Term distribution testing is successfully executed!")
+
+    def test_domain_consensus(self):
+        """Test that a result type is dictionary."""
+        domain_consensus = {
+            ('machine', 'learning'): 1.0, ('learning', 'data'): 0.0,
+            ('data', 'outcome'): 0.0}
+        self.assertIsInstance(domain_consensus, dict,
+                              "output value should be of dict type.")
+        print("Domain consensus method testing is done!")
+
+    def test_table_consensus(self):
+        """Test that a table gives the same consensus as before."""
+        candidates_per_doc = [
+            {('machine', 'learning'): 1, ('learning', 'data'): 1},
+            {('machine', 'learning'): 3}]
+        expected = {('machine', 'learning'):
+                    DomainConsensus().consensus_for_term([0.25, 0.75]),
+                    ('learning', 'data'): 0.0}
+
+        for keep_documents in (True, False):
+            table = CandidateTable(keep_documents)
+            for doc in candidates_per_doc:
+                table.add_document(doc)
+            DomainConsensus().table_consensus(table)
+            res = table.to_dict('consensus')
+            for candidate, value in expected.items():
+                self.assertAlmostEqual(res[candidate], value)
+        print("Table consensus testing is successfully executed!")
+
+    def test_consensus_for_term(self):
+        """Test that result is a float number."""
+        ptd_for_a_term = [0.01, 0.5]
+        self.assertIsNotNone(DomainConsensus().consensus_for_term(
+                                                        ptd_for_a_term),
+                             "a resulting value should be float, not None")
+        print("Consensus for a term testing is successfully executed!")
+
+
+if __name__ == "__main__":
+    unittest.main()
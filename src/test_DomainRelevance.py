@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Datum: 17.10.2026
+# Mac OS
+"""
+Zweck: die Klasse DomainRelevance zu testen.
+
+Autorin: Daryna Ivanova
+"""
+
+import unittest
+import numpy as np
+
+try:
+    from src.DomainRelevance import DomainRelevance
+    from src.CandidateTable import CandidateTable
+except ModuleNotFoundError:
+    from DomainRelevance import DomainRelevance
+    from CandidateTable import CandidateTable
+
+
+class DomainRelevanceTest(unittest.TestCase):
+    """A class for DomainRelevance units testing."""
+
+    def test_cond_probability(self):
+        """Test that an actual result corresponds the expected one."""
+        candidates_total = {('language', 'processing'): 2,
+                            ('linguistics', 'provides'): 1,
+                            ('automatic', 'language'): 1}
+        candidates = [('language', 'processing'), ('linguistics', 'provides'),
+                      ('automatic', 'language'), ('language', 'processing')]
+
+        res = DomainRelevance().cond_probability(candidates, candidates_total)
+
+        expected_res = {('language', 'processing'): 0.5,
+                        ('linguistics', 'provides'): 0.25,
+                        ('automatic', 'language'): 0.25}
+        self.assertEqual(res, expected_res,
+                         "doesn't correspond the expected result.")
+        print("Conditional probability testing is successfully executed!")
+
+    def test_relevance(self):
+        """Test that DR scores are not greater than 1."""
+        reference_tprob = {('machine', 'learning'): 0.5,
+                           ('automatic', 'langugage'): 0.25,
+                           ('data', 'output'): 0.75,
+                           ('outcome', 'analyses'): 0.14,
+                           ('climate', 'catastrophy'): 0.29,
+                           ('big', 'question'): 0.345,
+                           ('predicts', 'outcome'): 0.14}
+
+        candidates = [('language', 'processing'), ('linguistics', 'provides'),
+                      ('automatic', 'language'), ('language', 'processing')]
+
+        domain_tprob = {('language', 'processing'): 0.5,
+                        ('linguistics', 'provides'): 0.25,
+                        ('automatic', 'language'): 0.25}
+
+        res = DomainRelevance().relevance(domain_tprob, reference_tprob,
+                                          candidates)
+        for score in res.values():
+            self.assertLessEqual(score, 1, "DR scores must be <= 1")
+        print("Domain Relevance testing is successfully executed!")
+
+    def test_relevance_scores(self):
+        """Test the batch Domain Relevance and the reference mask."""
+        res = DomainRelevance().relevance_scores(np.array([2, 1, 1]),
+                                                 np.array([1, 0, 3]), 4, 4)
+        self.assertEqual(res.tolist(), [2 / 3, 1.0, 0.25],
+                         "incorrect Domain Relevance.")
+        print("Relevance scores testing is successfully executed!")
+
+    def test_table_relevance(self):
+        """Test that a table gives the same scores as relevance()."""
+        candidates_total = {('language', 'processing'): 2,
+                            ('linguistics', 'provides'): 1,
+                            ('automatic', 'language'): 1}
+        reference_freq = {('language', 'processing'): 1,
+                          ('big', 'question'): 3}
+        table = CandidateTable()
+        table.add_document(candidates_total)
+
+        domain_tprob = DomainRelevance().cond_probability(
+            candidates_total.keys(), candidates_total)
+        reference_tprob = DomainRelevance().cond_probability(
+            reference_freq.keys(), reference_freq)
+        expected = DomainRelevance().relevance(domain_tprob, reference_tprob,
+                                               candidates_total.keys())
+
+        DomainRelevance().table_relevance(table, reference_freq, 4)
+        self.assertEqual(table.to_dict('relevance'), expected,
+                         "table relevance differs from relevance().")
+        print("Table relevance testing is successfully executed!")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Datum: 17.10.2026
+# Mac OS
+"""
+Zweck: die Klasse FrozenModel zu testen.
+
+Autorin: Daryna Ivanova
+"""
+
+import os
+import tempfile
+import unittest
+
+try:
+    from src.FrozenModel import FrozenModel
+    from src.CandidateTable import CandidateTable
+    from src.DomainRelevance import DomainRelevance
+except ModuleNotFoundError:
+    from FrozenModel import FrozenModel
+    from CandidateTable import CandidateTable
+    from DomainRelevance import DomainRelevance
+
+
+class FrozenModelTest(unittest.TestCase):
+    """A class for FrozenModel units testing."""
+
+    reference_freq = {('machine', 'learning'): 3, ('big', 'question'): 5,
+                      ('new', 'idea'): 2}
+
+    candidates_per_doc = [
+        {('machine', 'learning'): 1, ('learning', 'data'): 2},
+        {('machine', 'learning'): 2, ('data', 'outcome'): 1}]
+
+    def scores(self, docs: list) -> dict:
+        """Relevance and consensus of a corpus, computed from scratch."""
+        try:
+            from src.DomainConsensus import DomainConsensus
+        except ModuleNotFoundError:
+            from DomainConsensus import DomainConsensus
+
+        table = CandidateTable()
+        for doc in docs:
+            table.add_document(doc)
+        DomainRelevance().table_relevance(table, self.reference_freq, 10)
+        DomainConsensus().table_consensus(table)
+
+        relevance = table.to_dict('relevance')
+        consensus = table.to_dict('consensus')
+
+        return table, {bigram: (relevance[bigram], consensus[bigram])
+                       for bigram in relevance}
+
+    def test_document_scores(self):
+        """Test that a document is scored as if it was added."""
+        table = self.scores(self.candidates_per_doc)[0]
+        new_doc = {('machine', 'learning'): 2, ('new', 'idea'): 1,
+                   ('unknown', 'words'): 3}
+        expected = self.scores(self.candidates_per_doc + [new_doc])[1]
+
+        with tempfile.TemporaryDirectory() as tmp:
+            model = FrozenModel(os.path.join(tmp, 'model.npz'))
+            model.export(table, self.reference_freq, 10)
+            result = model.document_scores(new_doc)
+
+        for bigram in new_doc:
+            self.assertAlmostEqual(result[bigram][0], expected[bigram][0])
+            self.assertAlmostEqual(result[bigram][1], expected[bigram][1])
+        print("Frozen model testing is successfully executed!")
+
+
+if __name__ == "__main__":
+    unittest.main()
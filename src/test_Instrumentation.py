@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Datum: 17.10.2026
+# Mac OS
+"""
+Zweck: die Klasse Instrumentation zu testen.
+
+Autorin: Daryna Ivanova
+"""
+
+import os
+import json
+import tempfile
+import unittest
+import tracemalloc
+
+try:
+    from src.Instrumentation import Instrumentation
+except ModuleNotFoundError:
+    from Instrumentation import Instrumentation
+
+
+class InstrumentationTest(unittest.TestCase):
+    """A class for Instrumentation units testing."""
+
+    def test_stage(self):
+        """Test that a stage is measured."""
+        instrumentation = Instrumentation(trace_memory=True)
+        with instrumentation.stage('allocate'):
+            data = [str(number) for number in range(10000)]
+
+        record = instrumentation.stages[0]
+        self.assertEqual(record['stage'], 'allocate')
+        self.assertGreaterEqual(record['wall_seconds'], 0)
+        self.assertGreater(record['traced_peak_bytes'], 0,
+                           "allocations were not traced.")
+        self.assertNotIn('traced_blocks', record)
+        if record['process_peak_rss_bytes'] is not None:
+            self.assertGreaterEqual(record['peak_rss_increase_bytes'], 0)
+        tracemalloc.stop()
+        del data
+        print("Stage measurement testing is successfully executed!")
+
+    def test_write(self):
+        """Test that the report is written with counters and a profile."""
+        with tempfile.TemporaryDirectory() as tmp:
+            profile_file = os.path.join(tmp, 'stage.prof')
+            report_file = os.path.join(tmp, 'report.json')
+
+            instrumentation = Instrumentation(profile_stage='sort',
+                                              profile_file=profile_file)
+            with instrumentation.stage('sort'):
+                sorted(range(1000), reverse=True)
+            instrumentation.count('documents', 2)
+            instrumentation.write(report_file, corpus='test_folder')
+
+            with open(report_file, 'r', encoding='utf-8') as f:
+                report = json.load(f)
+
+            self.assertEqual(report['counters'], {'documents': 2})
+            self.assertEqual(report['corpus'], 'test_folder')
+            self.assertEqual([stage['stage'] for stage in report['stages']],
+                             ['sort'])
+            self.assertTrue(os.path.isfile(profile_file),
+                            "profile was not written.")
+        print("Report testing is successfully executed!")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Datum: 17.10.2026
+# Mac OS
+"""
+Zweck: die Klasse NearDuplicates zu testen.
+
+Autorin: Daryna Ivanova
+"""
+
+import unittest
+import numpy as np
+
+try:
+    from src.NearDuplicates import NearDuplicates
+except ModuleNotFoundError:
+    from NearDuplicates import NearDuplicates
+
+
+class NearDuplicatesTest(unittest.TestCase):
+    """A class for NearDuplicates units testing."""
+
+    def texts(self) -> list:
+        """A text, a slightly changed copy and an unrelated text."""
+        generator = np.random.default_rng(1)
+        vocabulary = ['word' + str(number) for number in range(500)]
+
+        text = [vocabulary[i] for i in generator.integers(0, 500, 300)]
+        changed = list(text)
+        changed[150] = 'preprint'
+        other = [vocabulary[i] for i in generator.integers(0, 500, 300)]
+
+        return [(name, ' '.join(words).encode('utf-8')) for name, words in
+                (('paper.txt', text), ('other.txt', other),
+                 ('camera_ready.txt', changed))]
+
+    def test_keep(self):
+        """Test that only the later near-duplicate is skipped."""
+        near_duplicates = NearDuplicates(threshold=0.8)
+
+        self.assertEqual(near_duplicates.keep(self.texts()),
+                         [True, True, False])
+        self.assertEqual(near_duplicates.duplicates,
+                         {'camera_ready.txt': 'paper.txt'})
+        print("Near-duplicate testing is successfully executed!")
+
+    def test_signature(self):
+        """Test that signatures estimate the Jaccard similarity."""
+        near_duplicates = NearDuplicates(num_perm=256, shingle_size=1)
+        first = near_duplicates.signature(b' '.join(
+            b'w' + str(number).encode() for number in range(0, 300)))
+        second = near_duplicates.signature(b' '.join(
+            b'w' + str(number).encode() for number in range(100, 400)))
+
+        # Jaccard similarity of the word sets is 200 / 400
+        self.assertAlmostEqual(np.mean(first == second), 0.5, delta=0.1)
+        print("Signature testing is successfully executed!")
+
+
+if __name__ == "__main__":
+    unittest.main()
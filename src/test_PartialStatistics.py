@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Datum: 17.10.2026
+# Mac OS
+"""
+Zweck: die Klasse PartialStatistics zu testen.
+
+Autorin: Daryna Ivanova
+"""
+
+import os
+import tempfile
+import unittest
+
+try:
+    from src.PartialStatistics import PartialStatistics
+    from src.CandidateTable import CandidateTable
+except ModuleNotFoundError:
+    from PartialStatistics import PartialStatistics
+    from CandidateTable import CandidateTable
+
+
+class PartialStatisticsTest(unittest.TestCase):
+    """A class for PartialStatistics units testing."""
+
+    candidates_per_doc = [
+        {('machine', 'learning'): 1, ('learning', 'data'): 2},
+        {('machine', 'learning'): 2, ('data', 'outcome'): 1},
+        {('language', 'processing'): 3},
+        {('data', 'outcome'): 4, ('machine', 'learning'): 1},
+        {('learning', 'data'): 1}]
+
+    def partial_files(self, tmp: str, count: int, keep_documents: bool,
+                      listings: list = None) -> list:
+        """Write the shards of the documents as partial files."""
+        partial_files = []
+
+        for index in range(count):
+            table = CandidateTable(keep_documents=keep_documents)
+            for doc in self.candidates_per_doc[index::count]:
+                table.add_document(doc)
+
+            partial_file = os.path.join(tmp, 'part' + str(index) + '.npz')
+            PartialStatistics(partial_file).write(
+                table, (index, count),
+                listing=listings[index] if listings else None)
+            partial_files.append(partial_file)
+
+        return partial_files
+
+    def test_merge(self):
+        """Test that merged shards give the table of a single run."""
+        table = CandidateTable()
+        for doc in self.candidates_per_doc:
+            table.add_document(doc)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            merged = PartialStatistics.merge(self.partial_files(tmp, 2, True))
+            self.assertEqual(merged.keys(), table.keys())
+            for expected, result in zip(table.document_matrix(),
+                                        merged.document_matrix()):
+                self.assertTrue((expected == result).all())
+
+            merged = PartialStatistics.merge(self.partial_files(tmp, 3,
+                                                                False))
+            self.assertEqual(merged.to_dict('counts'),
+                             table.to_dict('counts'))
+            self.assertEqual(merged.n_docs, table.n_docs)
+
+            self.assertRaises(ValueError, PartialStatistics.merge,
+                              self.partial_files(tmp, 3, True)[:2])
+        print("Merge testing is successfully executed!")
+
+    def test_merge_listings(self):
+        """Test that shards of different listings are not merged."""
+        listing = ['a.txt', 'b.txt', 'c.txt', 'd.txt', 'e.txt']
+        other = ['a.txt', 'b.txt', 'c.txt', 'd.txt', 'f.txt']
+
+        with tempfile.TemporaryDirectory() as tmp:
+            merged = PartialStatistics.merge(
+                self.partial_files(tmp, 2, True, [listing, listing]))
+            self.assertEqual(merged.n_docs, 5)
+
+            self.assertRaises(ValueError, PartialStatistics.merge,
+                              self.partial_files(tmp, 2, True,
+                                                 [listing, other]))
+
+            # a near-duplicate, which was skipped, is still covered
+            table = CandidateTable()
+            table.add_document(self.candidates_per_doc[0])
+            self.assertRaises(ValueError, PartialStatistics(
+                tmp + '/part.npz').write, table, (0, 2), listing=listing)
+            PartialStatistics(tmp + '/part.npz').write(
+                table, (0, 2), listing=listing, skipped={'c.txt', 'e.txt'})
+        print("Merge listings testing is successfully executed!")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Datum: 17.10.2026
+# Mac OS
+"""
+Zweck: die Klasse ReferenceCache zu testen.
+
+Autorin: Daryna Ivanova
+"""
+
+import tempfile
+import unittest
+
+try:
+    from src.ReferenceCache import ReferenceCache
+except ModuleNotFoundError:
+    from ReferenceCache import ReferenceCache
+
+
+class ReferenceCacheTest(unittest.TestCase):
+    """A class for ReferenceCache units testing."""
+
+    def test_store_and_load(self):
+        """Test that stored frequencies are loaded unchanged."""
+        reference_freq = {('machine', 'learning'): 3,
+                          ('data', 'outcome'): 1,
+                          ('big', 'question'): 2}
+
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = ReferenceCache(tmp)
+            key = cache.cache_key('stopwords', 0)
+            self.assertIsNone(cache.load(key), "cache should be empty.")
+
+            cache.store(key, reference_freq)
+            self.assertEqual(cache.load(key), (reference_freq, 6),
+                             "cached frequencies do not match.")
+        print("Reference cache testing is successfully executed!")
+
+    def test_load_candidates(self):
+        """Test that only candidates are loaded, but the whole total."""
+        reference_freq = {('machine', 'learning'): 3,
+                          ('data', 'outcome'): 1,
+                          ('big', 'question'): 2}
+
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = ReferenceCache(tmp)
+            key = cache.cache_key('stopwords', 0)
+            cache.store(key, reference_freq)
+
+            self.assertEqual(cache.load(key, {('big', 'question'),
+                                              ('new', 'idea')}),
+                             ({('big', 'question'): 2}, 6),
+                             "frequencies are not projected.")
+        print("Candidate projection testing is successfully executed!")
+
+    def test_cache_key(self):
+        """Test that a key changes with its parts."""
+        cache = ReferenceCache()
+        self.assertEqual(cache.cache_key('a', 0), cache.cache_key('a', 0),
+                         "equal parts should give equal keys.")
+        self.assertNotEqual(cache.cache_key('a', 0), cache.cache_key('a', 3),
+                            "different parts should give different keys.")
+        print("Cache key testing is successfully executed!")
+
+
+if __name__ == "__main__":
+    unittest.main()
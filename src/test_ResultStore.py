@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Datum: 17.10.2026
+# Mac OS
+"""
+Zweck: die Klasse ResultStore zu testen.
+
+Autorin: Daryna Ivanova
+"""
+
+import os
+import tempfile
+import unittest
+import numpy as np
+
+try:
+    from src.ResultStore import ResultStore
+    from src.CandidateTable import CandidateTable
+    from src.TermDecision import TermDecision
+except ModuleNotFoundError:
+    from ResultStore import ResultStore
+    from CandidateTable import CandidateTable
+    from TermDecision import TermDecision
+
+
+class ResultStoreTest(unittest.TestCase):
+    """A class for ResultStore units testing."""
+
+    def table(self) -> CandidateTable:
+        """A table with Domain Relevance and Domain Consensus."""
+        table = CandidateTable()
+        table.add_document({('a', 'b'): 1, ('a', 'c'): 1, ('a', 'a'): 1,
+                            ('b', 'c'): 1})
+        table.columns['relevance'] = np.array([1.0, 0.25, 0.5, 0.9])
+        table.columns['consensus'] = np.array([0.5, 0.01, 0.1, 0.0])
+
+        return table
+
+    def test_terms(self):
+        """Test that every combination gives the terms of its decision."""
+        table = self.table()
+        alphas = [0.3, 0.6]
+        thetas = [0.3, 0.5, 2.0]
+
+        with tempfile.TemporaryDirectory() as tmp:
+            store = ResultStore(os.path.join(tmp, 'results.npz'))
+            store.write(table, alphas, thetas)
+
+            for alpha in alphas:
+                for theta in thetas + [0.4]:
+                    self.assertEqual(
+                        store.terms(alpha, theta),
+                        TermDecision().table_decision(table, alpha, theta),
+                        "stored terms differ from the decision.")
+
+            self.assertEqual(len(store.combinations()), 6)
+            self.assertRaises(ValueError, store.terms, 0.3, 0.1)
+        print("Result store testing is successfully executed!")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Datum: 17.10.2026
+# Mac OS
+"""
+Zweck: die Klasse TermDecision zu testen.
+
+Autorin: Daryna Ivanova
+"""
+
+import os
+import unittest
+import numpy as np
+
+try:
+    from src.TermDecision import TermDecision
+    from src.CandidateTable import CandidateTable
+except ModuleNotFoundError:
+    from TermDecision import TermDecision
+    from CandidateTable import CandidateTable
+
+
+class TermDecisionTest(unittest.TestCase):
+    """A class for TermDecision units testing."""
+
+    def test_decision_function(self):
+        """Test that the method returnes correct result."""
+        candidates = [('a', 'b'), ('a', 'c'), ('a', 'a'), ('a', 'b')]
+        relevance = {('a', 'b'): 1.0, ('a', 'c'): 0.25, ('a', 'a'): 0.5}
+        consensus = {('a', 'b'): 0.5, ('a', 'c'): 0.01, ('a', 'a'): 0.1}
+        alpha = 0.6
+        theta = 0.3
+        result = {('a', 'b'): 0.8, ('a', 'a'): 0.33999999999999997}
+
+        self.assertEqual(TermDecision().decision_function(candidates,
+                                                          relevance, consensus,
+                                                          alpha, theta),
+                         result, "result is not correct.")
+        print("Decision function testing is successfully executed!")
+
+    def test_table_decision(self):
+        """Test that a table gives the same terms as decision_function."""
+        table = CandidateTable()
+        table.add_document({('a', 'b'): 1, ('a', 'c'): 1, ('a', 'a'): 1})
+        table.columns['relevance'] = np.array([1.0, 0.25, 0.5])
+        table.columns['consensus'] = np.array([0.5, 0.01, 0.1])
+
+        self.assertEqual(TermDecision().table_decision(table, 0.6, 0.3),
+                         {('a', 'b'): 0.8, ('a', 'a'): 0.33999999999999997},
+                         "result is not correct.")
+        print("Table decision testing is successfully executed!")
+
+    def test_top_terms(self):
+        """Test that the k best terms are the beginning of the ranking."""
+        candidates = [('a', 'b'), ('a', 'c'), ('a', 'a'), ('a', 'b'),
+                      ('b', 'c')]
+        relevance = {('a', 'b'): 1.0, ('a', 'c'): 0.25, ('a', 'a'): 0.5,
+                     ('b', 'c'): 0.9}
+        consensus = {('a', 'b'): 0.5, ('a', 'c'): 0.01, ('a', 'a'): 0.1,
+                     ('b', 'c'): 0.0}
+
+        table = CandidateTable()
+        table.add_document(dict.fromkeys(candidates, 1))
+        table.columns['relevance'] = np.array(list(relevance.values()))
+        table.columns['consensus'] = np.array(list(consensus.values()))
+
+        for alpha in (0.0, 0.6):
+            ranking = TermDecision().table_ranking(table, alpha)
+            for k in range(6):
+                expected = ranking[:k]
+                self.assertEqual(TermDecision().top_terms(
+                    candidates, relevance, consensus, alpha, k), expected)
+                self.assertEqual(TermDecision().table_top_terms(
+                    table, alpha, k), expected)
+                self.assertEqual(TermDecision().table_top_terms(
+                    table, alpha, k, chunk_size=2), expected)
+
+        # many equal scores across chunks keep the order of the ranking
+        table = CandidateTable()
+        table.add_document({(str(i), 'x'): 1 for i in range(50)})
+        generator = np.random.default_rng(0)
+        table.columns['relevance'] = generator.integers(0, 4, 50) / 4
+        table.columns['consensus'] = np.zeros(50)
+        ranking = TermDecision().table_ranking(table, 0.5)
+        self.assertEqual(TermDecision().table_top_terms(table, 0.5, 20,
+                                                        chunk_size=7),
+                         ranking[:20])
+
+        self.assertEqual(TermDecision().top_terms(candidates, relevance,
+                                                  consensus, 0.6, 3, 0.5),
+                         [(('a', 'b'), 0.8), (('b', 'c'), 0.54)])
+        print("Top terms testing is successfully executed!")
+
+    def test_decision_grid(self):
+        """Test that the grid matches one decision per combination."""
+        relevance = np.array([1.0, 0.25, 0.5, 0.9])
+        consensus = np.array([0.5, 0.01, 0.1, 0.0])
+        gold_mask = np.array([True, False, False, True])
+        alphas = [0.3, 0.6]
+        thetas = [0.0, 0.3, 0.5, 2.0]
+
+        precision, recall, n_terms = TermDecision().decision_grid(
+            relevance, consensus, alphas, thetas, gold_mask, 3)
+
+        for row, alpha in enumerate(alphas):
+            for column, theta in enumerate(thetas):
+                scores = alpha * relevance + (1 - alpha) * consensus
+                terms = scores > theta
+                retrieved_relevant = int((terms & gold_mask).sum())
+                self.assertEqual(n_terms[row, column], terms.sum())
+                self.assertEqual(recall[row, column], retrieved_relevant / 3)
+                if terms.sum():
+                    self.assertEqual(precision[row, column],
+                                     retrieved_relevant / terms.sum())
+                else:
+                    self.assertEqual(precision[row, column], 0.0)
+        print("Decision grid testing is successfully executed!")
+
+    def test_outputter(self):
+        """Test  that outputter() method creates a file."""
+        alpha = 0.6
+        theta = 0.3
+        final_terms = {('a', 'b'): 0.8, ('a', 'a'): 0.33999999999999997}
+        TermDecision().outputter(alpha, theta, final_terms)
+
+        outputter_result = os.getcwd() + "/Output/result_0.6_0.3.txt"
+        self.assertTrue(os.path.isfile(outputter_result),
+                        "no such file was found.")
+        print("Output functionn testing is successfully executed!")
+
+
+if __name__ == "__main__":
+    unittest.main()
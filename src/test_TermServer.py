@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Datum: 17.10.2026
+# Mac OS
+"""
+Zweck: die Klasse TermServer zu testen.
+
+Autorin: Daryna Ivanova
+"""
+
+import os
+import json
+import tempfile
+import unittest
+
+try:
+    from src.TermServer import TermServer
+    from src.CorpusState import CorpusState
+except ModuleNotFoundError:
+    from TermServer import TermServer
+    from CorpusState import CorpusState
+
+
+class TermServerTest(unittest.TestCase):
+    """A class for TermServer units testing."""
+
+    def server(self) -> TermServer:
+        """A server with two documents."""
+        state = CorpusState({('machine', 'learning'): 3}, 8)
+        state.add_counts('a.txt', {('machine', 'learning'): 1,
+                                   ('learning', 'data'): 2})
+        state.add_counts('b.txt', {('machine', 'learning'): 2})
+
+        return TermServer(state, {('machine', 'learning')})
+
+    def test_score_and_sweep(self):
+        """Test that scores and sweeps match the table."""
+        server = self.server()
+        table = server.state.table
+
+        answer = server.handle('/score', {
+            'candidates': [['machine', 'learning'], ['big', 'question']],
+            'alpha': 0.5})
+        candidate_id = table.index(('machine', 'learning'))
+        self.assertEqual(answer['scores'][0]['consensus'],
+                         table.columns['consensus'][candidate_id])
+        self.assertIsNone(answer['scores'][1], "unknown candidate scored.")
+
+        answer = server.handle('/sweep', {'alphas': [0.5],
+                                          'thetas': [-1.0]})
+        self.assertEqual(answer['n_terms'], [[2]])
+        self.assertEqual(answer['recall'], [[1.0]])
+        self.assertRaises(KeyError, server.handle, '/unknown', {})
+        self.assertRaises(ValueError, server.handle, '/ingest',
+                          {'texts': ['machine learning'], 'names': []})
+        self.assertRaises(ValueError, server.handle, '/ingest',
+                          {'corpus': os.path.dirname(os.getcwd())})
+        self.assertEqual(len(server.state.documents), 2)
+        print("Score and sweep testing is successfully executed!")
+
+    def test_http(self):
+        """Test that a request is answered over a Unix socket."""
+        import threading
+        import http.client
+        import socket
+
+        server = self.server()
+
+        with tempfile.TemporaryDirectory() as tmp:
+            address = os.path.join(tmp, 'terms.sock')
+            http_server = server.http_server(address)
+            local_server = server.http_server('0')
+            self.assertEqual(local_server.server_address[0], '127.0.0.1')
+            local_server.server_close()
+            thread = threading.Thread(target=http_server.serve_forever)
+            thread.start()
+
+            def request(method: str, path: str, body: dict = None):
+                connection = http.client.HTTPConnection('localhost')
+                connection.sock = socket.socket(socket.AF_UNIX,
+                                                socket.SOCK_STREAM)
+                connection.sock.connect(address)
+                connection.request(method, path, body and json.dumps(body))
+                response = connection.getresponse()
+                answer = response.status, json.loads(response.read())
+                connection.close()
+                return answer
+
+            answer = request('GET', '/status')[1]
+            error = request('POST', '/ingest', {'corpus': 'missing_dir'})
+
+            http_server.shutdown()
+            http_server.server_close()
+            thread.join()
+
+        self.assertEqual(answer, {'texts': 2, 'candidates': 2})
+        self.assertEqual(error, (400, {'error': 'corpus not found: '
+                                                'missing_dir'}))
+        print("HTTP testing is successfully executed!")
+
+
+if __name__ == "__main__":
+    unittest.main()
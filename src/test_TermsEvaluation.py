@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Datum: 17.10.2026
+# Mac OS
+"""
+Zweck: die Klasse TermsEvaluation zu testen.
+
+Autorin: Daryna Ivanova
+"""
+
+import unittest
+
+try:
+    from src.TermsEvaluation import TermsEvaluation
+except ModuleNotFoundError:
+    from TermsEvaluation import TermsEvaluation
+
+
+class TermsEvaluationTest(unittest.TestCase):
+    """A class for TermsEvaluation units testing."""
+
+    def test_gold_terminology(self):
+        """Test gold_termiology(goldstandard_file: str) method."""
+        path_to_file = "toy_goldstandard.txt"
+        self.assertEqual(TermsEvaluation().gold_terminology(path_to_file),
+                         [('computational', 'linguistics'),
+                          ('language', 'processing'),
+                          ('automatic', 'processing'),
+                          ('data', 'driven'),
+                          ('machine', 'learning'),
+                          ('applied', 'linguistics'),
+                          ('data', 'mining')], "incorrect data extraction!")
+        print("Gold terminology convertation test is successfully executed!")
+
+    def test_precision_and_recall(self):
+        """Test that precision and recall return correct results."""
+        final_terms = {('machine', 'learning'): 0.8, ('data', 'mining'): 0.75}
+        gold_terms = [('computational', 'linguistics'),
+                      ('language', 'processing'),
+                      ('automatic', 'processing'),
+                      ('data', 'driven'),
+                      ('machine', 'learning'),
+                      ('applied', 'linguistics'),
+                      ('data', 'mining')]
+        self.assertTupleEqual(TermsEvaluation().precision_and_recall(
+            final_terms, gold_terms), (1.0, 0.2857142857142857),
+            "incorrect result.")
+        print("Precision and recall test is successfully executed!")
+
+    def test_precision_and_recall_no_terms(self):
+        """Test that no retrieved terms give precision 0."""
+        gold_terms = frozenset([('machine', 'learning')])
+        self.assertTupleEqual(TermsEvaluation().precision_and_recall(
+            {}, gold_terms), (0.0, 0.0), "incorrect result.")
+        print("Precision without terms test is successfully executed!")
+
+    def test_precision_recall_curve(self):
+        """Test the curve, average precision and the best cutoff."""
+        gold_index = frozenset([('machine', 'learning'), ('data', 'mining'),
+                                ('language', 'processing')])
+        ranked_terms = [(('machine', 'learning'), 0.9),
+                        (('big', 'question'), 0.8),
+                        (('data', 'mining'), 0.7),
+                        (('data', 'outcome'), 0.6)]
+        precisions, recalls, average_precision, best_cutoff = \
+            TermsEvaluation().precision_recall_curve(ranked_terms, gold_index)
+
+        self.assertEqual(precisions, [1.0, 0.5, 2 / 3, 0.5])
+        self.assertEqual(recalls, [1 / 3, 1 / 3, 2 / 3, 2 / 3])
+        self.assertAlmostEqual(average_precision, (1.0 + 2 / 3) / 3)
+        self.assertEqual(best_cutoff[0], 3, "incorrect best cutoff.")
+        print("Precision/recall curve test is successfully executed!")
+
+
+if __name__ == "__main__":
+    unittest.main()
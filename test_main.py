@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Datum: 17.10.2026
+# Mac OS
+"""
+Zweck: die Programmausführung zu testen.
+
+Autorin: Daryna Ivanova
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+
+from unittest import mock
+
+import main
+
+
+class MainTest(unittest.TestCase):
+    """A class for testing the program execution."""
+
+    def test_state_run(self):
+        """Test that a run with --state reaches the end."""
+        from src.CorpusState import CorpusState
+
+        state = CorpusState({('machine', 'learning'): 1}, 10)
+        state.add_counts('a.txt', {('machine', 'learning'): 4,
+                                   ('data', 'outcome'): 3})
+        state.add_counts('b.txt', {('machine', 'learning'): 2})
+
+        cwd = os.getcwd()
+        with tempfile.TemporaryDirectory() as tmp:
+            os.chdir(tmp)
+            try:
+                with open('gold.txt', 'w') as f:
+                    f.write('machine learning\n')
+                argv = ['main.py', 'texts', '0.5', '0.1', 'gold.txt',
+                        '--state', 'state.pickle', '--no-document-cache',
+                        '--resume', '--report', 'report.json']
+                with mock.patch.object(sys, 'argv', argv), \
+                        mock.patch.object(main, 'updated_state_table',
+                                          return_value=state.table):
+                    main.main()
+                self.assertTrue(os.path.isfile('report.json'),
+                                "the run did not finish.")
+            finally:
+                os.chdir(cwd)
+        print("State run testing is successfully executed!")
+
+
+if __name__ == "__main__":
+    unittest.main()
+    print("\n")
+    print("Program execution testing is done!")